@@ -0,0 +1,91 @@
+""" Benchmark generating FixedProbabilityConnector blocks over a sweep of\
+    connection probabilities.
+
+Times creating a block with the connector, which skips over the\
+connections not made, against a reference connector that draws a random\
+number for every possible connection as was done before.  Run from the\
+root of the repository with::
+
+    python -m benchmarks.fixed_probability_sampling
+"""
+import argparse
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FixedProbabilityConnector)
+from unittests.mocks import MockSimulator, MockPopulation, MockRNG
+from benchmarks.timing import best_time
+
+
+class _DenseFixedProbabilityConnector(FixedProbabilityConnector):
+    """ Draws a random number for every possible connection of a block
+    """
+    __slots__ = ()
+
+    def create_synaptic_block(
+            self, weights, delays, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            synapse_type):
+        n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
+        items = self._rng.next(n_items)
+        if not self._allow_self_connections:
+            items[0:n_items:post_vertex_slice.n_atoms + 1] = numpy.inf
+        ids = numpy.flatnonzero(items < self._p_connect)
+        n_connections = len(ids)
+
+        block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
+        block["source"] = (
+            (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
+        block["target"] = (
+            (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
+        block["weight"] = self._generate_weights(
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
+        block["delay"] = self._generate_delays(
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
+        block["synapse_type"] = synapse_type
+        return block
+
+
+def _make_connector(connector_type, p_connect, n_neurons):
+    connector = connector_type(p_connect, allow_self_connections=False)
+    rng = MockRNG()
+    rng.seed(42)
+    connector.set_projection_information(
+        MockPopulation(n_neurons, "pre"), MockPopulation(n_neurons, "post"),
+        rng, 1000)
+    return connector
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--n-neurons", type=int, default=5000)
+    parser.add_argument(
+        "--p-connect", type=float, nargs="+",
+        default=[0.0001, 0.001, 0.01, 0.1, 0.5])
+    args = parser.parse_args()
+
+    MockSimulator.setup()
+    block_slice = Slice(0, args.n_neurons - 1)
+    print("{0}x{0} block".format(args.n_neurons))
+    for p_connect in args.p_connect:
+        times = list()
+        for connector_type in (
+                FixedProbabilityConnector, _DenseFixedProbabilityConnector):
+            connector = _make_connector(
+                connector_type, p_connect, args.n_neurons)
+            times.append(best_time(lambda: connector.create_synaptic_block(
+                1.0, 1.0, [block_slice], 0, [block_slice], 0, block_slice,
+                block_slice, 0)))
+        n_connections = len(connector.create_synaptic_block(
+            1.0, 1.0, [block_slice], 0, [block_slice], 0, block_slice,
+            block_slice, 0))
+        print("p={}: {} connections, sampled {:.3f}s, dense {:.3f}s, "
+              "speedup {:.1f}x".format(
+                  p_connect, n_connections, times[0], times[1],
+                  times[1] / times[0]))
+
+
+if __name__ == "__main__":
+    main()
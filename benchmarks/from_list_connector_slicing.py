@@ -0,0 +1,80 @@
+""" Benchmark extracting the blocks of a large FromListConnector list.
+
+Times the extraction of every (pre slice, post slice) block, and the maximum\
+row length of every post slice, against a reference that scans the whole\
+list for each of them.  Run from the root of the repository with::
+
+    python -m benchmarks.from_list_connector_slicing
+"""
+import argparse
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FromListConnector)
+from benchmarks.timing import best_time
+
+
+def _make_slices(n_neurons, slice_size):
+    return [Slice(lo, min(lo + slice_size, n_neurons) - 1)
+            for lo in range(0, n_neurons, slice_size)]
+
+
+def _scan_block(conn_list, pre_slice, post_slice):
+    # What the connector did before it had an index: mask the whole list
+    mask = ((conn_list[:, 0] >= pre_slice.lo_atom) &
+            (conn_list[:, 0] <= pre_slice.hi_atom) &
+            (conn_list[:, 1] >= post_slice.lo_atom) &
+            (conn_list[:, 1] <= post_slice.hi_atom))
+    return conn_list[mask]
+
+
+def _scan_max_row(conn_list, post_slice):
+    mask = ((conn_list[:, 1] >= post_slice.lo_atom) &
+            (conn_list[:, 1] <= post_slice.hi_atom))
+    sources = conn_list[mask, 0].astype("int64")
+    return numpy.max(numpy.bincount(sources)) if sources.size else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--n-connections", type=int, default=1000000)
+    parser.add_argument("--n-neurons", type=int, default=20000)
+    parser.add_argument("--slice-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = numpy.random.RandomState(42)
+    conn_list = numpy.column_stack((
+        rng.randint(0, args.n_neurons, args.n_connections),
+        rng.randint(0, args.n_neurons, args.n_connections),
+        rng.uniform(0.0, 1.0, args.n_connections),
+        rng.randint(1, 16, args.n_connections))).astype("float64")
+    slices = _make_slices(args.n_neurons, args.slice_size)
+    print("{} connections, {} slices of {} neurons".format(
+        args.n_connections, len(slices), args.slice_size))
+
+    def indexed():
+        # A new connector each time, so building the index is included
+        connector = FromListConnector(conn_list)
+        for post_slice in slices:
+            connector.get_n_connections_from_pre_vertex_maximum(
+                None, post_slice)
+            for pre_slice in slices:
+                connector.create_synaptic_block(
+                    None, None, slices, 0, slices, 0, pre_slice, post_slice,
+                    0)
+
+    def scanned():
+        for post_slice in slices:
+            _scan_max_row(conn_list, post_slice)
+            for pre_slice in slices:
+                _scan_block(conn_list, pre_slice, post_slice)
+
+    indexed_time = best_time(indexed)
+    scanned_time = best_time(scanned)
+    print("indexed: {:.3f}s".format(indexed_time))
+    print("scanned: {:.3f}s".format(scanned_time))
+    print("speedup: {:.1f}x".format(scanned_time / indexed_time))
+
+
+if __name__ == "__main__":
+    main()
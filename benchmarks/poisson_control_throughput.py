@@ -0,0 +1,121 @@
+""" Benchmark sending Poisson rates to a local UDP sink.
+
+Times SpynnakerPoissonControlConnection.set_rates_array sending every\
+rate, and sending only the rates that changed when one in a hundred do,\
+against a reference that builds each message a (neuron id, rate) pair at a\
+time as set_rates used to.  Run from the root of the repository with::
+
+    python -m benchmarks.poisson_control_throughput
+"""
+import argparse
+import socket
+import threading
+from decimal import Decimal
+import numpy
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+from data_specification.enums import DataType
+from spynnaker.pyNN.connections import SpynnakerPoissonControlConnection
+from benchmarks.timing import best_time
+
+_MAX_RATES_PER_PACKET = 32
+_LABEL = "pop_control"
+
+
+class _Sink(object):
+    """ Counts the messages sent to a local UDP port
+    """
+
+    def __init__(self):
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.settimeout(0.1)
+        self.port = self._socket.getsockname()[1]
+        self.n_messages = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            try:
+                self._socket.recv(1024)
+                self.n_messages += 1
+            except socket.timeout:
+                pass
+
+    def close(self):
+        self._running = False
+        self._thread.join()
+        self._socket.close()
+
+
+def _make_connection(sink, n_neurons):
+    connection = SpynnakerPoissonControlConnection(
+        poisson_labels=["pop"], local_port=None)
+
+    # Set up the sending side as reading the database would
+    connection._sender_connection = UDPConnection(local_host="127.0.0.1")
+    connection._send_address_details[_LABEL] = ("127.0.0.1", sink.port)
+    connection._atom_id_to_key[_LABEL] = {
+        i: 0x10000 + i for i in range(n_neurons)}
+    return connection
+
+
+def _send_pairs(connection, sink, neuron_ids, rates):
+    """ Send the rates a pair at a time, as set_rates used to
+    """
+    id_to_key = connection._atom_id_to_key[_LABEL]
+    scale = DataType.S1615.scale  # @UndefinedVariable
+    pairs = list(zip(neuron_ids.tolist(), rates.tolist()))
+    for start in range(0, len(pairs), _MAX_RATES_PER_PACKET):
+        message = EIEIODataMessage.create(EIEIOType.KEY_PAYLOAD_32_BIT)
+        for neuron_id, rate in pairs[start:start + _MAX_RATES_PER_PACKET]:
+            message.add_key_and_payload(
+                id_to_key[neuron_id], int(round(Decimal(str(rate)) * scale)))
+        connection._sender_connection.send_to(
+            message.bytestring, ("127.0.0.1", sink.port))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--n-neurons", type=int, default=100000)
+    args = parser.parse_args()
+
+    sink = _Sink()
+    connection = _make_connection(sink, args.n_neurons)
+    try:
+        rng = numpy.random.RandomState(42)
+        neuron_ids = numpy.arange(args.n_neurons)
+        rates = rng.uniform(0.0, 50.0, args.n_neurons)
+        changed_rates = rates.copy()
+        changed_rates[::100] += 1.0
+        all_rates = [rates, changed_rates]
+
+        def changed():
+            # Each call changes one rate in a hundred from the last call
+            all_rates.reverse()
+            connection.set_rates_array(
+                "pop", neuron_ids, all_rates[0], skip_unchanged=True)
+
+        connection.set_rates_array("pop", neuron_ids, rates)
+        for name, function in (
+                ("pairs", lambda: _send_pairs(
+                    connection, sink, neuron_ids, rates)),
+                ("array", lambda: connection.set_rates_array(
+                    "pop", neuron_ids, rates)),
+                ("array, 1% changed", changed)):
+            taken = best_time(function)
+            print("{}: {:.3f}s, {:.0f} rates per second".format(
+                name, taken, args.n_neurons / taken))
+    finally:
+        connection.close()
+        sink.close()
+    print("{} messages received".format(sink.n_messages))
+
+
+if __name__ == "__main__":
+    main()
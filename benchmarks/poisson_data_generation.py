@@ -0,0 +1,109 @@
+""" Benchmark generating the data of a Poisson source population.
+
+Times creating the machine vertex sizes and writing the parameters of each\
+core of a population that grows with the number of cores, so the time per\
+core should stay the same.  A reference run forgets the rate statistics\
+before each core, as was done before they were kept on the vertex, so its\
+time per core grows with the population.  Run from the root of the\
+repository with::
+
+    python -m benchmarks.poisson_data_generation
+"""
+import argparse
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SpikeSourcePoissonVertex)
+from unittests.mocks import MockSimulator
+from benchmarks.timing import best_time
+
+_MACHINE_TIME_STEP = 1000
+_N_MACHINE_TIME_STEPS = 10000
+
+
+class _Spec(object):
+    """ A data specification writer that throws the data away
+    """
+
+    def comment(self, comment):
+        pass
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, data, data_type=None):
+        pass
+
+    def write_array(self, array_values, data_type=None):
+        pass
+
+
+class _Graph(object):
+    """ A graph with no edges
+    """
+
+    def get_edges_ending_at_vertex_with_partition_name(
+            self, vertex, partition_name):
+        return []
+
+
+class _RoutingInfo(object):
+    """ Routing information that gives every vertex the same key
+    """
+
+    def get_first_key_from_pre_vertex(self, vertex, partition_id):
+        return 0
+
+
+class _Placement(object):
+    def __init__(self, vertex):
+        self.vertex = vertex
+
+
+def _generate(vertex, slices, forget_stats):
+    vertex._n_subvertices = len(slices)
+    vertex._n_data_specs = 0
+    spec, graph, routing_info = _Spec(), _Graph(), _RoutingInfo()
+    for vertex_slice in slices:
+        if forget_stats:
+            vertex._rate_stats.clear()
+        vertex._max_spikes_per_ts(
+            vertex_slice, _N_MACHINE_TIME_STEPS, _MACHINE_TIME_STEP)
+        vertex._write_poisson_parameters(
+            spec, graph, _Placement(None), routing_info, vertex_slice,
+            _MACHINE_TIME_STEP, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--atoms-per-core", type=int, default=256)
+    parser.add_argument(
+        "--n-cores", type=int, nargs="+", default=[25, 50, 100])
+    args = parser.parse_args()
+
+    MockSimulator.setup()
+    rng = numpy.random.RandomState(42)
+    print("{} sources per core".format(args.atoms_per_core))
+    for n_cores in args.n_cores:
+        n_atoms = n_cores * args.atoms_per_core
+        slices = [Slice(lo, lo + args.atoms_per_core - 1)
+                  for lo in range(0, n_atoms, args.atoms_per_core)]
+        vertex = SpikeSourcePoissonVertex(
+            n_atoms, None, "benchmark", rng.uniform(1.0, 50.0, n_atoms), 0,
+            None, 1, args.atoms_per_core, None)
+
+        def kept():
+            # Only the first core computes the statistics
+            vertex._rate_stats.clear()
+            _generate(vertex, slices, False)
+
+        kept_time = best_time(kept)
+        forgotten_time = best_time(lambda: _generate(vertex, slices, True))
+        print("{} cores: kept {:.2f}ms per core, forgotten {:.2f}ms per "
+              "core".format(
+                  n_cores, kept_time * 1000.0 / n_cores,
+                  forgotten_time * 1000.0 / n_cores))
+
+
+if __name__ == "__main__":
+    main()
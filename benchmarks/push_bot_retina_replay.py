@@ -0,0 +1,152 @@
+""" Benchmark decoding a replay of PushBot retina data.
+
+Replays a synthetic stream of DVS events at a given rate, split into WiFi\
+packets with text responses between some events, through a\
+PushBotRetinaConnection with a fake WiFi connection.  The time taken to\
+decode the stream is compared with the time it covers, and with a\
+reference that strips each piece of text by rebuilding the whole array,\
+as was done before.  Run from the root of the repository with::
+
+    python -m benchmarks.push_bot_retina_replay
+"""
+import argparse
+import time
+import numpy
+from spynnaker.pyNN.external_devices_models.push_bot.push_bot_ethernet \
+    import PushBotRetinaConnection
+from spynnaker.pyNN.external_devices_models.push_bot.push_bot_parameters \
+    import PushBotRetinaResolution
+from benchmarks.timing import best_time
+
+_RETINA_PACKET_SIZE = 2
+
+
+class _FakeWiFiConnection(object):
+    """ A connection that never receives anything itself; the data is\
+        given to the retina connection directly
+    """
+
+    def is_ready_to_receive(self, timeout=0):
+        time.sleep(timeout)
+        return False
+
+    def get_receive_method(self):
+        return None
+
+
+class _CountingRetinaConnection(PushBotRetinaConnection):
+    """ A retina connection that counts the spikes instead of sending them
+    """
+
+    def __init__(self, resolution):
+        super(_CountingRetinaConnection, self).__init__(
+            "retina", _FakeWiFiConnection(), resolution, local_port=None)
+        self.n_spikes = 0
+
+    def send_spikes(self, label, neuron_ids, send_full_keys=False):
+        self.n_spikes += len(neuron_ids)
+
+
+class _RebuildingDecoder(object):
+    """ Strips each piece of text by rebuilding the whole array, as the\
+        retina connection used to
+    """
+
+    def __init__(self, resolution):
+        self._pixel_shift = 7 - resolution.value.bits_per_coordinate
+        self._x_shift = resolution.value.bits_per_coordinate
+        self._p_shift = resolution.value.bits_per_coordinate * 2
+        self._old_data = None
+        self.n_spikes = 0
+
+    def receive(self, data):
+        if self._old_data is not None:
+            data = self._old_data + data
+            self._old_data = None
+        data_all = numpy.frombuffer(data, numpy.uint8).astype(numpy.uint32)
+        ascii_index = numpy.where(data_all[::_RETINA_PACKET_SIZE] < 0x80)[0]
+        while ascii_index.size:
+            index = ascii_index[0] * _RETINA_PACKET_SIZE
+            stop_index = numpy.where(data_all[index:] >= 0x80)[0]
+            if stop_index.size:
+                stop_index = index + stop_index[0]
+            else:
+                stop_index = len(data)
+            data_all = numpy.hstack((data_all[:index], data_all[stop_index:]))
+            ascii_index = numpy.where(
+                data_all[::_RETINA_PACKET_SIZE] < 0x80)[0]
+        extra = data_all.size % _RETINA_PACKET_SIZE
+        if extra:
+            self._old_data = data[-extra:]
+            data_all = data_all[:-extra]
+        if data_all.size:
+            xs = (data_all[::_RETINA_PACKET_SIZE] & 0x7f) >> self._pixel_shift
+            ys = (data_all[1::_RETINA_PACKET_SIZE] & 0x7f) >> self._pixel_shift
+            polarity = data_all[1::_RETINA_PACKET_SIZE] >> 7
+            neuron_ids = (
+                (xs << self._x_shift) | ys | (polarity << self._p_shift))
+            self.n_spikes += len(neuron_ids)
+
+
+def _make_stream(rng, n_events, n_texts):
+    """ Make a stream of events, with text inserted between some of them
+    """
+    events = numpy.zeros((n_events, 2), dtype="uint8")
+    events[:, 0] = 0x80 | rng.randint(0, 128, n_events)
+    events[:, 1] = (rng.randint(0, 2, n_events) << 7) | rng.randint(
+        0, 128, n_events)
+    chunks = numpy.split(events.reshape(-1), numpy.sort(
+        rng.choice(n_events, n_texts, replace=False)) * 2)
+    texts = [b"?R%d\n" % i for i in range(n_texts)]
+    return chunks[0].tobytes() + b"".join(
+        text + chunk.tobytes() for text, chunk in zip(texts, chunks[1:]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--events-per-second", type=int, default=1000000)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument(
+        "--packet-sizes", type=int, nargs="+", default=[1400, 65536])
+    parser.add_argument(
+        "--texts-per-second", type=int, nargs="+", default=[0, 100, 10000])
+    args = parser.parse_args()
+
+    rng = numpy.random.RandomState(42)
+    resolution = PushBotRetinaResolution.NATIVE_128_X_128
+    n_events = int(args.events_per_second * args.seconds)
+    print("{} events over {}s".format(n_events, args.seconds))
+    connection = _CountingRetinaConnection(resolution)
+    try:
+        for texts_per_second in args.texts_per_second:
+            stream = _make_stream(
+                rng, n_events, int(texts_per_second * args.seconds))
+            for packet_size in args.packet_sizes:
+                packets = [
+                    stream[start:start + packet_size]
+                    for start in range(0, len(stream), packet_size)]
+
+                def decode():
+                    for packet in packets:
+                        connection._receive_retina_data(packet)
+
+                def rebuild():
+                    decoder = _RebuildingDecoder(resolution)
+                    for packet in packets:
+                        decoder.receive(packet)
+
+                decode_time = best_time(decode)
+                rebuild_time = best_time(rebuild)
+                print("{} texts per second in packets of {} bytes: decoded "
+                      "{:.3f}s ({:.1%} of real time), rebuilt {:.3f}s ({:.1%} "
+                      "of real time)".format(
+                          texts_per_second, packet_size, decode_time,
+                          decode_time / args.seconds, rebuild_time,
+                          rebuild_time / args.seconds))
+    finally:
+        connection._pushbot_listener.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+""" Benchmark packing synaptic rows for static and STDP synapse dynamics.
+
+Times SynapseIORowBased packing random connections into rows, against a\
+reference that joins each row from a list of small arrays as the packer\
+used to.  Both are given the same data from the synapse dynamics, and\
+their results are checked to be the same.  Run from the root of the\
+repository with::
+
+    python -m benchmarks.synaptic_row_packing
+"""
+import argparse
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic, SynapseDynamicsSTDP)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependenceSpikePair)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
+    WeightDependenceAdditive)
+from benchmarks.timing import best_time
+
+_N_SYNAPSE_TYPES = 2
+
+
+class _PopulationTable(object):
+    """ A population table that allows rows of any length
+    """
+
+    @staticmethod
+    def get_allowed_row_length(row_length):
+        return int(row_length)
+
+
+def _make_connections(n_connections, n_rows, post_slice, rng):
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.randint(0, n_rows, n_connections)
+    connections["target"] = rng.randint(
+        post_slice.lo_atom, post_slice.hi_atom + 1, n_connections)
+    connections["weight"] = rng.uniform(0, 1000, n_connections)
+    connections["delay"] = rng.randint(1, 16, n_connections)
+    connections["synapse_type"] = rng.randint(
+        0, _N_SYNAPSE_TYPES, n_connections)
+    return connections
+
+
+def _split(data, words):
+    return numpy.split(data, numpy.cumsum(words)[:-1])
+
+
+def _join_rows(connections, n_rows, post_slice, synapse_dynamics):
+    """ Pack the rows one at a time from lists of arrays, as was done\
+        before the rows were packed into a single array
+    """
+    ones = numpy.ones(1, dtype="uint32")
+    blank = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
+    blank_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+    row_indices = connections["source"]
+    if isinstance(synapse_dynamics, SynapseDynamicsStatic):
+        ff_data, ff_size, ff_words = \
+            synapse_dynamics.get_static_synaptic_data(
+                connections, row_indices, n_rows, post_slice,
+                _N_SYNAPSE_TYPES)
+        ff_data = _split(ff_data, ff_words)
+        ff_size = [ones * size for size in ff_size]
+        fp_data, pp_data, fp_size, pp_size = (
+            blank, blank, blank_size, blank_size)
+    else:
+        fp_data, pp_data, fp_size, pp_size, fp_words, pp_words = \
+            synapse_dynamics.get_plastic_synaptic_data(
+                connections, row_indices, n_rows, post_slice,
+                _N_SYNAPSE_TYPES)
+        fp_data = _split(fp_data, fp_words)
+        pp_data = _split(pp_data, pp_words)
+        fp_size = [ones * size for size in fp_size]
+        pp_size = [ones * size for size in pp_size]
+        ff_data, ff_size = blank, blank_size
+
+    row_lengths = [
+        pp_data[i].size + fp_data[i].size + ff_data[i].size
+        for i in range(n_rows)]
+    max_row_length = max(row_lengths)
+    padding = [
+        numpy.zeros(max_row_length - row_length, dtype="uint32")
+        for row_length in row_lengths]
+    rows = [numpy.concatenate(items) for items in zip(
+        pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding)]
+    return max_row_length, numpy.concatenate(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--n-rows", type=int, default=20000)
+    parser.add_argument("--synapses-per-row", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = numpy.random.RandomState(42)
+    post_slice = Slice(0, 255)
+    connections = _make_connections(
+        args.n_rows * args.synapses_per_row, args.n_rows, post_slice, rng)
+    print("{} rows of {} synapses on average".format(
+        args.n_rows, args.synapses_per_row))
+
+    for name, synapse_dynamics in (
+            ("static", SynapseDynamicsStatic()),
+            ("stdp", SynapseDynamicsSTDP(
+                TimingDependenceSpikePair(), WeightDependenceAdditive()))):
+
+        def packed():
+            return SynapseIORowBased._get_max_row_length_and_row_data(
+                connections, connections["source"], args.n_rows,
+                post_slice, _N_SYNAPSE_TYPES, _PopulationTable(),
+                synapse_dynamics, None, None)
+
+        def joined():
+            return _join_rows(
+                connections, args.n_rows, post_slice, synapse_dynamics)
+
+        packed_length, packed_data = packed()
+        joined_length, joined_data = joined()
+        if (packed_length != joined_length or
+                not numpy.array_equal(packed_data, joined_data)):
+            raise Exception("The {} rows differ".format(name))
+
+        packed_time = best_time(packed)
+        joined_time = best_time(joined)
+        print("{}: packed {:.3f}s, joined {:.3f}s, speedup {:.1f}x".format(
+            name, packed_time, joined_time, joined_time / packed_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import time
+
+
+def best_time(function, repeats=3):
+    """ Time a function, returning the fastest of several runs.
+
+    :param function: The function to call, with no arguments
+    :param repeats: The number of times to call the function
+    :return: The shortest time taken by a call, in seconds
+    :rtype: float
+    """
+    best = None
+    for _ in range(repeats):
+        start = time.time()
+        function()
+        taken = time.time() - start
+        if best is None or taken < best:
+            best = taken
+    return best
@@ -11,6 +11,9 @@ from spinn_front_end_common.utility_models import CommandSender
 from spinn_front_end_common.utilities.utility_objs import ExecutableFinder
 from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.utility_models import synapse_expander
+from spynnaker.pyNN.models.pynn_projection_common import PyNNProjectionCommon
+from spynnaker.pyNN.models.neural_projections.connectors.distance_cache \
+    import DistanceCache
 from spynnaker.pyNN import overridden_pacman_functions, model_binaries
 from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.spynnaker_simulator_interface import (
@@ -73,6 +76,9 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
 
         self._neurons_per_core_set = set()
 
+        # the number of times the simulation has been reset
+        self._n_resets = 0
+
         versions = [("sPyNNaker", version)]
         if front_end_versions is not None:
             versions.extend(front_end_versions)
@@ -291,6 +297,7 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
         super(AbstractSpiNNakerCommon, self).stop(
             turn_off_machine, clear_routing_tables, clear_tags)
         self.reset_number_of_neurons_per_core()
+        DistanceCache.clear_shared()
         globals_variables.unset_simulator()
 
     def run(self, run_time):
@@ -304,8 +311,29 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
         self._dsg_algorithm = "SpynnakerDataSpecificationWriter"
         for projection in self._projections:
             projection._clear_cache()
+
+        # The data of every core is loaded again after a reset, so the
+        # locations of the parameters found before may have moved
+        if self.has_reset_last:
+            for population in self._populations:
+                population._clear_parameter_cache()
         super(AbstractSpiNNakerCommon, self).run(run_time)
 
+    def reset(self):
+        """ Put the simulation back at time zero
+        """
+        self._n_resets += 1
+        super(AbstractSpiNNakerCommon, self).reset()
+
+    @property
+    def n_resets(self):
+        """ The number of times the simulation has been reset; the data\
+            recorded before a reset is not kept.
+
+        :rtype: int
+        """
+        return self._n_resets
+
     @property
     def time_scale_factor(self):
         """ The multiplicative scaling from application time to real\
@@ -378,14 +406,31 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
             data_receiver.set_cores_for_data_extraction(
                 self._txrx, list(extra_monitor_cores), self._placements)
 
-        # acquire the data
+        # acquire the data; the connections of projections that are on the
+        # machine are read together, so that the blocks on each core are read
+        # in as few reads as possible
+        projection_holders = list()
         for projection in projection_to_attribute_map:
+            if not projection._requires_reading_from_machine():
+                for attribute in projection_to_attribute_map[projection]:
+                    data = projection._get_synaptic_data(
+                        as_list=True, data_to_get=attribute,
+                        fixed_values=None, notify=None,
+                        handle_time_out_configuration=False)
+                    mother_lode.set(projection, attribute, data)
+                continue
+            holders = list()
             for attribute in projection_to_attribute_map[projection]:
-                data = projection._get_synaptic_data(
-                    as_list=True, data_to_get=attribute,
-                    fixed_values=None, notify=None,
-                    handle_time_out_configuration=False)
+                data = projection._get_connection_holder(
+                    as_list=True, data_to_get=attribute)
                 mother_lode.set(projection, attribute, data)
+                holders.append(data)
+            projection_holders.append((projection, holders))
+        if projection_holders:
+            PyNNProjectionCommon._get_projections_data(
+                self, projection_holders,
+                "Getting connections of {} projections".format(
+                    len(projection_holders)), False)
 
         # reset time outs for the receivers
         for data_receiver, extra_monitor_cores in receivers:
@@ -395,6 +440,26 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
         # return data items
         return mother_lode
 
+    def get_all_connections(self, projections, attributes):
+        """ Get the values of the given attributes of the connections of\
+            several projections at once.  This is much faster than getting\
+            the connections of each projection in turn once the simulation\
+            has run, as the connections ending at each core are read from\
+            the machine together.
+
+        :param projections: the projections to get the connections of
+        :type projections: iterable of projection
+        :param attributes: the attributes to get, as accepted by\
+            Projection.get
+        :type attributes: iterable of str
+        :return: a extracted data object with get method for getting the data
+        :rtype: \
+            :py:class:`spynnaker.pyNN.utilities.extracted_data.ExtractedData`
+        """
+        attributes = list(attributes)
+        return self.get_projections_data({
+            projection: attributes for projection in projections})
+
     def _locate_receivers_from_projections(
             self, projections, gatherers, extra_monitors_per_chip):
         """ Locate receivers and their corresponding monitor cores for\
@@ -1,18 +1,32 @@
+import numpy
 from spinn_utilities.overrides import overrides
 from spinnman.messages.eieio import EIEIOType
-from spinnman.messages.eieio.data_messages import EIEIODataMessage
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
 from data_specification.enums import DataType
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
-from decimal import Decimal
 
 _MAX_RATES_PER_PACKET = 32
 
+# The last payload sent of a neuron whose rate has not yet been sent
+_NOT_SENT = numpy.iinfo("int64").min
+
+# The range of payloads that can be sent, being rates in S1615 format
+_MIN_PAYLOAD = numpy.iinfo("int32").min
+_MAX_PAYLOAD = numpy.iinfo("int32").max
+
+# The key and payload of each rate, as they appear in a message
+_KEY_PAYLOAD_DTYPE = numpy.dtype([("key", "<u4"), ("payload", "<i4")])
+
 
 class SpynnakerPoissonControlConnection(LiveEventConnection):
     __slots__ = [
-        "_control_label_extension"]
+        "_control_label_extension",
+
+        # The keys of the neurons of each label, by neuron ID, along with the
+        # last payload sent to each neuron, and the map they were made from
+        "_rate_keys"]
 
     def __init__(
             self, poisson_labels=None, local_host=None, local_port=NOTIFY_PORT,
@@ -43,10 +57,19 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
             local_host=local_host, local_port=local_port)
 
         self._control_label_extension = control_label_extension
+        self._rate_keys = dict()
 
     def _control_label(self, label):
         return "{}{}".format(label, self._control_label_extension)
 
+    def _get_control_label(self, label):
+        """ Get the label of the control vertex of a Population, given\
+            either the label of the Population or of the control vertex
+        """
+        if label.endswith(self._control_label_extension):
+            return label
+        return self._control_label(label)
+
     @overrides(LiveEventConnection.add_start_callback)
     def add_start_callback(self, label, start_callback):
         super(SpynnakerPoissonControlConnection, self).add_start_callback(
@@ -69,10 +92,7 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
         :param neuron_id: The neuron ID to set the rate of
         :param rate: The rate to set in Hz
         """
-        control_label = label
-        if not control_label.endswith(self._control_label_extension):
-            control_label = self._control_label(label)
-        self.set_rates(control_label, [(neuron_id, rate)])
+        self.set_rates(label, [(neuron_id, rate)])
 
     def set_rates(self, label, neuron_id_rates):
         """ Set the rates of multiple Poisson neurons within a Poisson source
@@ -80,27 +100,119 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
         :param label: The label of the Population to set the rates of
         :param neuron_id_rates: A list of tuples of (neuron ID, rate) to be set
         """
-        control_label = label
-        if not control_label.endswith(self._control_label_extension):
-            control_label = self._control_label(label)
-        pos = 0
-        while pos < len(neuron_id_rates):
-            message, pos = self._assemble_message(
-                self._atom_id_to_key[control_label], neuron_id_rates, pos)
-            ip_address, port = self._send_address_details[control_label]
-            self._sender_connection.send_eieio_message_to(
-                message, ip_address, port)
+        if not len(neuron_id_rates):
+            return
+        neuron_ids, rates = zip(*neuron_id_rates)
+        self.set_rates_array(label, neuron_ids, rates)
+
+    def set_rates_array(self, label, neuron_ids, rates, skip_unchanged=False):
+        """ Set the rates of many Poisson neurons within a Poisson source at\
+            once.  The keys and payloads of all the rates are worked out\
+            together, and packed straight into the messages sent.
+
+        :param label: The label of the Population to set the rates of
+        :param neuron_ids: The IDs of the neurons to set the rates of
+        :type neuron_ids: numpy.ndarray(int)
+        :param rates: The rates to set in Hz, one for each neuron or one for\
+            all of them
+        :type rates: numpy.ndarray(float) or float
+        :param skip_unchanged: If True, rates that are the same as those last\
+            sent to the same neurons by this connection are not sent again.\
+            Only use this if the rates are changed in no other way, such as\
+            by setting them on the Population between runs, as otherwise a\
+            rate changed back to what was last sent here would not be sent.
+        :type skip_unchanged: bool
+        :raises ConfigurationException:\
+            If any rate can't be represented in S1615 format
+        """
+        control_label = self._get_control_label(label)
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64").reshape(-1)
+        rates = numpy.broadcast_to(
+            numpy.asarray(rates, dtype="float64"), neuron_ids.shape)
+        keys, last_sent = self._get_rate_keys(control_label)
+        scale = float(DataType.S1615.scale)  # @UndefinedVariable
+        payloads = numpy.round(rates * scale).astype("int64")
+        out_of_range = (payloads < _MIN_PAYLOAD) | (payloads > _MAX_PAYLOAD)
+        if out_of_range.any():
+            raise ConfigurationException(
+                "Rates must be between {} and {} Hz, but neurons {} were given"
+                " rates {}".format(
+                    DataType.S1615.min,  # @UndefinedVariable
+                    DataType.S1615.max,  # @UndefinedVariable
+                    list(neuron_ids[out_of_range]),
+                    list(rates[out_of_range])))
+        if skip_unchanged:
+            changed = last_sent[neuron_ids] != payloads
+            neuron_ids = neuron_ids[changed]
+            payloads = payloads[changed]
+        last_sent[neuron_ids] = payloads
+
+        ip_address, port = self._send_address_details[control_label]
+        for message in self._assemble_messages(keys[neuron_ids], payloads):
+            self._sender_connection.send_to(message, (ip_address, port))
+
+    def clear_sent_rates(self, label=None):
+        """ Forget the rates last sent, so that they will all be sent again\
+            even if they are unchanged, e.g. after the simulation is reset
+
+        :param label: The label of the Population to forget the rates of, or\
+            None to forget the rates of all Populations
+        """
+        if label is None:
+            self._rate_keys.clear()
+        else:
+            self._rate_keys.pop(self._get_control_label(label), None)
+
+    def _get_rate_keys(self, control_label):
+        """ Get the keys of the neurons of a control vertex by neuron ID,\
+            and the last payload sent to each, which can be updated.  These\
+            are remade whenever the keys are read from the database again.
+
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        atom_id_to_key = self._atom_id_to_key[control_label]
+        rate_keys = self._rate_keys.get(control_label)
+        if rate_keys is None or rate_keys[2] is not atom_id_to_key:
+            keys = numpy.zeros(max(atom_id_to_key) + 1, dtype="uint32")
+            keys[list(atom_id_to_key.keys())] = list(atom_id_to_key.values())
+            last_sent = numpy.full(len(keys), _NOT_SENT, dtype="int64")
+            rate_keys = (keys, last_sent, atom_id_to_key)
+            self._rate_keys[control_label] = rate_keys
+        return rate_keys[0], rate_keys[1]
 
     @staticmethod
-    def _assemble_message(id_to_key_map, neuron_id_rates, pos):
-        scale = DataType.S1615.scale  # @UndefinedVariable
-        message = EIEIODataMessage.create(EIEIOType.KEY_PAYLOAD_32_BIT)
-        for _ in range(_MAX_RATES_PER_PACKET):
-            neuron_id, rate = neuron_id_rates[pos]
-            key = id_to_key_map[neuron_id]
-            message.add_key_and_payload(
-                key, int(round(Decimal(str(rate)) * scale)))
-            pos += 1
-            if pos >= len(neuron_id_rates):
-                break
-        return message, pos
+    def _assemble_messages(keys, payloads):
+        """ Pack keys and payloads into as few messages as possible
+
+        :param keys: The key of each rate
+        :param payloads: The payload of each rate, in S1615 format
+        :return: The bytestring of each message
+        :rtype: list(bytes)
+        """
+        pairs = numpy.empty(len(keys), dtype=_KEY_PAYLOAD_DTYPE)
+        pairs["key"] = keys
+        pairs["payload"] = payloads
+
+        # Lay the full messages out one after another in a single buffer
+        n_full = len(pairs) // _MAX_RATES_PER_PACKET
+        header = EIEIODataHeader(
+            EIEIOType.KEY_PAYLOAD_32_BIT,
+            count=_MAX_RATES_PER_PACKET).bytestring
+        message_size = len(header) + (
+            _MAX_RATES_PER_PACKET * _KEY_PAYLOAD_DTYPE.itemsize)
+        data = numpy.empty((n_full, message_size), dtype="uint8")
+        data[:, :len(header)] = numpy.frombuffer(header, dtype="uint8")
+        data[:, len(header):] = pairs[
+            :n_full * _MAX_RATES_PER_PACKET].view("uint8").reshape(
+                n_full, message_size - len(header))
+        data = data.tobytes()
+        messages = [
+            data[start:start + message_size]
+            for start in range(0, len(data), message_size)]
+
+        remainder = pairs[n_full * _MAX_RATES_PER_PACKET:]
+        if len(remainder):
+            messages.append(EIEIODataHeader(
+                EIEIOType.KEY_PAYLOAD_32_BIT,
+                count=len(remainder)).bytestring + remainder.tobytes())
+        return messages
@@ -17,7 +17,7 @@ class PushBotLifEthernet(ExternalDeviceLifControl):
     @default_initial_values({"v", "isyn_exc", "isyn_inh"})
     def __init__(
             self, protocol, devices, pushbot_ip_address,
-            pushbot_port=56000,
+            pushbot_port=56000, coalesce_window=None,
 
             # default params for the neuron model type
             tau_m=20.0, cm=1.0, v_rest=0.0, v_reset=0.0, tau_syn_E=5.0,
@@ -27,7 +27,8 @@ class PushBotLifEthernet(ExternalDeviceLifControl):
 
         translator = PushBotTranslator(
             protocol,
-            get_pushbot_wifi_connection(pushbot_ip_address, pushbot_port))
+            get_pushbot_wifi_connection(pushbot_ip_address, pushbot_port),
+            coalesce_window)
 
         super(PushBotLifEthernet, self).__init__(
             devices, False, translator, tau_m, cm, v_rest, v_reset,
@@ -10,6 +10,9 @@ from spynnaker.pyNN.external_devices_models.push_bot.push_bot_parameters \
 logger = logging.getLogger(__name__)
 _RETINA_PACKET_SIZE = 2
 
+# The initial size of the buffer that the data is decoded in
+_INITIAL_BUFFER_SIZE = 4096
+
 
 class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
     """ A connection that sends spikes from the PushBot retina to a\
@@ -17,8 +20,9 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
         of 16-bits per retina event.
     """
     __slots__ = [
+        "_buffer",
+        "_carried_byte",
         "_lock",
-        "_old_data",
         "_p_shift",
         "_pixel_shift",
         "_pushbot_listener",
@@ -45,7 +49,8 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
 
         self._pushbot_listener.add_callback(self._receive_retina_data)
         self._pushbot_listener.start()
-        self._old_data = None
+        self._buffer = numpy.empty(_INITIAL_BUFFER_SIZE, dtype=numpy.uint8)
+        self._carried_byte = None
         self._lock = RLock()
 
     def _receive_retina_data(self, data):
@@ -55,45 +60,68 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
         :param data: Data to be processed
         """
         with self._lock:
-            # combine it with any leftover data from last time through the loop
-            if self._old_data is not None:
-                data = self._old_data + data
-                self._old_data = None
-
-            # Put the data in a numpy array
-            data_all = numpy.fromstring(data, numpy.uint8).astype(numpy.uint32)
-            ascii_index = numpy.where(
-                data_all[::_RETINA_PACKET_SIZE] < 0x80)[0]
-            offset = 0
-            while ascii_index.size:
-                index = ascii_index[0] * _RETINA_PACKET_SIZE
-                stop_index = numpy.where(data_all[index:] >= 0x80)[0]
-                if stop_index.size:
-                    stop_index = index + stop_index[0]
-                else:
-                    stop_index = len(data)
-
-                data_all = numpy.hstack(
-                    (data_all[:index], data_all[stop_index:]))
-                offset += stop_index - index
-                ascii_index = numpy.where(
-                    data_all[::_RETINA_PACKET_SIZE] < 0x80)[0]
-
-            extra = data_all.size % _RETINA_PACKET_SIZE
-            if extra:
-                self._old_data = data[-extra:]
-                data_all = data_all[:-extra]
-
-            if data_all.size:
+            events = self._decode_events(data)
+            if len(events):
                 # now process those retina events
-                xs = (data_all[::_RETINA_PACKET_SIZE] & 0x7f) \
+                xs = (events[:, 0] & 0x7f).astype(numpy.uint32) \
                     >> self._pixel_shift
-                ys = (data_all[1::_RETINA_PACKET_SIZE] & 0x7f) \
+                ys = (events[:, 1] & 0x7f).astype(numpy.uint32) \
                     >> self._pixel_shift
-                polarity = numpy.where(
-                    data_all[1::_RETINA_PACKET_SIZE] >= 0x80, 1, 0)
+                polarity = events[:, 1].astype(numpy.uint32) >> 7
                 neuron_ids = (
                     (xs << self._x_shift) |
                     (ys << self._y_shift) |
                     (polarity << self._p_shift))
                 self.send_spikes(self._retina_injector_label, neuron_ids)
+
+    def _decode_events(self, data):
+        """ Find the retina events in the data, removing any text sent by the\
+            PushBot between them.  An event is a byte with the top bit set\
+            followed by any byte, and text runs from a byte without the top\
+            bit set where an event is expected, up to the next byte with the\
+            top bit set.  So each run of bytes with the top bit set starts\
+            with an event, and the run of bytes after it without the top bit\
+            set only holds the end of an event if the run before it is of odd\
+            length.  This gives the bytes to keep in a single pass over the\
+            data.  The first byte of an event split between packets is kept\
+            until the next packet arrives.
+
+        :param data: The data received
+        :type data: bytes
+        :return: The two bytes of each event
+        :rtype: numpy.ndarray(dtype=uint8, shape=(n, 2))
+        """
+        # Copy the data after any byte carried over, into a buffer that is
+        # only reallocated when the data is larger than any before
+        n_carried = 0 if self._carried_byte is None else 1
+        n_bytes = n_carried + len(data)
+        if n_bytes > len(self._buffer):
+            self._buffer = numpy.empty(
+                max(n_bytes, 2 * len(self._buffer)), dtype=numpy.uint8)
+        buf = self._buffer[:n_bytes]
+        if n_carried:
+            buf[0] = self._carried_byte
+        buf[n_carried:] = numpy.frombuffer(data, dtype=numpy.uint8)
+        self._carried_byte = None
+
+        # Usually there is no text, so every other byte starts an event
+        events = buf
+        keep = buf >= 0x80
+        if not keep[::_RETINA_PACKET_SIZE].all():
+
+            # Find the start of each run of bytes with and without the top
+            # bit set, and keep the first byte of each run without it that
+            # ends an event
+            changes = numpy.flatnonzero(keep[1:] != keep[:-1]) + 1
+            set_starts = changes[keep[changes]]
+            if keep[0]:
+                set_starts = numpy.concatenate(([0], set_starts))
+            unset_starts = changes[~keep[changes]]
+            run_lengths = unset_starts - set_starts[:len(unset_starts)]
+            keep[unset_starts[run_lengths % _RETINA_PACKET_SIZE == 1]] = True
+            events = buf[keep]
+
+        if len(events) % _RETINA_PACKET_SIZE:
+            self._carried_byte = events[-1]
+            events = events[:-1]
+        return events.reshape(-1, _RETINA_PACKET_SIZE)
@@ -1,4 +1,7 @@
+from collections import OrderedDict
+from functools import partial
 import logging
+from threading import RLock, Timer
 from time import sleep
 from spinn_utilities.overrides import overrides
 from spinn_utilities.log import FormatAdapter
@@ -20,155 +23,176 @@ class PushBotTranslator(AbstractEthernetTranslator):
         Wi-Fi Commands
     """
     __slots__ = [
+        "_coalesce_window",
+        "_flush_timer",
+        "_handlers",
+        "_lock",
+        "_pending",
         "_protocol",
         "_pushbot_wifi_connection"]
 
-    def __init__(self, protocol, pushbot_wifi_connection):
+    def __init__(self, protocol, pushbot_wifi_connection,
+                 coalesce_window=None):
         """
         :param protocol: The instance of the PushBot protocol to get keys from
         :param pushbot_wifi_connection: A Wi-Fi connection to the PushBot
+        :param coalesce_window: If not None, the time in seconds for which\
+            commands are held before being sent together in a single write.\
+            Of the commands held that set the same value, such as the\
+            velocity of a motor, only the latest is sent.
+        :type coalesce_window: float or None
         """
         self._protocol = protocol
         self._pushbot_wifi_connection = pushbot_wifi_connection
+        self._coalesce_window = coalesce_window
+        self._pending = OrderedDict()
+        self._flush_timer = None
+        self._lock = RLock()
+
+        # The handler of each key; where keys are the same, the first
+        # handler is used
+        self._handlers = dict()
+        for key, handler in self._get_handlers(protocol):
+            self._handlers.setdefault(key, handler)
+
+    def _get_handlers(self, protocol):
+        """ Get the key and handler of each command, with the value commands\
+            each given the name it is logged with, the Ethernet command to\
+            send, and the value it sets that later commands replace when\
+            coalescing
+
+        :rtype: iterable(tuple(int, callable))
+        """
+        yield protocol.disable_retina_key, self._disable_retina
+        yield (protocol.set_retina_transmission_key,
+               self._set_retina_transmission)
+        for key, name, command, setting in (
+                (protocol.push_bot_motor_0_leaking_towards_zero_key,
+                 "Motor 0 Leaky Velocity",
+                 MunichIoEthernetProtocol.motor_0_leaky_velocity, "Motor 0"),
+                (protocol.push_bot_motor_0_permanent_key,
+                 "Motor 0 Velocity",
+                 MunichIoEthernetProtocol.motor_0_permanent_velocity,
+                 "Motor 0"),
+                (protocol.push_bot_motor_1_leaking_towards_zero_key,
+                 "Motor 1 Leaky Velocity",
+                 MunichIoEthernetProtocol.motor_1_leaky_velocity, "Motor 1"),
+                (protocol.push_bot_motor_1_permanent_key,
+                 "Motor 1 Velocity",
+                 MunichIoEthernetProtocol.motor_1_permanent_velocity,
+                 "Motor 1"),
+                (protocol.push_bot_laser_config_total_period_key,
+                 "Laser Period",
+                 MunichIoEthernetProtocol.laser_total_period, None),
+                (protocol.push_bot_laser_config_active_time_key,
+                 "Laser Active Time",
+                 MunichIoEthernetProtocol.laser_active_time, None),
+                (protocol.push_bot_laser_set_frequency_key,
+                 "Laser Frequency",
+                 MunichIoEthernetProtocol.laser_frequency, None),
+                (protocol.push_bot_led_total_period_key,
+                 "LED Period",
+                 MunichIoEthernetProtocol.led_total_period, None),
+                (protocol.push_bot_led_front_active_time_key,
+                 "Front LED Active Time",
+                 MunichIoEthernetProtocol.led_front_active_time, None),
+                (protocol.push_bot_led_back_active_time_key,
+                 "Back LED Active Time",
+                 MunichIoEthernetProtocol.led_back_active_time, None),
+                (protocol.push_bot_led_set_frequency_key,
+                 "LED Frequency",
+                 MunichIoEthernetProtocol.led_frequency, None),
+                (protocol.push_bot_speaker_config_total_period_key,
+                 "Speaker Period",
+                 MunichIoEthernetProtocol.speaker_total_period, None),
+                (protocol.push_bot_speaker_config_active_time_key,
+                 "Speaker Active Time",
+                 MunichIoEthernetProtocol.speaker_active_time, None),
+                (protocol.push_bot_speaker_set_tone_key,
+                 "Speaker Frequency",
+                 MunichIoEthernetProtocol.speaker_frequency, None)):
+            yield key, partial(
+                self._send_value, name, command, setting or name)
+        yield protocol.enable_disable_motor_key, self._enable_disable_motor
+        yield protocol.set_mode_key, self._ignore_set_mode
 
     @overrides(AbstractEthernetTranslator.translate_control_packet)
     def translate_control_packet(self, multicast_packet):
-        # pylint: disable=too-many-statements, too-many-branches
-        key = multicast_packet.key
+        handler = self._handlers.get(multicast_packet.key)
+        if handler is None:
+            # no idea what command is, so raise warning and ignore
+            logger.warning("Unknown PushBot command: {}", multicast_packet)
+        else:
+            handler(multicast_packet)
 
-        # disable retina
-        if key == self._protocol.disable_retina_key:
-            logger.debug("Sending retina disable")
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.disable_retina())
-            sleep(0.1)
+    def _send(self, command, setting=None):
+        """ Send a command, or hold it to be sent with others if coalescing
 
+        :param command: The Ethernet command to send
+        :param setting: The value the command sets, if a later command\
+            setting the same value replaces it
+        """
+        if self._coalesce_window is None:
+            self._pushbot_wifi_connection.send(command)
+            return
+        with self._lock:
+            if setting is None:
+                setting = object()
+
+            # A replaced command is moved to keep the order of the commands
+            self._pending.pop(setting, None)
+            self._pending[setting] = command
+            if self._flush_timer is None:
+                self._flush_timer = Timer(self._coalesce_window, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """ Send any commands held when coalescing in a single write
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._pending:
+                commands = "".join(self._pending.values())
+                self._pending.clear()
+                self._pushbot_wifi_connection.send(commands)
+
+    def _disable_retina(self, multicast_packet):
+        # pylint: disable=unused-argument
+        logger.debug("Sending retina disable")
+        self._send(MunichIoEthernetProtocol.disable_retina())
+
+        # The PushBot needs time to stop sending retina events
+        self.flush()
+        sleep(0.1)
+
+    def _set_retina_transmission(self, multicast_packet):
         # set retina key (which doesn't do much for Ethernet)
-        elif key == self._protocol.set_retina_transmission_key:
-            logger.debug("Sending retina enable")
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.set_retina_transmission(
-                    munich_io_spinnaker_link_protocol.GET_RETINA_PAYLOAD_VALUE(
-                        multicast_packet.payload)))
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.enable_retina())
-
-        # motor 0 leaky velocity command
-        elif key == self._protocol.push_bot_motor_0_leaking_towards_zero_key:
-            speed = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Motor 0 Leaky Velocity = {}", speed)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.motor_0_leaky_velocity(speed))
-
-        # motor 0 permanent velocity command
-        elif key == self._protocol.push_bot_motor_0_permanent_key:
-            speed = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Motor 0 Velocity = {}", speed)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.motor_0_permanent_velocity(speed))
-
-        # motor 1 leaky velocity command
-        elif key == self._protocol.push_bot_motor_1_leaking_towards_zero_key:
-            speed = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Motor 1 Leaky Velocity = {}", speed)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.motor_1_leaky_velocity(speed))
-
-        # motor 1 permanent velocity command
-        elif key == self._protocol.push_bot_motor_1_permanent_key:
-            speed = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Motor 1 Velocity = {}", speed)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.motor_1_permanent_velocity(speed))
-
-        # laser total period command
-        elif key == self._protocol.push_bot_laser_config_total_period_key:
-            period = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Laser Period = {}", period)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.laser_total_period(period))
-
-        # laser active time
-        elif key == self._protocol.push_bot_laser_config_active_time_key:
-            time = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Laser Active Time = {}", time)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.laser_active_time(time))
-
-        # laser frequency
-        elif key == self._protocol.push_bot_laser_set_frequency_key:
-            frequency = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Laser Frequency = {}", frequency)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.laser_frequency(frequency))
-
-        # led total period command
-        elif key == self._protocol.push_bot_led_total_period_key:
-            period = _signed_int(multicast_packet.payload)
-            logger.debug("Sending LED Period = {}", period)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.led_total_period(period))
-
-        # front led active time
-        elif key == self._protocol.push_bot_led_front_active_time_key:
-            time = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Front LED Active Time = {}", time)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.led_front_active_time(time))
-
-        # back led active time
-        elif key == self._protocol.push_bot_led_back_active_time_key:
-            time = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Back LED Active Time = {}", time)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.led_back_active_time(time))
-
-        # led frequency
-        elif key == self._protocol.push_bot_led_set_frequency_key:
-            frequency = _signed_int(multicast_packet.payload)
-            logger.debug("Sending LED Frequency = {}", frequency)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.led_frequency(frequency))
-
-        # speaker total period
-        elif key == self._protocol.push_bot_speaker_config_total_period_key:
-            period = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Speaker Period = {}", period)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.speaker_total_period(period))
-
-        # speaker active time
-        elif key == self._protocol.push_bot_speaker_config_active_time_key:
-            time = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Speaker Active Time = {}", time)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.speaker_active_time(time))
-
-        # speaker frequency
-        elif key == self._protocol.push_bot_speaker_set_tone_key:
-            frequency = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Speaker Frequency = {}", frequency)
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.speaker_frequency(frequency))
-
-        # motor enable
-        elif (key == self._protocol.enable_disable_motor_key and
-              multicast_packet.payload == 1):
+        logger.debug("Sending retina enable")
+        self._send(MunichIoEthernetProtocol.set_retina_transmission(
+            munich_io_spinnaker_link_protocol.GET_RETINA_PAYLOAD_VALUE(
+                multicast_packet.payload)))
+        self._send(MunichIoEthernetProtocol.enable_retina())
+
+    def _send_value(self, name, command, setting, multicast_packet):
+        value = _signed_int(multicast_packet.payload)
+        logger.debug("Sending {} = {}", name, value)
+        self._send(command(value), setting)
+
+    def _enable_disable_motor(self, multicast_packet):
+        if multicast_packet.payload == 1:
             logger.debug("Sending Motor Enable")
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.enable_motor())
-
-        # motor disable
-        elif (key == self._protocol.enable_disable_motor_key and
-              multicast_packet.payload == 0):
+            self._send(MunichIoEthernetProtocol.enable_motor())
+        elif multicast_packet.payload == 0:
             logger.debug("Sending Motor Disable")
-            self._pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.disable_motor())
-
-        # detecting set mode (which has no context in Ethernet protocol
-        elif key == self._protocol.set_mode().key:
-            logger.debug("Ignoring set mode command")
-
-        # otherwise no idea what command is, so raise warning and ignore
+            self._send(MunichIoEthernetProtocol.disable_motor())
         else:
             logger.warning("Unknown PushBot command: {}", multicast_packet)
+
+    @staticmethod
+    def _ignore_set_mode(multicast_packet):
+        # pylint: disable=unused-argument
+        # set mode has no context in Ethernet protocol
+        logger.debug("Ignoring set mode command")
@@ -47,6 +47,20 @@ class AbstractAcceptsIncomingSynapses(object):
         """ Get the connections from the machine post-run.
         """
 
+    def read_connections_from_machine(
+            self, transceiver, placement, machine_edges_and_synapse_infos,
+            graph_mapper, routing_infos, using_extra_monitor_cores,
+            placements=None, data_receiver=None,
+            sender_extra_monitor_core_placement=None,
+            extra_monitor_cores_for_router_timeout=None,
+            handle_time_out_configuration=True, fixed_routes=None):
+        # pylint: disable=too-many-arguments
+        """ Read the connections of several edges ending at a placement from\
+            the machine together, ready for them to be got with\
+            :py:meth:`get_connections_from_machine`.  By default this does\
+            nothing, and the connections are read when they are got.
+        """
+
     @abstractmethod
     def clear_connection_cache(self):
         """ Clear the connection data stored in the vertex so far.
@@ -18,3 +18,25 @@ class AbstractReadParametersBeforeSet(object):
         :param placement: the placement of a vertex
         :param vertex_slice: the slice of atoms for this vertex
         """
+
+    @abstractmethod
+    def get_parameters_location(self, vertex_slice):
+        """ Get where the parameters of a slice are held in the memory of the\
+            core, so that the parameters of several cores can be read at once
+
+        :param vertex_slice: the slice of atoms for this vertex
+        :return: The region holding the parameters, the offset of the\
+            parameters in the region, and the size of the parameters in\
+            bytes, or None if the parameters can only be read with\
+            read_parameters_from_machine
+        :rtype: tuple(int, int, int) or None
+        """
+
+    @abstractmethod
+    def update_parameters_from_data(self, data, vertex_slice):
+        """ Update the parameters of a slice from the data read from the\
+            location given by get_parameters_location
+
+        :param data: the data read from the machine
+        :param vertex_slice: the slice of atoms for this vertex
+        """
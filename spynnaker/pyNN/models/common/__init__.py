@@ -3,6 +3,7 @@ from .abstract_spike_recordable import AbstractSpikeRecordable
 from .eieio_spike_recorder import EIEIOSpikeRecorder
 from .neuron_recorder import NeuronRecorder
 from .multi_spike_recorder import MultiSpikeRecorder
+from .parameter_reader import ParameterReader
 from .recording_utils import (
     get_buffer_sizes, get_data, get_recording_region_size_in_bytes,
     needs_buffering, pull_off_cached_lists)
@@ -10,6 +11,7 @@ from .simple_population_settable import SimplePopulationSettable
 
 __all__ = ["AbstractNeuronRecordable", "AbstractSpikeRecordable",
            "EIEIOSpikeRecorder", "NeuronRecorder", "MultiSpikeRecorder",
+           "ParameterReader",
            "SimplePopulationSettable", "get_buffer_sizes", "get_data",
            "needs_buffering", "get_recording_region_size_in_bytes",
            "pull_off_cached_lists", ]
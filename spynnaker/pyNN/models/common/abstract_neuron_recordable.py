@@ -1,3 +1,4 @@
+import math
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 
@@ -40,6 +41,18 @@ class AbstractNeuronRecordable(object):
         :rtype: None
         """
 
+    def get_n_recording_clears(self, variable):
+        """ Get the number of times the recorded data of a variable has been\
+            cleared, so that data got before a clear is not reused after it
+
+        :param variable: the variable of the data
+        :return: the number of clears, or None if they are not counted, in\
+            which case data got before is never reused
+        :rtype: int or None
+        """
+        # pylint: disable=unused-argument
+        return None
+
     @abstractmethod
     def get_data(self, variable, n_machine_time_steps, placements,
                  graph_mapper, buffer_manager, machine_time_step):
@@ -55,6 +68,61 @@ class AbstractNeuronRecordable(object):
         """
         # pylint: disable=too-many-arguments
 
+    def iter_data(self, variable, n_machine_time_steps, placements,
+                  graph_mapper, buffer_manager, machine_time_step,
+                  chunk_steps):
+        """ Get the recorded data in blocks of time steps.  By default, all\
+            the data is returned in a single block.
+
+        :param variable:
+        :param n_machine_time_steps:
+        :param placements:
+        :param graph_mapper:
+        :param buffer_manager:
+        :param machine_time_step:
+        :param chunk_steps: \
+            the number of machine time steps of data in each block
+        :return: a generator of tuples of the data of each block, the neuron\
+            IDs of the columns, the sampling interval and the time in\
+            machine time steps of the first row of the block
+        """
+        # pylint: disable=too-many-arguments
+        data, indexes, sampling_interval = self.get_data(
+            variable, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step)
+        yield data, indexes, sampling_interval, 0
+
+    def get_data_since(self, variable, first_machine_time_step,
+                       n_machine_time_steps, placements, graph_mapper,
+                       buffer_manager, machine_time_step):
+        """ Get the rows of the recorded data from a given time step\
+            onwards.  By default, all the data is got and the earlier rows\
+            dropped.
+
+        :param variable:
+        :param first_machine_time_step: \
+            the first machine time step to get the data of
+        :param n_machine_time_steps:
+        :param placements:
+        :param graph_mapper:
+        :param buffer_manager:
+        :param machine_time_step:
+        :return: the data of the rows from the first row sampled at or\
+            after first_machine_time_step, the neuron IDs of the columns\
+            and the sampling interval
+        """
+        # pylint: disable=too-many-arguments
+        data, indexes, sampling_interval = self.get_data(
+            variable, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step)
+        steps_per_row = int(round(
+            sampling_interval * 1000.0 / machine_time_step))
+        first_row = int(math.ceil(
+            first_machine_time_step / float(steps_per_row)))
+        if data is not None:
+            data = data[first_row:]
+        return data, indexes, sampling_interval
+
     @abstractmethod
     def get_neuron_sampling_interval(self, variable):
         """ Returns the current sampling interval for this variable
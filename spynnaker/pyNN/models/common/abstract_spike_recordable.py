@@ -42,6 +42,16 @@ class AbstractSpikeRecordable(object):
         :rtype: None
         """
 
+    def get_n_spike_recording_clears(self):
+        """ Get the number of times the recorded spikes have been cleared,\
+            so that spikes got before a clear are not reused after it
+
+        :return: the number of clears, or None if they are not counted, in\
+            which case spikes got before are never reused
+        :rtype: int or None
+        """
+        return None
+
     @abstractmethod
     def get_spikes(
             self, placements, graph_mapper, buffer_manager, machine_time_step):
@@ -55,6 +65,26 @@ class AbstractSpikeRecordable(object):
             ordered by time
         """
 
+    def get_spikes_since(
+            self, first_machine_time_step, placements, graph_mapper,
+            buffer_manager, machine_time_step):
+        """ Get the spikes recorded from a given time step onwards.  By\
+            default, all the spikes are got and the earlier ones dropped.
+
+        :param first_machine_time_step: \
+            the first machine time step to get the spikes of
+        :param placements: the placements object
+        :param graph_mapper: the graph mapper object
+        :param buffer_manager: the buffer manager object
+        :param machine_time_step: the time step of the simulation
+        :return: A numpy array of 2-element arrays of (neuron_id, time)
+        """
+        # pylint: disable=too-many-arguments
+        spikes = self.get_spikes(
+            placements, graph_mapper, buffer_manager, machine_time_step)
+        first_time = first_machine_time_step * machine_time_step / 1000.0
+        return spikes[spikes[:, 1] >= first_time]
+
     @abstractmethod
     def get_spikes_sampling_interval(self):
         """ Return the current sampling interval for spikes
@@ -66,7 +66,8 @@ class NeuronRecorder(object):
 
     def get_matrix_data(
             self, label, buffer_manager, region, placements, graph_mapper,
-            application_vertex, variable, n_machine_time_steps):
+            application_vertex, variable, n_machine_time_steps,
+            first_machine_time_step=0):
         """ Read a uint32 mapped to time and neuron IDs from the SpiNNaker\
             machine.
 
@@ -80,8 +81,12 @@ class NeuronRecorder(object):
         :param variable: PyNN name for the variable (V, gsy_inh etc.)
         :type variable: str
         :param n_machine_time_steps:
+        :param first_machine_time_step: \
+            the machine time step to start from; only the rows sampled at\
+            or after this are read
         :return:
         """
+        # pylint: disable=too-many-arguments, too-many-locals
         if variable == SPIKES:
             msg = "Variable {} is not supported use get_spikes".format(SPIKES)
             raise ConfigurationException(msg)
@@ -89,59 +94,47 @@ class NeuronRecorder(object):
         progress = ProgressBar(
             vertices, "Getting {} for {}".format(variable, label))
         sampling_rate = self._sampling_rates[variable]
-        expected_rows = int(math.ceil(
-            n_machine_time_steps / sampling_rate))
+        first_row = int(math.ceil(first_machine_time_step / sampling_rate))
+        expected_rows = max(0, int(math.ceil(
+            n_machine_time_steps / sampling_rate)) - first_row)
         missing_str = ""
+        vertex_neurons, indexes = self.__get_vertex_columns(
+            variable, vertices, graph_mapper)
+
+        # Rows with no data are left as NaN
         data = None
-        indexes = []
-        for vertex in progress.over(vertices):
+        if indexes:
+            data = numpy.full((expected_rows, len(indexes)), numpy.nan)
+        scale = float(DataType.S1615.scale)
+        for vertex, first_column, n_neurons in progress.over(vertex_neurons):
             placement = placements.get_placement_of_vertex(vertex)
-            vertex_slice = graph_mapper.get_slice(vertex)
-            neurons = self._neurons_recording(variable, vertex_slice)
-            n_neurons = len(neurons)
-            if n_neurons == 0:
-                continue
-            indexes.extend(neurons)
+            fragment = data[:, first_column:first_column + n_neurons]
+
             # for buffering output info is taken form the buffer manager
             neuron_param_region_data_pointer, missing_data = \
                 buffer_manager.get_data_for_vertex(
                     placement, region)
-            record_raw = neuron_param_region_data_pointer.read_all()
-            record_length = len(record_raw)
-
             row_length = self.N_BYTES_FOR_TIMESTAMP + \
                 n_neurons * self.N_BYTES_PER_VALUE
+            record = self.__read_rows_since(
+                neuron_param_region_data_pointer, missing_data, row_length,
+                first_row, expected_rows, sampling_rate)
 
-            # There is one column for time and one for each neuron recording
-            n_rows = record_length // row_length
-            # Converts bytes to ints and make a matrix
-            record = (numpy.asarray(record_raw, dtype="uint8").
-                      view(dtype="<i4")).reshape((n_rows, (n_neurons + 1)))
             # Check if you have the expected data
-            if not missing_data and n_rows == expected_rows:
+            if not missing_data and len(record) == expected_rows:
                 # Just cut the timestamps off to get the fragment
-                fragment = (record[:, 1:] / float(DataType.S1615.scale))
+                numpy.divide(record[:, 1:], scale, out=fragment)
             else:
                 missing_str += "({}, {}, {}); ".format(
                     placement.x, placement.y, placement.p)
-                # Start the fragment for this slice empty
-                fragment = numpy.empty((expected_rows, n_neurons))
-                for i in xrange(0, expected_rows):
-                    time = i * sampling_rate
-                    # Check if there is data for this timestep
-                    local_indexes = numpy.where(record[:, 0] == time)
-                    if len(local_indexes[0]) > 0:
-                        # Set row to data for that timestep
-                        fragment[i] = (record[local_indexes[0], 1:] /
-                                       float(DataType.S1615.scale))
-                    else:
-                        # Set row to nan
-                        fragment[i] = numpy.full(n_neurons, numpy.nan)
-            if data is None:
-                data = fragment
-            else:
-                # Add the slice fragment on axis 1 which is IDs/channel_index
-                data = numpy.append(data, fragment, axis=1)
+                # Put each row of data that is for an expected time step
+                # in the row of that time step
+                times = record[:, 0]
+                rows = times // sampling_rate - first_row
+                valid = ((times % sampling_rate == 0) & (rows >= 0) &
+                         (rows < expected_rows))
+                fragment[rows[valid]] = record[valid, 1:] / scale
+
         if len(missing_str) > 0:
             logger.warn(
                 "Population {} is missing recorded data in region {} from the"
@@ -149,15 +142,183 @@ class NeuronRecorder(object):
         sampling_interval = self.get_neuron_sampling_interval(variable)
         return (data, indexes, sampling_interval)
 
+    def __read_rows_since(
+            self, data_pointer, missing_data, row_length, first_row,
+            n_rows, sampling_rate):
+        """ Read the rows of the recorded data of a vertex from a given row\
+            onwards.  Where no data is missing, the rows before are skipped\
+            without being read; otherwise all the rows are read and the\
+            earlier ones dropped.
+
+        :return: the rows read, each of the timestamp and then the values
+        :rtype: numpy.ndarray
+        """
+        # pylint: disable=too-many-arguments
+        n_columns = row_length // self.N_BYTES_PER_VALUE
+        if first_row > 0 and not missing_data:
+            data_pointer.seek_read(first_row * row_length)
+            record_raw = data_pointer.read(n_rows * row_length)
+            n_rows_read = len(record_raw) // row_length
+            record = numpy.asarray(
+                record_raw[:n_rows_read * row_length], dtype="uint8").view(
+                    dtype="<i4").reshape((n_rows_read, n_columns))
+            if n_rows_read == 0 or \
+                    record[0, 0] == first_row * sampling_rate:
+                return record
+
+        record_raw = data_pointer.read_all()
+        n_rows_read = len(record_raw) // row_length
+        record = numpy.asarray(record_raw, dtype="uint8").view(
+            dtype="<i4").reshape((n_rows_read, n_columns))
+        if first_row > 0:
+            # The rows are in time order
+            record = record[numpy.searchsorted(
+                record[:, 0], first_row * sampling_rate):]
+        return record
+
+    def __get_vertex_columns(self, variable, vertices, graph_mapper):
+        """ Work out which columns of the data each vertex fills in
+
+        :return: the vertices recording with the first column and number of\
+            columns of each, and the neuron index of each column
+        """
+        vertex_neurons = list()
+        indexes = []
+        for vertex in vertices:
+            vertex_slice = graph_mapper.get_slice(vertex)
+            neurons = self._neurons_recording(variable, vertex_slice)
+            if len(neurons) == 0:
+                continue
+            vertex_neurons.append((vertex, len(indexes), len(neurons)))
+            indexes.extend(neurons)
+        return vertex_neurons, indexes
+
+    def iter_matrix_data(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, n_machine_time_steps, chunk_steps):
+        """ Read a uint32 mapped to time and neuron IDs from the SpiNNaker\
+            machine in blocks of time steps, reading only the data of each\
+            block from the buffers at a time.
+
+        :param label: vertex label
+        :param buffer_manager: the manager for buffered data
+        :param region: the DSG region ID used for this data
+        :param placements: the placements object
+        :param graph_mapper: \
+            the mapping between application and machine vertices
+        :param application_vertex:
+        :param variable: PyNN name for the variable (V, gsy_inh etc.)
+        :type variable: str
+        :param n_machine_time_steps:
+        :param chunk_steps: \
+            the number of machine time steps of data in each block
+        :return: a generator of tuples of the data of each block, the neuron\
+            IDs of the columns, the sampling interval and the time in\
+            machine time steps of the first row of the block
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+        if variable == SPIKES:
+            msg = "Variable {} is not supported use get_spikes".format(SPIKES)
+            raise ConfigurationException(msg)
+        vertices = graph_mapper.get_machine_vertices(application_vertex)
+        sampling_rate = self._sampling_rates[variable]
+        expected_rows = int(math.ceil(
+            n_machine_time_steps / sampling_rate))
+        chunk_rows = max(1, int(math.ceil(chunk_steps / sampling_rate)))
+        sampling_interval = self.get_neuron_sampling_interval(variable)
+        vertex_neurons, indexes = self.__get_vertex_columns(
+            variable, vertices, graph_mapper)
+
+        # Get the buffers of each vertex, with the row read up to so far
+        readers = list()
+        missing_str = ""
+        for vertex, first_column, n_neurons in vertex_neurons:
+            placement = placements.get_placement_of_vertex(vertex)
+            neuron_param_region_data_pointer, missing_data = \
+                buffer_manager.get_data_for_vertex(
+                    placement, region)
+            if missing_data:
+                missing_str += "({}, {}, {}); ".format(
+                    placement.x, placement.y, placement.p)
+            readers.append([
+                neuron_param_region_data_pointer, first_column, n_neurons, 0])
+        if len(missing_str) > 0:
+            logger.warn(
+                "Population {} is missing recorded data in region {} from the"
+                " following cores: {}".format(label, region, missing_str))
+
+        progress = ProgressBar(
+            int(math.ceil(expected_rows / chunk_rows)),
+            "Getting {} for {}".format(variable, label))
+        for first_row in progress.over(xrange(0, expected_rows, chunk_rows)):
+            n_rows = min(chunk_rows, expected_rows - first_row)
+            data = numpy.full((n_rows, len(indexes)), numpy.nan)
+            for reader in readers:
+                self.__read_block(
+                    reader, data, first_row, n_rows, sampling_rate)
+            yield (data, indexes, sampling_interval,
+                   first_row * sampling_rate)
+
+    def __read_block(self, reader, data, first_row, n_rows, sampling_rate):
+        """ Read the rows of a block of data of a vertex from its buffer,\
+            starting from the row read up to so far; the rows are in time\
+            order, so reading stops at the first row after the block.
+        """
+        # pylint: disable=too-many-arguments
+        data_pointer, first_column, n_neurons, row = reader
+        row_length = self.N_BYTES_FOR_TIMESTAMP + \
+            n_neurons * self.N_BYTES_PER_VALUE
+
+        # There can be no more rows in the block than expected, as rows are
+        # only ever missing
+        data_pointer.seek_read(row * row_length)
+        record_raw = data_pointer.read(n_rows * row_length)
+        n_rows_read = len(record_raw) // row_length
+        record = (numpy.asarray(
+            record_raw[:n_rows_read * row_length], dtype="uint8").
+            view(dtype="<i4")).reshape((n_rows_read, (n_neurons + 1)))
+
+        times = record[:, 0]
+        rows = times // sampling_rate - first_row
+        valid = ((times % sampling_rate == 0) & (rows >= 0) &
+                 (rows < n_rows))
+        data[rows[valid], first_column:first_column + n_neurons] = (
+            record[valid, 1:] / float(DataType.S1615.scale))
+        reader[3] = row + int(numpy.searchsorted(
+            times, (first_row + n_rows) * sampling_rate))
+
     def get_spikes(
             self, label, buffer_manager, region, placements, graph_mapper,
-            application_vertex, machine_time_step):
+            application_vertex, machine_time_step, sort_by_time=False,
+            first_machine_time_step=0):
+        """ Read the spikes of a population from the SpiNNaker machine.
 
-        spike_times = list()
-        spike_ids = list()
+        :param label: vertex label
+        :param buffer_manager: the manager for buffered data
+        :param region: the DSG region ID used for this data
+        :param placements: the placements object
+        :param graph_mapper: \
+            the mapping between application and machine vertices
+        :param application_vertex:
+        :param machine_time_step: the time step of the simulation
+        :param sort_by_time: \
+            If True, the spikes are sorted by time (and then neuron ID)\
+            rather than by neuron ID (and then time)
+        :param first_machine_time_step: \
+            the machine time step to start from; only the spikes at or\
+            after this are decoded
+        :return: an array of the neuron ID and time of each spike
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+        vertex_ids = list()
+        vertex_times = list()
         ms_per_tick = machine_time_step / 1000.0
 
-        vertices = graph_mapper.get_machine_vertices(application_vertex)
+        # Go through the vertices in ID order, so that spikes at the same
+        # time are in ID order
+        vertices = sorted(
+            graph_mapper.get_machine_vertices(application_vertex),
+            key=lambda vertex: graph_mapper.get_slice(vertex).lo_atom)
         missing_str = ""
         progress = ProgressBar(vertices,
                                "Getting spikes for {}".format(label))
@@ -165,15 +326,18 @@ class NeuronRecorder(object):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = graph_mapper.get_slice(vertex)
 
+            # Get the ID of each bit of the recorded data
             if self._indexes[SPIKES] is None:
-                neurons_recording = vertex_slice.n_atoms
+                neuron_ids = numpy.arange(
+                    vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
             else:
-                neurons_recording = sum(
-                    (index >= vertex_slice.lo_atom and
-                     index <= vertex_slice.hi_atom)
-                    for index in self._indexes[SPIKES])
-                if neurons_recording == 0:
+                neuron_ids = numpy.array(
+                    self._neurons_recording(SPIKES, vertex_slice),
+                    dtype="int64")
+                if len(neuron_ids) == 0:
                     continue
+            neurons_recording = len(neuron_ids)
+
             # Read the spikes
             n_words = int(math.ceil(neurons_recording / 32.0))
             n_bytes = n_words * self.N_BYTES_PER_WORD
@@ -190,35 +354,43 @@ class NeuronRecorder(object):
             raw_data = (numpy.asarray(record_raw, dtype="uint8").
                         view(dtype="<i4")).reshape(
                 [-1, n_words_with_timestamp])
+            if first_machine_time_step > 0:
+                # The rows are in time order
+                raw_data = raw_data[numpy.searchsorted(
+                    raw_data[:, 0], first_machine_time_step):]
             if len(raw_data) > 0:
                 record_time = raw_data[:, 0] * float(ms_per_tick)
                 spikes = raw_data[:, 1:].byteswap().view("uint8")
                 bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
                     (-1, 32))).reshape((-1, n_bytes * 8))
-                time_indices, local_indices = numpy.where(bits == 1)
-                if self._indexes[SPIKES] is None:
-                    indices = local_indices + vertex_slice.lo_atom
-                    times = record_time[time_indices].reshape((-1))
-                    spike_ids.extend(indices)
-                    spike_times.extend(times)
-                else:
-                    neurons = self._neurons_recording(SPIKES, vertex_slice)
-                    n_neurons = len(neurons)
-                    for time_indice, local in zip(time_indices, local_indices):
-                        if local < n_neurons:
-                            spike_ids.append(neurons[local])
-                            spike_times.append(record_time[time_indice])
+
+                # The spikes are found in time order, then neuron order
+                time_indices, local_indices = numpy.nonzero(
+                    bits[:, :neurons_recording])
+                vertex_ids.append(neuron_ids[local_indices])
+                vertex_times.append(record_time[time_indices])
 
         if len(missing_str) > 0:
             logger.warn(
                 "Population {} is missing spike data in region {} from the"
                 " following cores: {}".format(label, region, missing_str))
 
-        if len(spike_ids) == 0:
+        n_spikes = sum(len(ids) for ids in vertex_ids)
+        if n_spikes == 0:
             return numpy.zeros((0, 2), dtype="float")
 
-        result = numpy.column_stack((spike_ids, spike_times))
-        return result[numpy.lexsort((spike_times, spike_ids))]
+        result = numpy.empty((n_spikes, 2))
+        start = 0
+        for ids, times in zip(vertex_ids, vertex_times):
+            result[start:start + len(ids), 0] = ids
+            result[start:start + len(ids), 1] = times
+            start += len(ids)
+
+        # The spikes of each vertex are already in time order, and the
+        # vertices have distinct IDs, so a single stable sort on either the
+        # time or the ID gives the full order
+        sort_column = 1 if sort_by_time else 0
+        return result[numpy.argsort(result[:, sort_column], kind="mergesort")]
 
     def get_recordable_variables(self):
         return self._sampling_rates.keys()
@@ -0,0 +1,63 @@
+from spinn_front_end_common.utilities.helpful_functions import (
+    locate_memory_region_for_placement)
+
+
+class ParameterReader(object):
+    """ Reads the parameters of the cores of a vertex from the machine,\
+        and decodes the data of each core as soon as it arrives.  The\
+        addresses of the regions read are kept, so that later reads of the\
+        same cores only need to read the parameters themselves.
+    """
+
+    __slots__ = [
+        # The address of each region read, by (x, y, p, region)
+        "_region_addresses"]
+
+    def __init__(self):
+        self._region_addresses = dict()
+
+    def clear_cache(self):
+        """ Forget the addresses of the regions read, as the data of the\
+            cores has been loaded again
+        """
+        self._region_addresses.clear()
+
+    def read_parameters(self, transceiver, vertex, placements_and_slices):
+        """ Read the parameters of the cores of a vertex, and update the\
+            vertex with them
+
+        :param transceiver: the SpiNNMan interface
+        :param vertex: the vertex whose parameters are to be read
+        :type vertex: AbstractReadParametersBeforeSet
+        :param placements_and_slices:\
+            the placement of each core to read with its slice of the vertex
+        :type placements_and_slices: \
+            list(tuple(:py:class:`pacman.model.placements.Placement`, \
+            :py:class:`pacman.model.graphs.common.Slice`))
+        """
+        for placement, vertex_slice in placements_and_slices:
+            location = vertex.get_parameters_location(vertex_slice)
+            if location is None:
+                vertex.read_parameters_from_machine(
+                    transceiver, placement, vertex_slice)
+            else:
+                vertex.update_parameters_from_data(
+                    self._read(transceiver, placement, location),
+                    vertex_slice)
+
+    def _read(self, transceiver, placement, location):
+        """ Read the parameters of a single core
+
+        :param location: The region, the offset into the region, and the\
+            size in bytes of the parameters
+        :rtype: bytearray
+        """
+        region, offset, n_bytes = location
+        key = (placement.x, placement.y, placement.p, region)
+        address = self._region_addresses.get(key)
+        if address is None:
+            address = locate_memory_region_for_placement(
+                placement, region, transceiver)
+            self._region_addresses[key] = address
+        return transceiver.read_memory(
+            placement.x, placement.y, address + offset, n_bytes)
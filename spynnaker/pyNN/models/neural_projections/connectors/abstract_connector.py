@@ -1,3 +1,4 @@
+import copy
 import logging
 import math
 import re
@@ -9,6 +10,7 @@ from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.utilities import utility_calls
+from .distance_cache import DistanceCache
 
 # global objects
 logger = logging.getLogger(__name__)
@@ -19,6 +21,19 @@ _expr_context = SafeEval(
     numpy.power, numpy.sin, numpy.sinh, numpy.sqrt, numpy.tan, numpy.tanh,
     numpy.maximum, numpy.minimum, e=numpy.e, pi=numpy.pi)
 
+# The probability above which it is faster to draw a random number for every
+# potential connection than to skip over those not made
+_DENSE_SAMPLING_PROBABILITY = 0.4
+
+
+def _seed_rng(rng, seed):
+    """ Seed a random number generator; a PyNN NumpyRNG wraps a numpy\
+        RandomState, which is the one that is seeded.
+    """
+    rng = getattr(rng, "rng", rng)
+    if callable(getattr(rng, "seed", None)):
+        rng.seed(seed)
+
 
 @add_metaclass(AbstractBase)
 class AbstractConnector(object):
@@ -30,11 +45,16 @@ class AbstractConnector(object):
                             ("synapse_type", "uint8")]
 
     __slots__ = [
+        "_base_seed",
+        "_block_rng",
+        "_block_values",
         "_delays",
         "_min_delay",
         "_pre_population",
         "_post_population",
+        "_projection_numbers",
         "_n_clipped_delays",
+        "_n_filtered_edges",
         "_n_post_neurons",
         "_n_pre_neurons",
         "_rng",
@@ -53,8 +73,13 @@ class AbstractConnector(object):
         self._n_pre_neurons = None
         self._n_post_neurons = None
         self._rng = rng
+        self._base_seed = None
+        self._block_rng = None
+        self._block_values = ()
+        self._projection_numbers = dict()
 
         self._n_clipped_delays = 0
+        self._n_filtered_edges = 0
         self._min_delay = 0
 
     def set_space(self, space):
@@ -244,43 +269,81 @@ class AbstractConnector(object):
         regexpr = re.compile(r'.*d\[\d*\].*')
         return regexpr.match(d_expression)
 
-    def _generate_values(self, values, n_connections, connection_slices):
+    def _generate_values(
+            self, values, n_connections, connection_slices,
+            pre_vertex_slice=None, post_vertex_slice=None, sources=None,
+            targets=None):
+        """ Generate a value for each connection of a block.
+
+        :param values: The values, as a single value, a random\
+            distribution, a list, or a function of distance given as a\
+            string or a callable
+        :param n_connections: The number of connections
+        :param connection_slices: \
+            The slices of a list of values that hold the values of the block
+        :param pre_vertex_slice: The pre-neurons of the block
+        :param post_vertex_slice: The post-neurons of the block
+        :param sources: The pre-neuron ID of each connection
+        :param targets: The post-neuron ID of each connection
+        :rtype: numpy.ndarray(dtype="float64")
+        """
+        # pylint: disable=too-many-arguments
         if get_simulator().is_a_pynn_random(values):
+            for user_values, block_values in self._block_values:
+                if values is user_values:
+                    values = block_values
             if n_connections == 1:
                 return numpy.array([values.next(n_connections)],
                                    dtype="float64")
             return values.next(n_connections)
-        elif numpy.isscalar(values):
-            return numpy.repeat([values], n_connections).astype("float64")
-        elif hasattr(values, "__getitem__"):
-            return numpy.concatenate([
-                values[connection_slice]
-                for connection_slice in connection_slices]).astype("float64")
+
+        # Strings are scalars to numpy, so must be checked for first
         elif isinstance(values, string_types) or callable(values):
             if self._space is None:
                 raise Exception(
                     "No space object specified in projection {}-{}".format(
                         self._pre_population, self._post_population))
 
+            if sources is None or targets is None:
+                raise Exception(
+                    "Distance-dependent values need the connections of the "
+                    "block in projection {}-{}".format(
+                        self._pre_population, self._post_population))
+
             expand_distances = True
             if isinstance(values, string_types):
                 expand_distances = self._expand_distances(values)
 
-            d = self._space.distances(
-                self._pre_population.positions,
-                self._post_population.positions,
-                expand_distances)
+            # Only the distances of the block are computed, and these are
+            # shared with the other connectors between the same populations
+            d = DistanceCache.shared().get_distances(
+                self._space, self._pre_population, self._post_population,
+                pre_vertex_slice, post_vertex_slice, expand_distances)
+            d = d[..., numpy.asarray(sources) - pre_vertex_slice.lo_atom,
+                  numpy.asarray(targets) - post_vertex_slice.lo_atom]
 
             if isinstance(values, string_types):
-                return _expr_context.eval(values)
-            return values(d)
+                return numpy.asarray(
+                    _expr_context.eval(values, d=d), dtype="float64")
+            return numpy.asarray(values(d), dtype="float64")
+        elif numpy.isscalar(values):
+            return numpy.repeat([values], n_connections).astype("float64")
+        elif hasattr(values, "__getitem__"):
+            return numpy.concatenate([
+                values[connection_slice]
+                for connection_slice in connection_slices]).astype("float64")
         raise Exception("what on earth are you giving me?")
 
-    def _generate_weights(self, values, n_connections, connection_slices):
+    def _generate_weights(
+            self, values, n_connections, connection_slices,
+            pre_vertex_slice=None, post_vertex_slice=None, sources=None,
+            targets=None):
         """ Generate weight values.
         """
+        # pylint: disable=too-many-arguments
         weights = self._generate_values(
-            values, n_connections, connection_slices)
+            values, n_connections, connection_slices, pre_vertex_slice,
+            post_vertex_slice, sources, targets)
         if self._safe:
             if not weights.size:
                 logger_utils.warn_once(logger,
@@ -310,15 +373,205 @@ class AbstractConnector(object):
                 delays[delays < self._min_delay] = self._min_delay
         return delays
 
-    def _generate_delays(self, values, n_connections, connection_slices):
+    def _generate_delays(
+            self, values, n_connections, connection_slices,
+            pre_vertex_slice=None, post_vertex_slice=None, sources=None,
+            targets=None):
         """ Generate valid delay values.
         """
-
+        # pylint: disable=too-many-arguments
         delays = self._generate_values(
-            values, n_connections, connection_slices)
+            values, n_connections, connection_slices, pre_vertex_slice,
+            post_vertex_slice, sources, targets)
 
         return self._clip_delays(delays)
 
+    def add_projection(self, synapse_info):
+        """ Number a projection that uses this connector, so that a\
+            connector used by several projections generates different blocks\
+            for each.  Projections are numbered in the order they are added,\
+            or else in the order their blocks are first seeded.
+
+        :param synapse_info: The synapse information of the projection
+        :return: The number of the projection
+        :rtype: int
+        """
+        return self._projection_numbers.setdefault(
+            synapse_info, len(self._projection_numbers))
+
+    def get_block_seed(
+            self, synapse_info, pre_vertex_slice, post_vertex_slice):
+        """ Get a seed for generating the synaptic block of a pair of slices\
+            of a projection independently of any other blocks.  The seed\
+            depends only on the connector, the projection and the slices.\
+            Choices shared by all the blocks of the projection are not made\
+            from the seed, but by :py:meth:`prepare_synaptic_blocks` before\
+            any block is generated; the blocks can then be generated in any\
+            order, and generating a block again does not change the others.
+
+        :param synapse_info: The synapse information of the projection
+        :param pre_vertex_slice: The slice of the pre-neurons of the block
+        :param post_vertex_slice: The slice of the post-neurons of the block
+        :rtype: int
+        """
+        if self._base_seed is None:
+            # The seed of the connector is drawn from the random number
+            # generator once; two values are drawn as PyNN gives a scalar
+            # when asked for one
+            self._base_seed = int(self._rng.next(n=2)[0] * 0xFFFFFFFF)
+
+        return int(numpy.random.RandomState([
+            self._base_seed, self.add_projection(synapse_info),
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom]).randint(
+                0, 0x7FFFFFFF))
+
+    def seed_block(self, seed, weights, delays):
+        """ Give the synaptic block about to be created random number\
+            generators of its own, seeded from the seed of the block, so that\
+            the block can be generated in any process and still give the same\
+            result.  Random weights and delays are drawn from seeded copies,\
+            so the generators passed in by the user are never re-seeded.
+
+        :param seed: The seed of the block, from :py:meth:`get_block_seed`
+        :param weights: The weights passed to create_synaptic_block
+        :param delays: The delays passed to create_synaptic_block
+        """
+        seeds = numpy.random.RandomState(seed).randint(0, 0x7FFFFFFF, 3)
+        self._block_rng = numpy.random.RandomState(seeds[0])
+        block_values = list()
+        for values, values_seed in ((weights, seeds[1]), (delays, seeds[2])):
+            if get_simulator().is_a_pynn_random(values):
+                values_copy = copy.deepcopy(values)
+                _seed_rng(getattr(values_copy, "rng", values_copy),
+                          values_seed)
+                block_values.append((values, values_copy))
+        self._block_values = tuple(block_values)
+
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        """ Make any random choices that are shared by all the synaptic\
+            blocks of the projection.  This is called before any block is\
+            generated, so that the choices are made once, in this process,\
+            rather than by whichever block or worker process needs them\
+            first.  By default there are none.
+
+        :param pre_slices: The slices of the pre-neurons
+        :param post_slices: The slices of the post-neurons
+        """
+        # pylint: disable=unused-argument
+
+    def _get_sampling_rng(self):
+        """ Get a numpy random number generator to create a synaptic block\
+            with; this is the generator of the block if it was seeded, or\
+            else the one wrapped by a PyNN NumpyRNG, and any other generator\
+            is used to seed a new one.
+
+        :rtype: :py:class:`numpy.random.RandomState`
+        """
+        if self._block_rng is not None:
+            return self._block_rng
+        rng = getattr(self._rng, "rng", self._rng)
+        if isinstance(rng, numpy.random.RandomState):
+            return rng
+        return numpy.random.RandomState(
+            int(self._rng.next(n=2)[0] * 0xFFFFFFFF))
+
+    @staticmethod
+    def _sample_indices(n_items, p_connect, rng):
+        """ Choose each of a number of items independently with a fixed\
+            probability, in time proportional to the number chosen.  The\
+            gaps between the items chosen are drawn from a geometric\
+            distribution, so the items not chosen are skipped over, unless\
+            most items are chosen anyway.
+
+        :param n_items: The number of items to choose from
+        :param p_connect: The probability of choosing each item
+        :param rng: The random number generator to use
+        :type rng: :py:class:`numpy.random.RandomState`
+        :return: The sorted indices of the items chosen
+        :rtype: numpy.ndarray
+        """
+        if n_items <= 0 or p_connect <= 0:
+            return numpy.zeros(0, dtype="int64")
+        if p_connect >= 1:
+            return numpy.arange(n_items, dtype="int64")
+        if p_connect > _DENSE_SAMPLING_PROBABILITY:
+            return numpy.flatnonzero(rng.uniform(size=n_items) < p_connect)
+
+        chunks = list()
+        last = -1
+        while True:
+            # Draw enough gaps to reach the end in one go nearly every time
+            expected = (n_items - last - 1) * p_connect
+            n_gaps = int(expected + 4 * math.sqrt(expected) + 16)
+            indices = last + numpy.cumsum(rng.geometric(p_connect, n_gaps))
+            if indices[-1] >= n_items:
+                chunks.append(indices[:numpy.searchsorted(indices, n_items)])
+                return numpy.concatenate(chunks)
+            chunks.append(indices)
+            last = indices[-1]
+
+    def _sample_connections(
+            self, probabilities, pre_vertex_slice, post_vertex_slice,
+            allow_self_connections):
+        """ Choose the connections of a block, each made independently with\
+            its probability.  Candidates are drawn with the largest\
+            probability by skipping over those not chosen, and each is then\
+            kept with the ratio of its probability to the largest, so the\
+            random numbers drawn scale with the connections made rather than\
+            with the size of the block.
+
+        :param probabilities: The probability of every connection, or an\
+            array of the probability of each by pre-neuron and then\
+            post-neuron of the block
+        :param pre_vertex_slice: The slice of the pre-neurons of the block
+        :param post_vertex_slice: The slice of the post-neurons of the block
+        :param allow_self_connections: \
+            If False, a neuron is not connected to the neuron with the same ID
+        :return: The pre-neuron ID and post-neuron ID of each connection,\
+            ordered by pre-neuron and then post-neuron
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        rng = self._get_sampling_rng()
+        n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
+        if numpy.isscalar(probabilities):
+            ids = self._sample_indices(n_items, probabilities, rng)
+        else:
+            probabilities = numpy.reshape(probabilities, -1)
+            max_prob = min(float(numpy.amax(probabilities)), 1.0) \
+                if n_items else 0.0
+            ids = self._sample_indices(n_items, max_prob, rng)
+            ids = ids[rng.uniform(size=len(ids)) * max_prob <
+                      probabilities[ids]]
+
+        sources = (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom
+        targets = (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom
+        if not allow_self_connections:
+            keep = sources != targets
+            sources = sources[keep]
+            targets = targets[keep]
+        return sources, targets
+
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        """ Determine if any connection could be made from a slice of the\
+            pre-neurons to a slice of the post-neurons.  This may only return\
+            False if the block of the slices is certain to be empty, so that\
+            the machine edge between them can be removed; by default, any\
+            connection is assumed to be possible.
+
+        :param pre_vertex_slice: The slice of the pre-neurons
+        :param post_vertex_slice: The slice of the post-neurons
+        :rtype: bool
+        """
+        # pylint: disable=unused-argument
+        return True
+
+    def add_filtered_edge(self):
+        """ Record that a machine edge of the connector was removed, as no\
+            connection could be made over it
+        """
+        self._n_filtered_edges += 1
+
     @abstractmethod
     def create_synaptic_block(
             self, weights, delays, pre_slices, pre_slice_index, post_slices,
@@ -343,7 +596,10 @@ class AbstractConnector(object):
                 "timestep".format(
                     self.__class__.__name__, self._pre_population.label,
                     self._post_population.label, self._min_delay,
-                    self._n_clipped_delays)))]
+                    self._n_clipped_delays))),
+            ProvenanceDataItem(
+                [name, "Number_of_machine_edges_filtered"],
+                self._n_filtered_edges, report=False)]
 
     @property
     def safe(self):
@@ -68,6 +68,11 @@ class ArrayConnector(AbstractConnector):
     def get_weight_maximum(self, weights):
         return self._get_weight_maximum(weights, self._n_total_connections)
 
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        return bool(numpy.any(self._array[
+            pre_vertex_slice.as_slice, post_vertex_slice.as_slice] == 1))
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, weights, delays, pre_slices, pre_slice_index, post_slices,
@@ -93,9 +98,11 @@ class ArrayConnector(AbstractConnector):
         block["source"] = pre_neurons
         block["target"] = post_neurons
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -109,9 +109,11 @@ class CSAConnector(AbstractConnector):
         block["source"] = [x[0] for x in pair_list]
         block["target"] = [x[1] for x in pair_list]
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
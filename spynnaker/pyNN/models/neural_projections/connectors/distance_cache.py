@@ -0,0 +1,134 @@
+from collections import OrderedDict
+import numpy
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+
+
+class DistanceCache(object):
+    """ Distances between the neurons of pairs of populations, computed a\
+        block of a pre-vertex slice by a post-vertex slice at a time, so that\
+        the memory used depends on the sizes of the slices rather than of\
+        the populations.  The most recently used blocks are kept up to a\
+        limit on their total size in bytes.
+    """
+
+    __slots__ = [
+        # The blocks of distances, by key, least recently used first
+        "_blocks",
+
+        # The maximum total size of the blocks kept in bytes
+        "_max_bytes",
+
+        # The total size of the blocks kept in bytes
+        "_n_bytes"]
+
+    # The cache shared by all connectors
+    _shared = None
+
+    def __init__(self, max_bytes):
+        """
+        :param max_bytes: The maximum total size of the blocks kept in bytes
+        :type max_bytes: int
+        """
+        self._blocks = OrderedDict()
+        self._max_bytes = max_bytes
+        self._n_bytes = 0
+
+    @classmethod
+    def shared(cls):
+        """ Get the cache shared by all connectors, so that connectors\
+            between the same populations in the same space share blocks
+
+        :rtype: :py:class:`DistanceCache`
+        """
+        if cls._shared is None:
+            cls._shared = DistanceCache(get_simulator().config.getint(
+                "Simulation", "distance_cache_max_bytes"))
+        return cls._shared
+
+    @classmethod
+    def clear_shared(cls):
+        """ Forget the cache shared by all connectors, along with the\
+            populations and spaces that it refers to
+        """
+        cls._shared = None
+
+    @property
+    def n_bytes(self):
+        """ The total size of the blocks kept in bytes
+
+        :rtype: int
+        """
+        return self._n_bytes
+
+    def get_distances(
+            self, space, pre_population, post_population, pre_vertex_slice,
+            post_vertex_slice, expand_distances=False):
+        """ Get the distances between the neurons of a pre-vertex slice and\
+            those of a post-vertex slice.  The array returned is shared, so\
+            must not be changed.
+
+        :param space: The space to measure the distances in
+        :type space: pyNN.Space
+        :param pre_population: The population of the pre-vertex slice
+        :param post_population: The population of the post-vertex slice
+        :param pre_vertex_slice: The slice of the pre-neurons
+        :type pre_vertex_slice: :py:class:`pacman.model.graphs.common.Slice`
+        :param post_vertex_slice: The slice of the post-neurons
+        :type post_vertex_slice: :py:class:`pacman.model.graphs.common.Slice`
+        :param expand_distances: \\
+            If True, get the distance along each axis separately
+        :return: the distances by pre-neuron and then post-neuron of the\\
+            slices, preceded by the axis if expanded
+        :rtype: numpy.ndarray
+        """
+        # pylint: disable=too-many-arguments
+
+        # The objects are kept with the block, so their IDs stay unique
+        key = (id(space), id(pre_population), id(post_population),
+               pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+               post_vertex_slice.lo_atom, post_vertex_slice.hi_atom,
+               bool(expand_distances))
+        entry = self._blocks.pop(key, None)
+        if entry is not None:
+            self._blocks[key] = entry
+            return entry[0]
+
+        distances = self.compute_distances(
+            space, pre_population, post_population, pre_vertex_slice,
+            post_vertex_slice, expand_distances)
+        distances.flags.writeable = False
+        if distances.nbytes > self._max_bytes:
+            return distances
+
+        # Drop the least recently used blocks to make space for this one
+        while self._n_bytes + distances.nbytes > self._max_bytes:
+            _, (old_distances, _, _, _) = self._blocks.popitem(last=False)
+            self._n_bytes -= old_distances.nbytes
+        self._blocks[key] = (
+            distances, space, pre_population, post_population)
+        self._n_bytes += distances.nbytes
+        return distances
+
+    @staticmethod
+    def compute_distances(
+            space, pre_population, post_population, pre_vertex_slice,
+            post_vertex_slice, expand_distances):
+        """ Compute the distances between the neurons of a pre-vertex slice\
+            and those of a post-vertex slice, without keeping them
+
+        :return: the distances by pre-neuron and then post-neuron of the\
+            slices, preceded by the axis if expanded
+        :rtype: numpy.ndarray
+        """
+        # pylint: disable=too-many-arguments
+        distances = space.distances(
+            pre_population.positions[:, pre_vertex_slice.as_slice],
+            post_population.positions[:, post_vertex_slice.as_slice],
+            expand_distances)
+
+        # PyNN 0.8 returns a flattened (C-style) array from space.distances,
+        # so reshape to the expected shape
+        shape = (pre_vertex_slice.n_atoms, post_vertex_slice.n_atoms)
+        if expand_distances:
+            shape = (-1, ) + shape
+        return numpy.reshape(distances, shape)
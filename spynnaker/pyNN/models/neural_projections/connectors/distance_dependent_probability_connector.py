@@ -7,8 +7,10 @@ from numpy import (
     minimum, e, pi)
 from spinn_utilities.overrides import overrides
 from spinn_utilities.safe_eval import SafeEval
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.utilities import utility_calls
 from .abstract_connector import AbstractConnector
+from .distance_cache import DistanceCache
 
 logger = logging.getLogger(__name__)
 # support for arbitrary expression for the distance dependence
@@ -17,6 +19,10 @@ _d_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2, ceil,
                            log, log10, modf, power, sin, sinh, sqrt, tan, tanh,
                            maximum, minimum, e=e, pi=pi)
 
+# The maximum number of probabilities computed at once when finding the
+# maximum probabilities
+_MAX_PROBABILITIES_PER_BLOCK = 1 << 20
+
 
 class DistanceDependentProbabilityConnector(AbstractConnector):
     """ Make connections using a distribution which varies with distance.
@@ -25,7 +31,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     __slots__ = [
         "_allow_self_connections",
         "_d_expression",
-        "_probs"]
+        "_max_probs"]
 
     def __init__(
             self, d_expression, allow_self_connections=True, safe=True,
@@ -55,6 +61,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             safe, verbose)
         self._d_expression = d_expression
         self._allow_self_connections = allow_self_connections
+        self._max_probs = None
 
         if n_connections is not None:
             raise NotImplementedError(
@@ -66,28 +73,45 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             self, pre_population, post_population, rng, machine_time_step):
         AbstractConnector.set_projection_information(
             self, pre_population, post_population, rng, machine_time_step)
-        self._set_probabilities()
+        self._max_probs = None
 
-    def _set_probabilities(self):
-        # Set the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
-        expand_distances = self._expand_distances(self._d_expression)
-        pre_positions = self._pre_population.positions
-        post_positions = self._post_population.positions
+    def _get_probabilities(self, distances):
+        """ Evaluate the distance expression on a block of distances
 
-        d1 = self._space.distances(
-            pre_positions, post_positions, expand_distances)
+        :param distances: The distances of the block, as from\
+            :py:class:`DistanceCache`
+        :return: the probability of each connection of the block, by\
+            pre-neuron and then post-neuron
+        :rtype: numpy.ndarray
+        """
+        probs = _d_expr_context.eval(self._d_expression, d=distances)
+        return numpy.broadcast_to(probs, distances.shape[-2:])
 
-        # PyNN 0.8 returns a flattened (C-style) array from space.distances,
-        # so the easiest thing to do here is to reshape back to the "expected"
-        # PyNN 0.7 shape; otherwise later code gets confusing and difficult
-        if (len(d1.shape) == 1):
-            d = numpy.reshape(d1, (pre_positions.shape[0],
-                                   post_positions.shape[0]))
-        else:
-            d = d1
+    def _get_max_probs(self):
+        """ Get the maximum probability of a connection to each post-neuron.\
+            These are found in a single pass over blocks of pre-neurons, so\
+            the probabilities of the whole projection are never held at once.
 
-        self._probs = _d_expr_context.eval(self._d_expression, d=d)
+        :rtype: numpy.ndarray
+        """
+        if self._max_probs is None:
+            expand_distances = self._expand_distances(self._d_expression)
+            post_slice = Slice(0, self._n_post_neurons - 1)
+            n_pre_per_block = max(
+                1, _MAX_PROBABILITIES_PER_BLOCK // self._n_post_neurons)
+            max_probs = numpy.full(self._n_post_neurons, -numpy.inf)
+            for lo_atom in range(0, self._n_pre_neurons, n_pre_per_block):
+                pre_slice = Slice(lo_atom, min(
+                    lo_atom + n_pre_per_block, self._n_pre_neurons) - 1)
+                probs = self._get_probabilities(
+                    DistanceCache.compute_distances(
+                        self._space, self._pre_population,
+                        self._post_population, pre_slice, post_slice,
+                        expand_distances))
+                numpy.maximum(max_probs, numpy.amax(probs, axis=0),
+                              out=max_probs)
+            self._max_probs = max_probs
+        return self._max_probs
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, delays):
@@ -96,14 +120,14 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             utility_calls.get_probable_maximum_selected(
                 self._n_pre_neurons * self._n_post_neurons,
                 self._n_pre_neurons * self._n_post_neurons,
-                numpy.amax(self._probs)))
+                numpy.amax(self._get_max_probs())))
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, delays, post_vertex_slice, min_delay=None, max_delay=None):
         # pylint: disable=too-many-arguments
         max_prob = numpy.amax(
-            self._probs[0:self._n_pre_neurons, post_vertex_slice.as_slice])
+            self._get_max_probs()[post_vertex_slice.as_slice])
         n_connections = utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons,
             post_vertex_slice.n_atoms, max_prob)
@@ -120,7 +144,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         # pylint: disable=too-many-arguments
         return utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons, self._n_post_neurons,
-            numpy.amax(self._probs))
+            numpy.amax(self._get_max_probs()))
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, weights):
@@ -130,7 +154,16 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             utility_calls.get_probable_maximum_selected(
                 self._n_pre_neurons * self._n_post_neurons,
                 self._n_pre_neurons * self._n_post_neurons,
-                numpy.amax(self._probs)))
+                numpy.amax(self._get_max_probs())))
+
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        # The distances are kept in the cache for when the block is created
+        return bool(numpy.any(self._get_probabilities(
+            DistanceCache.shared().get_distances(
+                self._space, self._pre_population, self._post_population,
+                pre_vertex_slice, post_vertex_slice,
+                self._expand_distances(self._d_expression))) > 0))
 
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
@@ -138,30 +171,25 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
 
-        probs = self._probs[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
-        n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
-        items = self._rng.next(n_items)
-
-        # If self connections are not allowed, remove the possibility of
-        # self connections by setting them to a value of infinity
-        if not self._allow_self_connections:
-            items[0:n_items:post_vertex_slice.n_atoms + 1] = numpy.inf
-
-        present = items < probs
-        ids = numpy.where(present)[0]
-        n_connections = numpy.sum(present)
+        probs = self._get_probabilities(DistanceCache.shared().get_distances(
+            self._space, self._pre_population, self._post_population,
+            pre_vertex_slice, post_vertex_slice,
+            self._expand_distances(self._d_expression)))
+        sources, targets = self._sample_connections(
+            probs, pre_vertex_slice, post_vertex_slice,
+            self._allow_self_connections)
+        n_connections = len(sources)
 
         block = numpy.zeros(
             n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
-        block["source"] = (
-            (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
-        block["target"] = (
-            (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
+        block["source"] = sources
+        block["target"] = targets
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -184,3 +212,4 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     @d_expression.setter
     def d_expression(self, new_value):
         self._d_expression = new_value
+        self._max_probs = None
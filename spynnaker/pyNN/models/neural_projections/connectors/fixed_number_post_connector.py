@@ -72,6 +72,10 @@ class FixedNumberPostConnector(AbstractConnector):
         n_connections = self._n_pre_neurons * self._n_post
         return self._get_delay_maximum(delays, n_connections)
 
+    @overrides(AbstractConnector.prepare_synaptic_blocks)
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        self._get_post_neurons()
+
     def _get_post_neurons(self):
         # If we haven't set the array up yet, do it now
         if not self._post_neurons_set:
@@ -198,9 +202,11 @@ class FixedNumberPostConnector(AbstractConnector):
         block["source"] = pre_neurons_in_slice
         block["target"] = post_neurons_in_slice
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
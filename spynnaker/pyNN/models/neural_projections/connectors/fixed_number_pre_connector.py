@@ -75,6 +75,10 @@ class FixedNumberPreConnector(AbstractConnector):
         return self._get_delay_maximum(
             delays, self._n_pre * self._n_post_neurons)
 
+    @overrides(AbstractConnector.prepare_synaptic_blocks)
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        self._get_pre_neurons()
+
     def _get_pre_neurons(self):
         # If we haven't set the array up yet, do it now
         if not self._pre_neurons_set:
@@ -203,9 +207,11 @@ class FixedNumberPreConnector(AbstractConnector):
         block["target"] = post_neurons_in_slice
 
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
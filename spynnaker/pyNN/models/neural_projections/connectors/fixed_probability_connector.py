@@ -86,33 +86,30 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine):
             self._n_pre_neurons * self._n_post_neurons, self._p_connect)
         return self._get_weight_maximum(weights, n_connections)
 
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        return self._p_connect > 0
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, weights, delays, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
-        items = self._rng.next(n_items)
-
-        # If self connections are not allowed, remove possibility the self
-        # connections by setting them to a value of infinity
-        if not self._allow_self_connections:
-            items[0:n_items:post_vertex_slice.n_atoms + 1] = numpy.inf
-
-        present = items < self._p_connect
-        ids = numpy.where(present)[0]
-        n_connections = numpy.sum(present)
+        sources, targets = self._sample_connections(
+            self._p_connect, pre_vertex_slice, post_vertex_slice,
+            self._allow_self_connections)
+        n_connections = len(sources)
 
         block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
-        block["source"] = (
-            (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
-        block["target"] = (
-            (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
+        block["source"] = sources
+        block["target"] = targets
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -23,7 +23,10 @@ class FromListConnector(AbstractConnector):
         "_weights",
         "_delays",
         "_extra_parameters",
-        "_extra_parameter_names"]
+        "_extra_parameter_names",
+        "_target_order",
+        "_sorted_targets",
+        "_post_slice_index"]
 
     def __init__(self, conn_list, safe=True, verbose=False, column_names=None):
         """
@@ -66,19 +69,15 @@ class FromListConnector(AbstractConnector):
     def get_n_connections_from_pre_vertex_maximum(
             self, delays, post_vertex_slice, min_delay=None, max_delay=None):
 
-        mask = None
+        # Only the connections to the post slice need to be looked at
+        post_order, post_sources = self._get_post_slice_index(
+            post_vertex_slice)
         if min_delay is None or max_delay is None or self._delays is None:
-            mask = ((self._targets >= post_vertex_slice.lo_atom) &
-                    (self._targets <= post_vertex_slice.hi_atom))
-        elif self._delays is not None:
-            mask = ((self._targets >= post_vertex_slice.lo_atom) &
-                    (self._targets <= post_vertex_slice.hi_atom) &
-                    (self._delays >= min_delay) &
-                    (self._delays <= max_delay))
-        if mask is None:
-            sources = self._sources
+            sources = post_sources
         else:
-            sources = self._sources[mask]
+            list_delays = self._delays[post_order]
+            sources = post_sources[
+                (list_delays >= min_delay) & (list_delays <= max_delay)]
         if sources.size == 0:
             return 0
         max_targets = numpy.max(numpy.bincount(
@@ -126,35 +125,71 @@ class FromListConnector(AbstractConnector):
         else:
             return numpy.var(numpy.abs(self._weights))
 
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        _, post_sources = self._get_post_slice_index(post_vertex_slice)
+        start, end = numpy.searchsorted(
+            post_sources,
+            [pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1])
+        return end > start
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, weights, delays, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        mask = ((self._sources >= pre_vertex_slice.lo_atom) &
-                (self._sources <= pre_vertex_slice.hi_atom) &
-                (self._targets >= post_vertex_slice.lo_atom) &
-                (self._targets <= post_vertex_slice.hi_atom))
-        sources = self._sources[mask]
+        post_order, post_sources = self._get_post_slice_index(
+            post_vertex_slice)
+        start, end = numpy.searchsorted(
+            post_sources,
+            [pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1])
+        mask = post_order[start:end]
+        sources = post_sources[start:end]
         block = numpy.zeros(sources.size, dtype=self.NUMPY_SYNAPSES_DTYPE)
         block["source"] = sources
         block["target"] = self._targets[mask]
         # check that conn_list has weights, if not then use the value passed in
         if self._weights is None:
             block["weight"] = self._generate_weights(
-                weights, sources.size, None)
+                weights, sources.size, None, pre_vertex_slice,
+                post_vertex_slice, block["source"], block["target"])
         else:
             block["weight"] = self._weights[mask]
         # check that conn_list has delays, if not then use the value passed in
         if self._delays is None:
             block["delay"] = self._generate_delays(
-                delays, sources.size, None)
+                delays, sources.size, None, pre_vertex_slice,
+                post_vertex_slice, block["source"], block["target"])
         else:
             block["delay"] = self._clip_delays(self._delays[mask])
         block["synapse_type"] = synapse_type
         return block
 
+    def _get_post_slice_index(self, post_vertex_slice):
+        """ Get the indices of the connections that target the given post\
+            slice, ordered by source, along with the sorted sources of those\
+            connections.  The result is cached per slice, so that each block\
+            extraction only needs a binary search on the pre slice.
+
+        :param post_vertex_slice: The slice of the post vertex
+        :return: tuple of (indices into the connection list, sorted sources)
+        """
+        key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if key not in self._post_slice_index:
+            start, end = numpy.searchsorted(
+                self._sorted_targets, [key[0], key[1] + 1])
+
+            # The index is sorted by (target, source), so a stable sort on
+            # source here keeps the connections to each source in target order
+            post_order = self._target_order[start:end]
+            source_order = numpy.argsort(
+                self._sources[post_order], kind="mergesort")
+            post_order = post_order[source_order]
+            self._post_slice_index[key] = (
+                post_order, self._sources[post_order])
+        return self._post_slice_index[key]
+
     def __repr__(self):
         return "FromListConnector(n_connections={})".format(
             len(self._sources))
@@ -207,6 +242,12 @@ class FromListConnector(AbstractConnector):
         self._sources = self._conn_list[:, _SOURCE]
         self._targets = self._conn_list[:, _TARGET]
 
+        # Index the connections by (target, source) once, so that each
+        # slice of the list can be found without scanning the whole list
+        self._target_order = numpy.lexsort((self._sources, self._targets))
+        self._sorted_targets = self._targets[self._target_order]
+        self._post_slice_index = dict()
+
         # Find any weights
         self._weights = None
         try:
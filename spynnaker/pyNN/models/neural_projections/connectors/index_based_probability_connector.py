@@ -97,6 +97,12 @@ class IndexBasedProbabilityConnector(AbstractConnector):
             numpy.amax(self._probs))
         return self._get_weight_maximum(weights, n_connections)
 
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        self._update_probs_from_index_expression()
+        return bool(numpy.any(self._probs[
+            pre_vertex_slice.as_slice, post_vertex_slice.as_slice] > 0))
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, weights, delays, pre_slices, pre_slice_index, post_slices,
@@ -110,7 +116,7 @@ class IndexBasedProbabilityConnector(AbstractConnector):
             pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
 
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
-        items = self._rng.next(n_items)
+        items = self._get_sampling_rng().uniform(size=n_items)
 
         # If self connections are not allowed, remove the possibility of self
         # connections by setting the probability to a value of infinity
@@ -128,9 +134,11 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         block["target"] = (
             (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -75,6 +75,10 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
             self._pre_slices = pre_slices
             self._post_slices = post_slices
 
+    @overrides(AbstractConnector.prepare_synaptic_blocks)
+    def prepare_synaptic_blocks(self, pre_slices, post_slices):
+        self._update_synapses_per_post_vertex(pre_slices, post_slices)
+
     def _get_n_connections(self, pre_slice_index, post_slice_index):
         index = (len(self._post_slices) * pre_slice_index) + post_slice_index
         return self._synapses_per_edge[index]
@@ -147,7 +151,7 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
 
         # Now do the actual random choice from the available connections
         try:
-            chosen = numpy.random.choice(
+            chosen = self._get_sampling_rng().choice(
                 pairs.shape[0], size=n_connections,
                 replace=self._with_replacement)
         except Exception as e:
@@ -160,9 +164,11 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
         block["source"] = pairs[chosen, 0]
         block["target"] = pairs[chosen, 1]
         block["weight"] = self._generate_weights(
-            weights, n_connections, [connection_slice])
+            weights, n_connections, [connection_slice], pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, [connection_slice])
+            delays, n_connections, [connection_slice], pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -56,6 +56,11 @@ class OneToOneConnector(AbstractGenerateConnectorOnMachine):
         return self._get_weight_maximum(
             weights, max((self._n_pre_neurons, self._n_post_neurons)))
 
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        return (pre_vertex_slice.hi_atom >= post_vertex_slice.lo_atom and
+                pre_vertex_slice.lo_atom <= post_vertex_slice.hi_atom)
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, weights, delays, pre_slices, pre_slice_index, post_slices,
@@ -74,9 +79,11 @@ class OneToOneConnector(AbstractGenerateConnectorOnMachine):
         block["source"] = numpy.arange(max_lo_atom, min_hi_atom + 1)
         block["target"] = numpy.arange(max_lo_atom, min_hi_atom + 1)
         block["weight"] = self._generate_weights(
-            weights, n_connections, [connection_slice])
+            weights, n_connections, [connection_slice], pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, [connection_slice])
+            delays, n_connections, [connection_slice], pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
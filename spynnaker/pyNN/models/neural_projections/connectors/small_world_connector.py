@@ -98,17 +98,20 @@ class SmallWorldConnector(AbstractConnector):
         block["target"] = (
             (ids[1] % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None, pre_vertex_slice,
+            post_vertex_slice, block["source"], block["target"])
         block["synapse_type"] = synapse_type
 
         # Re-wire some connections
+        rng = self._get_sampling_rng()
         rewired = numpy.where(
-            self._rng.next(n_connections) < self._rewiring)[0]
+            rng.uniform(size=n_connections) < self._rewiring)[0]
         block["target"][rewired] = (
-            (self._rng.next(rewired.size) * (post_vertex_slice.n_atoms - 1)) +
-            post_vertex_slice.lo_atom)
+            (rng.uniform(size=rewired.size) *
+             (post_vertex_slice.n_atoms - 1)) + post_vertex_slice.lo_atom)
 
         return block
 
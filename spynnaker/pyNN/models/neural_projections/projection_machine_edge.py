@@ -4,8 +4,6 @@ from pacman.model.graphs.machine import MachineEdge
 from spinn_front_end_common.utilities import globals_variables
 from spinn_front_end_common.interface.provenance import (
     AbstractProvidesLocalProvenanceData)
-from spynnaker.pyNN.models.neural_projections.connectors import (
-    OneToOneConnector)
 from spynnaker.pyNN.models.abstract_models import (
     AbstractWeightUpdatable, AbstractFilterableEdge)
 
@@ -32,19 +30,17 @@ class ProjectionMachineEdge(
 
     @overrides(AbstractFilterableEdge.filter_edge)
     def filter_edge(self, graph_mapper):
-        # Filter one-to-one connections that are out of range
-        # Note: there may be other connectors stored on the same edge!
-        n_filtered = 0
+        # Filter the edge if none of the connectors stored on it could make
+        # a connection between the slices it joins
+        pre_vertex_slice = graph_mapper.get_slice(self.pre_vertex)
+        post_vertex_slice = graph_mapper.get_slice(self.post_vertex)
+        if any(synapse_info.connector.could_connect(
+                pre_vertex_slice, post_vertex_slice)
+                for synapse_info in self._synapse_information):
+            return False
         for synapse_info in self._synapse_information:
-            if isinstance(synapse_info.connector, OneToOneConnector):
-                pre_lo = graph_mapper.get_slice(self.pre_vertex).lo_atom
-                pre_hi = graph_mapper.get_slice(self.pre_vertex).hi_atom
-                post_lo = graph_mapper.get_slice(self.post_vertex).lo_atom
-                post_hi = graph_mapper.get_slice(self.post_vertex).hi_atom
-                if pre_hi < post_lo or pre_lo > post_hi:
-                    n_filtered += 1
-
-        return (n_filtered == len(self._synapse_information))
+            synapse_info.connector.add_filtered_edge()
+        return True
 
     @overrides(AbstractWeightUpdatable.update_weight)
     def update_weight(self, graph_mapper):
@@ -1,3 +1,4 @@
+from collections import defaultdict
 import logging
 import os
 import math
@@ -21,6 +22,9 @@ from spinn_front_end_common.interface.simulation import simulation_utilities
 from spinn_front_end_common.interface.buffer_management import (
     recording_utilities)
 from spinn_front_end_common.interface.profiling import profile_utils
+from spinn_front_end_common.interface.provenance import (
+    AbstractProvidesLocalProvenanceData)
+from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
 from .synaptic_manager import SynapticManager
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, AbstractNeuronRecordable, NeuronRecorder)
@@ -59,18 +63,21 @@ class AbstractPopulationVertex(
         AbstractPopulationInitializable, AbstractPopulationSettable,
         AbstractChangableAfterRun,
         AbstractRewritesDataSpecification, AbstractReadParametersBeforeSet,
-        AbstractAcceptsIncomingSynapses, ProvidesKeyToAtomMappingImpl):
+        AbstractAcceptsIncomingSynapses, ProvidesKeyToAtomMappingImpl,
+        AbstractProvidesLocalProvenanceData):
     """ Underlying vertex model for Neural Populations.
     """
     __slots__ = [
         "_buffer_size_before_receive",
         "_change_requires_mapping",
-        "_change_requires_neuron_parameters_reload",
         "_incoming_spike_buffer_size",
         "_maximum_sdram_for_buffering",
         "_minimum_buffer_sdram",
         "_n_atoms",
+        "_n_parameter_readbacks",
+        "_n_parameter_reloads",
         "_n_profile_samples",
+        "_n_recording_clears",
         "_neuron_impl",
         "_neuron_recorder",
         "_parameters",
@@ -164,7 +171,14 @@ class AbstractPopulationVertex(
 
         # bool for if state has changed.
         self._change_requires_mapping = True
-        self._change_requires_neuron_parameters_reload = False
+
+        # The number of times that the neuron parameters of a core have been
+        # read back and reloaded after the first run
+        self._n_parameter_readbacks = 0
+        self._n_parameter_reloads = 0
+
+        # The number of times each recording region has been cleared
+        self._n_recording_clears = defaultdict(int)
 
         # Set up for profiling
         self._n_profile_samples = helpful_functions.read_config_int(
@@ -408,6 +422,12 @@ class AbstractPopulationVertex(
             self._parameters, self._state_variables, vertex_slice)
         spec.write_array(neuron_data)
 
+        # The parameters of the slice now match those on the machine
+        self._parameters.mark_clean(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+        self._state_variables.mark_clean(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+
     @inject_items({
         "machine_time_step": "MachineTimeStep",
         "time_scale_factor": "TimeScaleFactor",
@@ -424,9 +444,15 @@ class AbstractPopulationVertex(
         # pylint: disable=too-many-arguments, arguments-differ
         vertex_slice = graph_mapper.get_slice(placement.vertex)
 
+        # If nothing on this core has changed, write no regions, so that
+        # nothing is written to the machine
+        if not self._is_slice_changed(vertex_slice):
+            spec.end_specification()
+            return
+        self._n_parameter_reloads += 1
+
         # reserve the neuron parameters data region
-        self._reserve_neuron_params_data_region(
-            spec, graph_mapper.get_slice(placement.vertex))
+        self._reserve_neuron_params_data_region(spec, vertex_slice)
 
         # write the neuron params into the new DSG region
         self._write_neuron_parameters(
@@ -442,11 +468,26 @@ class AbstractPopulationVertex(
     @overrides(AbstractRewritesDataSpecification
                .requires_memory_regions_to_be_reloaded)
     def requires_memory_regions_to_be_reloaded(self):
-        return self._change_requires_neuron_parameters_reload
+        return (self._parameters.is_dirty() or
+                self._state_variables.is_dirty())
 
     @overrides(AbstractRewritesDataSpecification.mark_regions_reloaded)
     def mark_regions_reloaded(self):
-        self._change_requires_neuron_parameters_reload = False
+        self._parameters.mark_clean()
+        self._state_variables.mark_clean()
+
+    def _is_slice_changed(self, vertex_slice):
+        """ Determine if any parameter or state variable of the neurons of a\
+            slice has changed since the slice was last written
+
+        :param vertex_slice: The slice of the neurons
+        :rtype: bool
+        """
+        return (
+            self._parameters.is_dirty(
+                vertex_slice.lo_atom, vertex_slice.hi_atom + 1) or
+            self._state_variables.is_dirty(
+                vertex_slice.lo_atom, vertex_slice.hi_atom + 1))
 
     @inject_items({
         "machine_time_step": "MachineTimeStep",
@@ -558,6 +599,15 @@ class AbstractPopulationVertex(
             self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
             placements, graph_mapper, self, machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.get_spikes_since)
+    def get_spikes_since(
+            self, first_machine_time_step, placements, graph_mapper,
+            buffer_manager, machine_time_step):
+        return self._neuron_recorder.get_spikes(
+            self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
+            placements, graph_mapper, self, machine_time_step,
+            first_machine_time_step=first_machine_time_step)
+
     @overrides(AbstractNeuronRecordable.get_recordable_variables)
     def get_recordable_variables(self):
         return self._neuron_recorder.get_recordable_variables()
@@ -585,6 +635,32 @@ class AbstractPopulationVertex(
             self.label, buffer_manager, index, placements, graph_mapper,
             self, variable, n_machine_time_steps)
 
+    @overrides(AbstractNeuronRecordable.get_data_since)
+    def get_data_since(self, variable, first_machine_time_step,
+                       n_machine_time_steps, placements, graph_mapper,
+                       buffer_manager, machine_time_step):
+        # pylint: disable=too-many-arguments
+        index = 0
+        if variable != "spikes":
+            index = 1 + self._neuron_impl.get_recordable_variable_index(
+                variable)
+        return self._neuron_recorder.get_matrix_data(
+            self.label, buffer_manager, index, placements, graph_mapper,
+            self, variable, n_machine_time_steps, first_machine_time_step)
+
+    @overrides(AbstractNeuronRecordable.iter_data)
+    def iter_data(self, variable, n_machine_time_steps, placements,
+                  graph_mapper, buffer_manager, machine_time_step,
+                  chunk_steps):
+        # pylint: disable=too-many-arguments
+        index = 0
+        if variable != "spikes":
+            index = 1 + self._neuron_impl.get_recordable_variable_index(
+                variable)
+        return self._neuron_recorder.iter_matrix_data(
+            self.label, buffer_manager, index, placements, graph_mapper,
+            self, variable, n_machine_time_steps, chunk_steps)
+
     @overrides(AbstractNeuronRecordable.get_neuron_sampling_interval)
     def get_neuron_sampling_interval(self, variable):
         return self._neuron_recorder.get_neuron_sampling_interval(variable)
@@ -600,7 +676,6 @@ class AbstractPopulationVertex(
                 "Vertex does not support initialisation of"
                 " parameter {}".format(variable))
         self._state_variables.set_value(variable, value)
-        self._change_requires_neuron_parameters_reload = True
 
     @property
     def initialize_parameters(self):
@@ -668,33 +743,35 @@ class AbstractPopulationVertex(
                 "Population {} does not have parameter {}".format(
                     self._neuron_impl.model_name, key))
         self._parameters.set_value(key, value)
-        self._change_requires_neuron_parameters_reload = True
 
     @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
     def read_parameters_from_machine(
             self, transceiver, placement, vertex_slice):
+        region, offset, n_bytes = self.get_parameters_location(vertex_slice)
 
         # locate SDRAM address to where the neuron parameters are stored
         neuron_region_sdram_address = \
             helpful_functions.locate_memory_region_for_placement(
-                placement,
-                constants.POPULATION_BASED_REGIONS.NEURON_PARAMS.value,
-                transceiver)
+                placement, region, transceiver)
+
+        # get data from the machine
+        byte_array = transceiver.read_memory(
+            placement.x, placement.y, neuron_region_sdram_address + offset,
+            n_bytes)
+        self.update_parameters_from_data(byte_array, vertex_slice)
+
+    @overrides(AbstractReadParametersBeforeSet.get_parameters_location)
+    def get_parameters_location(self, vertex_slice):
 
         # shift past the extra stuff before neuron parameters that we don't
         # need to read
-        neuron_parameters_sdram_address = (
-            neuron_region_sdram_address +
-            self.BYTES_TILL_START_OF_GLOBAL_PARAMETERS)
-
-        # get size of neuron params
         size_of_region = self._get_sdram_usage_for_neuron_params(vertex_slice)
         size_of_region -= self.BYTES_TILL_START_OF_GLOBAL_PARAMETERS
+        return (constants.POPULATION_BASED_REGIONS.NEURON_PARAMS.value,
+                self.BYTES_TILL_START_OF_GLOBAL_PARAMETERS, size_of_region)
 
-        # get data from the machine
-        byte_array = transceiver.read_memory(
-            placement.x, placement.y, neuron_parameters_sdram_address,
-            size_of_region)
+    @overrides(AbstractReadParametersBeforeSet.update_parameters_from_data)
+    def update_parameters_from_data(self, data, vertex_slice):
 
         # Skip the recorder globals as these are not change on machine
         # Just written out in case data is changed and written back
@@ -703,9 +780,16 @@ class AbstractPopulationVertex(
 
         # update python neuron parameters with the data
         self._neuron_impl.read_data(
-            byte_array, offset, vertex_slice, self._parameters,
+            data, offset, vertex_slice, self._parameters,
             self._state_variables)
 
+        # The values read match those on the machine, so are not changes
+        self._parameters.mark_clean(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+        self._state_variables.mark_clean(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+        self._n_parameter_readbacks += 1
+
     @property
     def weight_scale(self):
         return self._neuron_impl.get_global_weight_scale()
@@ -756,6 +840,22 @@ class AbstractPopulationVertex(
             extra_monitor_cores_for_router_timeout,
             handle_time_out_configuration, fixed_routes)
 
+    @overrides(AbstractAcceptsIncomingSynapses.read_connections_from_machine)
+    def read_connections_from_machine(
+            self, transceiver, placement, machine_edges_and_synapse_infos,
+            graph_mapper, routing_infos, using_extra_monitor_cores,
+            placements=None, data_receiver=None,
+            sender_extra_monitor_core_placement=None,
+            extra_monitor_cores_for_router_timeout=None,
+            handle_time_out_configuration=True, fixed_routes=None):
+        # pylint: disable=too-many-arguments
+        self._synapse_manager.read_connections_from_machine(
+            transceiver, placement, machine_edges_and_synapse_infos,
+            graph_mapper, routing_infos, using_extra_monitor_cores,
+            placements, data_receiver, sender_extra_monitor_core_placement,
+            extra_monitor_cores_for_router_timeout,
+            handle_time_out_configuration, fixed_routes)
+
     def clear_connection_cache(self):
         self._synapse_manager.clear_connection_cache()
 
@@ -787,12 +887,13 @@ class AbstractPopulationVertex(
         AbstractNeuronRecordable.clear_recording)
     def clear_recording(
             self, variable, buffer_manager, placements, graph_mapper):
-        index = 0
-        if variable != "spikes":
-            index = 1 + self._neuron_impl.get_recordable_variable_index(
-                variable)
         self._clear_recording_region(
-            buffer_manager, placements, graph_mapper, index)
+            buffer_manager, placements, graph_mapper,
+            self._get_recording_region(variable))
+
+    @overrides(AbstractNeuronRecordable.get_n_recording_clears)
+    def get_n_recording_clears(self, variable):
+        return self._n_recording_clears[self._get_recording_region(variable)]
 
     @overrides(AbstractSpikeRecordable.clear_spike_recording)
     def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
@@ -800,6 +901,21 @@ class AbstractPopulationVertex(
             buffer_manager, placements, graph_mapper,
             AbstractPopulationVertex.SPIKE_RECORDING_REGION)
 
+    @overrides(AbstractSpikeRecordable.get_n_spike_recording_clears)
+    def get_n_spike_recording_clears(self):
+        return self._n_recording_clears[
+            AbstractPopulationVertex.SPIKE_RECORDING_REGION]
+
+    def _get_recording_region(self, variable):
+        """ Get the recording region of a variable
+
+        :param variable: the variable name, or "spikes"
+        :rtype: int
+        """
+        if variable == "spikes":
+            return AbstractPopulationVertex.SPIKE_RECORDING_REGION
+        return 1 + self._neuron_impl.get_recordable_variable_index(variable)
+
     def _clear_recording_region(
             self, buffer_manager, placements, graph_mapper,
             recording_region_id):
@@ -816,6 +932,7 @@ class AbstractPopulationVertex(
             placement = placements.get_placement_of_vertex(machine_vertex)
             buffer_manager.clear_recorded_data(
                 placement.x, placement.y, placement.p, recording_region_id)
+        self._n_recording_clears[recording_region_id] += 1
 
     @overrides(AbstractContainsUnits.get_units)
     def get_units(self, variable):
@@ -857,5 +974,15 @@ class AbstractPopulationVertex(
     def __repr__(self):
         return self.__str__()
 
+    @overrides(AbstractProvidesLocalProvenanceData.get_local_provenance_data)
+    def get_local_provenance_data(self):
+        return [
+            ProvenanceDataItem(
+                [self.label, "Times_neuron_parameters_read_back"],
+                self._n_parameter_readbacks),
+            ProvenanceDataItem(
+                [self.label, "Times_neuron_parameters_reloaded"],
+                self._n_parameter_reloads)]
+
     def gen_on_machine(self, vertex_slice):
         return self._synapse_manager.gen_on_machine(vertex_slice)
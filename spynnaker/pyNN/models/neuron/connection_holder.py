@@ -1,5 +1,6 @@
 import numpy
 from numpy.lib.recfunctions import merge_arrays
+import scipy.sparse  # @UnresolvedImport
 
 
 class ConnectionHolder(object):
@@ -34,11 +35,19 @@ class ConnectionHolder(object):
 
         # A callback to call with the data when finished
         "_notify",
+
+        # True if the values should be returned as sparse matrices, rather
+        # than dense ones, when not returned as a list
+        "_as_sparse",
+
+        # True if a list should be sorted by source and then target
+        "_sort",
     )
 
     def __init__(
             self, data_items_to_return, as_list, n_pre_atoms, n_post_atoms,
-            connections=None, fixed_values=None, notify=None):
+            connections=None, fixed_values=None, notify=None,
+            as_sparse=False, sort=True):
         """
 
         :param data_items_to_return: A list of data fields to be returned
@@ -61,6 +70,14 @@ class ConnectionHolder(object):
             A callback to call when the connections have all been added.\
             This should accept a single parameter, which will contain the\
             data requested
+        :param as_sparse:\
+            True if the data is to be returned as sparse matrices, in which\
+            the weights of connections with the same source and target are\
+            summed, and the largest of any other value is kept; ignored if\
+            as_list is True
+        :param sort:\
+            True if a list is to be sorted by source and then target; if\
+            False, the connections are returned in the order they were read
         """
         # pylint: disable=too-many-arguments
         self._data_items_to_return = data_items_to_return
@@ -71,6 +88,8 @@ class ConnectionHolder(object):
         self._data_items = None
         self._notify = notify
         self._fixed_values = fixed_values
+        self._as_sparse = as_sparse
+        self._sort = sort
 
     def add_connections(self, connections):
         """ Add connections to the holder to be returned
@@ -147,25 +166,24 @@ class ConnectionHolder(object):
         # If we are returning a list...
         if self._as_list:
 
-            # ...sort by source then target
-            order = numpy.lexsort(
-                (connections["target"], connections["source"]))
+            # ...sort by source then target if requested
+            if self._sort:
+                connections = connections[numpy.lexsort(
+                    (connections["target"], connections["source"]))]
 
             # There are no specific items to return, so just get
             # all the data
             if (self._data_items_to_return is None or
                     not self._data_items_to_return):
-                self._data_items = connections[order]
+                self._data_items = connections
 
             # There is more than one item to return, so let numpy do its magic
             elif len(self._data_items_to_return) > 1:
-                self._data_items = \
-                    connections[order][self._data_items_to_return]
+                self._data_items = connections[self._data_items_to_return]
 
             # There is 1 item to return, so make sure only one item exists
             else:
-                self._data_items = \
-                    connections[order][self._data_items_to_return[0]]
+                self._data_items = connections[self._data_items_to_return[0]]
 
         else:
 
@@ -175,6 +193,10 @@ class ConnectionHolder(object):
             # Keep track of the matrices
             merged_connections = list()
             for item in self._data_items_to_return:
+                if self._as_sparse:
+                    merged_connections.append(
+                        self._get_sparse_matrix(connections, item))
+                    continue
 
                 # Build an empty matrix and fill it with NAN
                 matrix = numpy.empty((self._n_pre_atoms, self._n_post_atoms))
@@ -199,6 +221,38 @@ class ConnectionHolder(object):
 
         return self._data_items
 
+    def _get_sparse_matrix(self, connections, item):
+        """ Build a sparse matrix of the values of a field of the connections,\
+            summing the weights of connections with the same source and\
+            target, and keeping the largest of any other value
+
+        :param connections: The merged connections
+        :param item: The name of the field to put in the matrix
+        :rtype: :py:class:`scipy.sparse.csr_matrix`
+        """
+        sources = connections["source"]
+        targets = connections["target"]
+        values = connections[item].astype("float64")
+
+        # Only weights add up; summing e.g. the delays of connections with
+        # the same source and target would give a delay none of them has
+        if item != "weight" and len(values):
+            order = numpy.lexsort((values, targets, sources))
+            sources = sources[order]
+            targets = targets[order]
+            values = values[order]
+            last = numpy.ones(len(values), dtype="bool")
+            last[:-1] = (
+                (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1]))
+            sources = sources[last]
+            targets = targets[last]
+            values = values[last]
+
+        # Conversion to CSR sums the duplicate entries of the COO matrix
+        return scipy.sparse.coo_matrix(
+            (values, (sources, targets)),
+            shape=(self._n_pre_atoms, self._n_post_atoms)).tocsr()
+
     def __getitem__(self, s):
         data = self._get_data_items()
         return data[s]
@@ -2,7 +2,8 @@ import numpy
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.ranged.ranged_list import RangedList
 from spinn_front_end_common.utilities.globals_variables import get_simulator
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to_array, convert_from_array)
 
 
 class Struct(object):
@@ -70,24 +71,19 @@ class Struct(object):
         for i, (values, data_type) in enumerate(zip(values, self.field_types)):
 
             if is_singleton(values):
-                data_value = convert_to(values, data_type)
-                data["f" + str(i)] = data_value
+                data["f" + str(i)] = convert_to_array(values, data_type)
             elif not isinstance(values, RangedList):
-                data_value = [convert_to(v, data_type)
-                              for v in values[offset:(offset + array_size)]]
-                data["f" + str(i)] = data_value
+                data["f" + str(i)] = convert_to_array(
+                    values[offset:(offset + array_size)], data_type)
             else:
                 for start, end, value in values.iter_ranges_by_slice(
                         offset, offset + array_size):
 
                     # Get the values and get them into the correct data type
                     if get_simulator().is_a_pynn_random(value):
-                        values = value.next(end - start)
-                        data_value = [convert_to(v, data_type) for v in values]
-                    else:
-                        data_value = convert_to(value, data_type)
-                    data["f" + str(i)][
-                        start - offset:end - offset] = data_value
+                        value = value.next(end - start)
+                    data["f" + str(i)][start - offset:end - offset] = \
+                        convert_to_array(value, data_type)
 
         # Pad to whole number of uint32s
         overflow = (array_size * self.numpy_dtype.itemsize) % 4
@@ -126,9 +122,8 @@ class Struct(object):
             for i, data_type in enumerate(self.field_types):
 
                 # Get the data to set for this item
-                values = numpy_data["f" + str(i)]
-
-                items_to_return.append(values / float(data_type.scale))
+                items_to_return.append(convert_from_array(
+                    numpy_data["f" + str(i)], data_type))
 
             # Return values read
             return items_to_return
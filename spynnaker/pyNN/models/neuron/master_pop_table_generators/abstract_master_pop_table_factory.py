@@ -30,6 +30,32 @@ class AbstractMasterPopTableFactory(object):
         :return: a synaptic matrix memory position.
         """
 
+    def extract_synaptic_matrix_data_locations(
+            self, incoming_keys, master_pop_base_mem_address, txrx, chip_x,
+            chip_y):
+        """ Get the synaptic matrix memory positions of several keys at once
+
+        :param incoming_keys: \
+            the source keys which the synaptic matrices need to be mapped to
+        :param master_pop_base_mem_address: the base address of the master pop
+        :param txrx: the transceiver object
+        :param chip_y: the y coordinate of the chip of this master pop
+        :param chip_x: the x coordinate of the chip of this master pop
+        :type incoming_keys: iterable(int)
+        :return: a list of the synaptic matrix memory positions of each key,\
+            in the same order as the keys
+        """
+        return [
+            self.extract_synaptic_matrix_data_location(
+                key, master_pop_base_mem_address, txrx, chip_x, chip_y)
+            for key in incoming_keys]
+
+    def clear_read_tables(self):
+        """ Forget any tables read from the machine, so that they are read\
+            again the next time a location is extracted; this must be done\
+            whenever the tables on the machine might have changed
+        """
+
     @abstractmethod
     def update_master_population_table(
             self, spec, block_start_addr, row_length, key_and_mask,
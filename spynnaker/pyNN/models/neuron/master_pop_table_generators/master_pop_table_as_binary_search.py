@@ -67,7 +67,8 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
     __slots__ = [
         "_entries",
         "_n_addresses",
-        "_n_single_entries"]
+        "_n_single_entries",
+        "_read_tables"]
 
     # Switched ordering of count and start as numpy will switch them back
     # when asked for view("<4")
@@ -87,6 +88,7 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
         self._entries = None
         self._n_addresses = 0
         self._n_single_entries = None
+        self._read_tables = dict()
 
     @overrides(AbstractMasterPopTableFactory.get_master_population_table_size)
     def get_master_population_table_size(self, vertex_slice, in_edges):
@@ -267,7 +269,66 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
     def extract_synaptic_matrix_data_location(
             self, incoming_key, master_pop_base_mem_address, txrx,
             chip_x, chip_y):
-        # pylint: disable=too-many-arguments, too-many-locals, arguments-differ
+        # pylint: disable=too-many-arguments, arguments-differ
+        return self.extract_synaptic_matrix_data_locations(
+            [incoming_key], master_pop_base_mem_address, txrx,
+            chip_x, chip_y)[0]
+
+    @overrides(
+        AbstractMasterPopTableFactory.extract_synaptic_matrix_data_locations)
+    def extract_synaptic_matrix_data_locations(
+            self, incoming_keys, master_pop_base_mem_address, txrx,
+            chip_x, chip_y):
+        # pylint: disable=too-many-arguments, too-many-locals
+        entry_list, address_list = self._read_table(
+            master_pop_base_mem_address, txrx, chip_x, chip_y)
+
+        # Find the entry of each key; as the entries are sorted by key and
+        # do not overlap, this is the last entry with a key not greater than
+        # the key being searched for, if that entry matches the key
+        keys = numpy.asarray(incoming_keys, dtype="uint32")
+        entry_ids = numpy.searchsorted(
+            entry_list["key"], keys, side="right") - 1
+        found = entry_ids >= 0
+        entry_ids[~found] = 0
+        if len(entry_list):
+            entries = entry_list[entry_ids]
+            found &= (keys & entries["mask"]) == entries["key"]
+        else:
+            found[:] = False
+
+        # Decode the address list as a whole
+        is_single = (address_list & self.SINGLE_BIT_FLAG_BIT) > 0
+        addresses = address_list & self.ADDRESS_MASK
+        addresses = numpy.where(
+            is_single, addresses >> 8, addresses >> self.ADDRESS_SCALED_SHIFT)
+        row_lengths = address_list & self.ROW_LENGTH_MASK
+
+        locations = list()
+        for entry_id, is_found in zip(entry_ids, found):
+            if not is_found:
+                locations.append([])
+                continue
+            start = int(entry_list[entry_id]["start"])
+            end = start + int(entry_list[entry_id]["count"])
+            locations.append([
+                (int(row_length), int(address), bool(single))
+                for row_length, address, single in zip(
+                    row_lengths[start:end], addresses[start:end],
+                    is_single[start:end])])
+        return locations
+
+    def _read_table(self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        """ Read the master population table and its address list from the\
+            machine, or get them from the cache if they have already been\
+            read since the cache was last cleared
+
+        :return: the table entries and the address list
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        table_id = (chip_x, chip_y, master_pop_base_mem_address)
+        if table_id in self._read_tables:
+            return self._read_tables[table_id]
 
         # get entries in master pop
         n_entries, n_addresses = _TWO_WORDS.unpack(txrx.read_memory(
@@ -290,50 +351,12 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
             full_data, 'uint8', n_address_bytes, n_entry_bytes).view(
                 dtype=self.ADDRESS_LIST_DTYPE)
 
-        entry = self._locate_entry(entry_list, incoming_key)
-        if entry is None:
-            return []
-        addresses = list()
-        for i in range(entry["start"], entry["start"] + entry["count"]):
-            address_and_row_length = address_list[i]
-            is_single = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.SINGLE_BIT_FLAG_BIT) > 0
-            address = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.ADDRESS_MASK)
-            row_length = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.ROW_LENGTH_MASK)
-            if is_single:
-                address = address >> 8
-            else:
-                address = address >> self.ADDRESS_SCALED_SHIFT
-
-            addresses.append((row_length, address, is_single))
-        return addresses
-
-    @staticmethod
-    def _locate_entry(entries, key):
-        """ Search the binary tree structure for the correct entry.
-
-        :param key: the key to search the master pop table for a given entry
-        :return: the entry for this given key
-        :rtype: :py:class:`_MasterPopEntry`
-        """
-        imin = 0
-        imax = len(entries)
-
-        while imin < imax:
-            imid = (imax + imin) // 2
-            entry = entries[imid]
-            if key & entry["mask"] == entry["key"]:
-                return entry
-            if key > entry["key"]:
-                imin = imid + 1
-            else:
-                imax = imid
-        return None
+        self._read_tables[table_id] = (entry_list, address_list)
+        return entry_list, address_list
+
+    @overrides(AbstractMasterPopTableFactory.clear_read_tables)
+    def clear_read_tables(self):
+        self._read_tables = dict()
 
     @overrides(AbstractMasterPopTableFactory.get_edge_constraints)
     def get_edge_constraints(self):
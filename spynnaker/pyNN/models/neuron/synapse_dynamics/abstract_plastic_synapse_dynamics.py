@@ -24,14 +24,18 @@ class AbstractPlasticSynapseDynamics(AbstractSynapseDynamics):
             and lengths for the fixed_plastic and plastic-plastic parts of\
             each row.
 
-        Data is returned as an array made up of an array of 32-bit words for\
-        each row, for each of the fixed-plastic and plastic-plastic data\
-        regions.  The row into which connection should go is given by\
+        Data is returned as a single array of 32-bit words for each of the\
+        fixed-plastic and plastic-plastic regions, containing the region of\
+        each row in turn, along with arrays of the number of words of each\
+        region in each row, from which the offset of each row can be found.\
+        The row into which connection should go is given by\
         connection_row_indices, and the total number of rows is given by\
         n_rows.
 
         Lengths are returned as an array made up of an integer for each row,\
         for each of the fixed-plastic and plastic-plastic regions.
+
+        :return: (fp_data, pp_data, fp_size, pp_size, fp_words, pp_words)
         """
 
     @abstractmethod
@@ -56,4 +60,11 @@ class AbstractPlasticSynapseDynamics(AbstractSynapseDynamics):
             fp_size, fp_data):
         """ Read the connections indicated in the connection indices from the\
             data in pp_data and fp_data
+
+        :param pp_data: The words of the plastic-plastic region of each row\
+            in turn, as a single array; the number of words in each row is\
+            given by get_n_plastic_plastic_words_per_row(pp_size)
+        :param fp_data: The words of the fixed-plastic region of each row in\
+            turn, as a single array; the number of words in each row is\
+            given by get_n_fixed_plastic_words_per_row(fp_size)
         """
@@ -23,13 +23,17 @@ class AbstractStaticSynapseDynamics(AbstractSynapseDynamics):
         """ Get the fixed-fixed data for each row, and lengths for the\
             fixed-fixed parts of each row.
 
-        Data is returned as an array made up of an array of 32-bit words for\
-        each row for the fixed-fixed region. The row into which connection\
-        should go is given by connection_row_indices, and the total number of\
-        rows is given by n_rows.
+        Data is returned as a single array of 32-bit words containing the\
+        fixed-fixed region of each row in turn, along with an array of the\
+        number of words of the region in each row, from which the offset of\
+        each row can be found. The row into which connection should go is\
+        given by connection_row_indices, and the total number of rows is\
+        given by n_rows.
 
         Lengths are returned as an array made up of an integer for each row,\
         for the fixed-fixed region.
+
+        :return: (ff_data, ff_size, ff_words)
         """
 
     @abstractmethod
@@ -47,4 +51,9 @@ class AbstractStaticSynapseDynamics(AbstractSynapseDynamics):
     def read_static_synaptic_data(
             self, post_vertex_slice, n_synapse_types, ff_size, ff_data):
         """ Read the connections from the words of data in ff_data
+
+        :param ff_size: The size of the fixed-fixed region of each row
+        :param ff_data: The words of the fixed-fixed region of each row in\
+            turn, as a single array; the number of words in each row is\
+            given by get_n_static_words_per_row(ff_size)
         """
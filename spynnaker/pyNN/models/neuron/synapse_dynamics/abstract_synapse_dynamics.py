@@ -1,4 +1,3 @@
-import math
 import numpy
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
@@ -88,27 +87,35 @@ class AbstractSynapseDynamics(object):
         # pylint: disable=too-many-arguments
         return connector.get_weight_variance(weights)
 
-    def convert_per_connection_data_to_rows(
-            self, connection_row_indices, n_rows, data):
-        """ Converts per-connection data generated from connections into\
-            row-based data to be returned from get_synaptic_data
-        """
-        return [
-            data[connection_row_indices == i].reshape(-1)
-            for i in range(n_rows)]
-
-    def get_n_items(self, rows, item_size):
-        """ Get the number of items in each row as 4-byte values, given the\
-            item size
-        """
-        return numpy.array([
-            int(math.ceil(float(row.size) / float(item_size)))
-            for row in rows], dtype="uint32").reshape((-1, 1))
-
-    def get_words(self, rows):
-        """ Convert the row data to words
-        """
-        words = [numpy.pad(
-            row, (0, (4 - (row.size % 4)) & 0x3), mode="constant",
-            constant_values=0).view("uint32") for row in rows]
-        return words
+    @staticmethod
+    def get_row_positions(connection_row_indices, n_rows):
+        """ Get the number of connections in each row, and the position of\
+            each connection within its row; connections in the same row keep\
+            the order in which they are given
+
+        :param connection_row_indices: The row of each connection
+        :param n_rows: The number of rows
+        :return: The number of connections in each row, and the position of\
+            each connection in its row
+        :rtype: (numpy array of uint32, numpy array of int64)
+        """
+        connection_row_indices = connection_row_indices.astype(
+            "int64", copy=False)
+        n_connections = numpy.bincount(
+            connection_row_indices, minlength=n_rows)
+        order = numpy.argsort(connection_row_indices, kind="mergesort")
+        row_starts = AbstractSynapseDynamics.get_row_offsets(n_connections)
+        positions = numpy.empty(len(connection_row_indices), dtype="int64")
+        positions[order] = (
+            numpy.arange(len(order)) -
+            row_starts[connection_row_indices[order]])
+        return n_connections.astype("uint32"), positions
+
+    @staticmethod
+    def get_row_offsets(n_items):
+        """ Get the offset of each row in a flat array of rows, given the\
+            number of items in each row
+        """
+        offsets = numpy.zeros(len(n_items), dtype="int64")
+        numpy.cumsum(n_items[:-1], out=offsets[1:])
+        return offsets
@@ -70,28 +70,17 @@ class SynapseDynamicsStatic(
                 "uint32") << n_neuron_id_bits) |
             ((connections["target"] - post_vertex_slice.lo_atom) &
              neuron_id_mask))
-        fixed_fixed_rows = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows,
-            fixed_fixed.view(dtype="uint8").reshape((-1, 4)))
-        ff_size = self.get_n_items(fixed_fixed_rows, 4)
+        ff_size, positions = self.get_row_positions(
+            connection_row_indices, n_rows)
+        ff_words = ff_size
         if self._pad_to_length is not None:
             # Pad the data
-            fixed_fixed_rows = self._pad_row(fixed_fixed_rows, 4)
-        ff_data = [fixed_row.view("uint32") for fixed_row in fixed_fixed_rows]
+            ff_words = numpy.maximum(ff_size, self._pad_to_length)
+        ff_data = numpy.zeros(numpy.sum(ff_words), dtype="uint32")
+        ff_data[self.get_row_offsets(ff_words)[connection_row_indices] +
+                positions] = fixed_fixed
 
-        return ff_data, ff_size
-
-    def _pad_row(self, rows, no_bytes_per_connection):
-        padded_rows = []
-        for row in rows:  # Row elements are (individual) bytes
-            padded_rows.append(
-                numpy.concatenate((
-                    row, numpy.zeros(numpy.clip(
-                        no_bytes_per_connection * self._pad_to_length -
-                        row.size, 0, None)).astype(
-                            dtype="uint8"))).view(dtype="uint8"))
-
-        return padded_rows
+        return ff_data, ff_size, ff_words
 
     @overrides(AbstractStaticSynapseDynamics.get_n_static_words_per_row)
     def get_n_static_words_per_row(self, ff_size):
@@ -113,10 +102,10 @@ class SynapseDynamicsStatic(
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data = numpy.concatenate(ff_data)
+        data = ff_data
         connections = numpy.zeros(data.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, ff_size[i]) for i in range(len(ff_size))])
+        connections["source"] = numpy.repeat(
+            numpy.arange(len(ff_size)), ff_size)
         connections["target"] = (
             (data & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = (data >> 16) & 0xFFFF
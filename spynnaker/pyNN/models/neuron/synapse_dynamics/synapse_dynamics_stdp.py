@@ -203,59 +203,42 @@ class SynapseDynamicsSTDP(
              << n_neuron_id_bits) |
             ((connections["target"].astype("uint16") -
               post_vertex_slice.lo_atom) & neuron_id_mask))
-        fixed_plastic_rows = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows,
-            fixed_plastic.view(dtype="uint8").reshape((-1, 2)))
-        fp_size = self.get_n_items(fixed_plastic_rows, 2)
+        fp_size, positions = self.get_row_positions(
+            connection_row_indices, n_rows)
+        n_row_synapses = fp_size
         if self._pad_to_length is not None:
             # Pad the data
-            fixed_plastic_rows = self._pad_row(fixed_plastic_rows, 2)
-        fp_data = self.get_words(fixed_plastic_rows)
+            n_row_synapses = numpy.maximum(fp_size, self._pad_to_length)
+
+        # Each fixed-plastic synapse is a half-word, so pack them into
+        # half-words and then round each row up to a whole number of words
+        fp_words = (n_row_synapses + 1) // 2
+        fp_half_words = numpy.zeros(
+            int(numpy.sum(fp_words)) * 2, dtype="uint16")
+        fp_half_words[
+            (self.get_row_offsets(fp_words)[connection_row_indices] * 2) +
+            positions] = fixed_plastic
+        fp_data = fp_half_words.view("uint32")
 
         # Get the plastic data by inserting the weight into the half-word
-        # specified by the synapse structure
+        # specified by the synapse structure, after the header of each row
         synapse_structure = self._timing_dependence.synaptic_structure
         n_half_words = synapse_structure.get_n_half_words_per_connection()
         half_word = synapse_structure.get_weight_half_word()
-        plastic_plastic = numpy.zeros(
-            len(connections) * n_half_words, dtype="uint16")
-        plastic_plastic[half_word::n_half_words] = \
-            numpy.rint(numpy.abs(connections["weight"])).astype("uint16")
-
-        # Convert the plastic data into groups of bytes per connection and
-        # then into rows
-        plastic_plastic = plastic_plastic.view(dtype="uint8").reshape(
-            (-1, n_half_words * 2))
-        plastic_plastic_row_data = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows, plastic_plastic)
-
-        # pp_size = fp_size in words => fp_size * no_bytes / 4 (bytes)
-        if self._pad_to_length is not None:
-            # Pad the data
-            plastic_plastic_row_data = self._pad_row(
-                plastic_plastic_row_data, n_half_words * 2)
-        plastic_headers = numpy.zeros(
-            (n_rows, self._n_header_bytes), dtype="uint8")
-        plastic_plastic_rows = [
-            numpy.concatenate((
-                plastic_headers[i], plastic_plastic_row_data[i]))
-            for i in range(n_rows)]
-        pp_size = self.get_n_items(plastic_plastic_rows, 4)
-        pp_data = self.get_words(plastic_plastic_rows)
-
-        return fp_data, pp_data, fp_size, pp_size
-
-    def _pad_row(self, rows, no_bytes_per_connection):
-        # Row elements are (individual) bytes
-        return [
-            numpy.concatenate((
-                row, numpy.zeros(
-                    numpy.clip(
-                        (no_bytes_per_connection * self._pad_to_length -
-                         row.size),
-                        0, None)).astype(dtype="uint8"))
-                ).view(dtype="uint8")
-            for row in rows]
+        pp_words = (
+            self._n_header_bytes + (n_row_synapses * n_half_words * 2) +
+            3) // 4
+        pp_half_words = numpy.zeros(
+            int(numpy.sum(pp_words)) * 2, dtype="uint16")
+        pp_half_words[
+            (self.get_row_offsets(pp_words)[connection_row_indices] * 2) +
+            (self._n_header_bytes // 2) + (positions * n_half_words) +
+            half_word] = numpy.rint(
+                numpy.abs(connections["weight"])).astype("uint16")
+        pp_data = pp_half_words.view("uint32")
+        pp_size = pp_words
+
+        return fp_data, pp_data, fp_size, pp_size, fp_words, pp_words
 
     @overrides(
         AbstractPlasticSynapseDynamics.get_n_plastic_plastic_words_per_row)
@@ -280,29 +263,37 @@ class SynapseDynamicsSTDP(
             self, post_vertex_slice, n_synapse_types, pp_size, pp_data,
             fp_size, fp_data):
         # pylint: disable=too-many-arguments
-        n_rows = len(fp_size)
-
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data_fixed = numpy.concatenate([
-            fp_data[i].view(dtype="uint16")[0:fp_size[i]]
-            for i in range(n_rows)])
-        pp_without_headers = [
-            row.view(dtype="uint8")[self._n_header_bytes:] for row in pp_data]
+        # Find the row of each synapse and its position within the row
+        fp_size = fp_size.astype("int64")
+        row_ids = numpy.repeat(numpy.arange(len(fp_size)), fp_size)
+        positions = (
+            numpy.arange(row_ids.size) -
+            self.get_row_offsets(fp_size)[row_ids])
+
+        # Each fixed-plastic synapse is a half-word in the words of its row
+        fp_offsets = self.get_row_offsets(
+            self.get_n_fixed_plastic_words_per_row(fp_size))
+        data_fixed = fp_data.view("uint16")[
+            (fp_offsets[row_ids] * 2) + positions]
+
+        # The weight is in a half-word of each plastic synapse, which follow
+        # the header of the row
         synapse_structure = self._timing_dependence.synaptic_structure
         n_half_words = synapse_structure.get_n_half_words_per_connection()
         half_word = synapse_structure.get_weight_half_word()
-        pp_half_words = numpy.concatenate([
-            pp[:size * n_half_words * 2].view("uint16")[
-                half_word::n_half_words]
-            for pp, size in zip(pp_without_headers, fp_size)])
+        pp_offsets = self.get_row_offsets(
+            self.get_n_plastic_plastic_words_per_row(pp_size))
+        pp_half_words = pp_data.view("uint16")[
+            (pp_offsets[row_ids] * 2) + (self._n_header_bytes // 2) +
+            (positions * n_half_words) + half_word]
 
         connections = numpy.zeros(
             data_fixed.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, fp_size[i]) for i in range(len(fp_size))])
+        connections["source"] = row_ids
         connections["target"] = (
             (data_fixed & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = pp_half_words
@@ -1,4 +1,5 @@
 from .abstract_synapse_io import AbstractSynapseIO
+from .synapse_generation_pool import SynapseGenerationPool
 from .synapse_io_row_based import SynapseIORowBased
 
-__all__ = ["AbstractSynapseIO", "SynapseIORowBased"]
+__all__ = ["AbstractSynapseIO", "SynapseGenerationPool", "SynapseIORowBased"]
@@ -0,0 +1,178 @@
+import multiprocessing
+import numpy
+
+# The blocks being generated and the shared memory that the row data is
+# returned in.  These are set before the worker processes are forked, so
+# that the connectors and synapse dynamics never need to be pickled.
+_blocks = None
+_shared_words = None
+
+
+def _get_context():
+    """ Get a multiprocessing context whose workers are forked, as they rely\
+        on inheriting the blocks to generate
+    """
+    try:
+        return multiprocessing.get_context("fork")
+    except AttributeError:
+        # Python 2 always forks on the platforms where this is supported
+        return multiprocessing
+
+
+def _generate_block(block_index):
+    """ Generate a single block in a worker process
+    """
+    return _blocks[block_index].generate(_shared_words)
+
+
+class _SynapticBlock(object):
+    """ The details needed to generate the synapses of one\
+        (machine edge, synapse information) pair
+    """
+
+    __slots__ = [
+        "_args",
+        "_n_words",
+        "_offset",
+        "_seed",
+        "_synapse_info",
+        "_synapse_io"]
+
+    def __init__(self, synapse_io, synapse_info, seed, offset, n_words, args):
+        self._synapse_io = synapse_io
+        self._synapse_info = synapse_info
+        self._seed = seed
+        self._offset = offset
+        self._n_words = n_words
+        self._args = args
+
+    def generate(self, shared_words=None):
+        """ Generate the synapses of the block.  If shared memory is given,\
+            the row data is copied there when it fits, and only its size is\
+            returned; otherwise the row data is returned directly.
+        """
+        synapse_info = self._synapse_info
+        synapse_info.connector.seed_block(
+            self._seed, synapse_info.weight, synapse_info.delay)
+        (row_data, row_length, delayed_row_data, delayed_row_length,
+         delayed_source_ids, delay_stages) = self._synapse_io.get_synapses(
+            synapse_info, *self._args)
+        if shared_words is None:
+            return (row_data, row_length, delayed_row_data,
+                    delayed_row_length, delayed_source_ids, delay_stages)
+
+        # Only use the shared memory if both sets of rows fit; otherwise
+        # the data is sent back through the result pipe
+        n_words = row_data.size + delayed_row_data.size
+        if n_words > self._n_words:
+            return (row_data, row_length, delayed_row_data,
+                    delayed_row_length, delayed_source_ids, delay_stages)
+        shared = numpy.frombuffer(shared_words, dtype="uint32")
+        start = self._offset
+        shared[start:start + row_data.size] = row_data
+        start += row_data.size
+        shared[start:start + delayed_row_data.size] = delayed_row_data
+        return (row_data.size, row_length, delayed_row_data.size,
+                delayed_row_length, delayed_source_ids, delay_stages)
+
+    def read_shared(self, shared_words, result):
+        """ Convert a result that refers to the shared memory back into row\
+            data
+        """
+        (row_data, row_length, delayed_row_data, delayed_row_length,
+         delayed_source_ids, delay_stages) = result
+        if isinstance(row_data, numpy.ndarray):
+            return result
+        shared = numpy.frombuffer(shared_words, dtype="uint32")
+        start = self._offset
+        row_data, delayed_row_data = (
+            numpy.array(shared[start:start + row_data]),
+            numpy.array(shared[
+                start + row_data:start + row_data + delayed_row_data]))
+        return (row_data, row_length, delayed_row_data, delayed_row_length,
+                delayed_source_ids, delay_stages)
+
+
+class SynapseGenerationPool(object):
+    """ Generates the synaptic blocks of a vertex, either in this process or\
+        in a pool of worker processes.  Each block is generated from its own\
+        seed, which depends only on the connector, the projection and the\
+        slices of the block, and the choices shared by the blocks of a\
+        projection are made as blocks are added, before any is generated,\
+        so that the results depend neither on the number of workers used\
+        nor on the order in which the blocks are added.
+    """
+
+    __slots__ = [
+        "_blocks",
+        "_keys",
+        "_n_words",
+        "_n_workers"]
+
+    def __init__(self, n_workers):
+        """
+        :param n_workers: The number of worker processes to use; if 1, the\
+            blocks are generated in this process
+        :type n_workers: int
+        """
+        self._n_workers = n_workers
+        self._blocks = list()
+        self._keys = list()
+        self._n_words = 0
+
+    def add_block(
+            self, key, synapse_io, synapse_info, max_n_words, pre_slices,
+            pre_slice_index, post_slices, post_slice_index, pre_vertex_slice,
+            post_vertex_slice, n_delay_stages, population_table,
+            n_synapse_types, weight_scales, machine_time_step, app_edge,
+            machine_edge):
+        """ Add a block to be generated
+
+        :param key: The key by which the result will be found
+        :param max_n_words: The maximum number of words expected in the\
+            undelayed and delayed rows of the block together
+        """
+        # pylint: disable=too-many-arguments
+        # The choices shared by the blocks of the projection are made here,
+        # before any worker is forked, so that every block sees the same
+        connector = synapse_info.connector
+        seed = connector.get_block_seed(
+            synapse_info, pre_vertex_slice, post_vertex_slice)
+        connector.prepare_synaptic_blocks(pre_slices, post_slices)
+        self._blocks.append(_SynapticBlock(
+            synapse_io, synapse_info, seed, self._n_words, max_n_words, (
+                pre_slices, pre_slice_index, post_slices, post_slice_index,
+                pre_vertex_slice, post_vertex_slice, n_delay_stages,
+                population_table, n_synapse_types, weight_scales,
+                machine_time_step, app_edge, machine_edge)))
+        self._keys.append(key)
+        self._n_words += max_n_words
+
+    def generate(self):
+        """ Generate all the blocks added
+
+        :return: A dict of key to the result of\
+            :py:meth:`AbstractSynapseIO.get_synapses` for each block
+        """
+        global _blocks, _shared_words
+        if self._n_workers <= 1 or len(self._blocks) <= 1:
+            return {
+                key: block.generate()
+                for key, block in zip(self._keys, self._blocks)}
+
+        _blocks = self._blocks
+        context = _get_context()
+        _shared_words = context.RawArray("I", self._n_words)
+        pool = context.Pool(
+            min(self._n_workers, len(self._blocks)))
+        try:
+            results = pool.map(_generate_block, range(len(self._blocks)))
+            return {
+                key: block.read_shared(_shared_words, result)
+                for key, block, result in zip(
+                    self._keys, self._blocks, results)}
+        finally:
+            pool.close()
+            pool.join()
+            _blocks = None
+            _shared_words = None
@@ -15,6 +15,39 @@ from spynnaker.pyNN.models.neuron.synapse_dynamics import (
 _N_HEADER_WORDS = 3
 
 
+def _fill_rows(rows, data, n_words, start_columns):
+    """ Copy a region of each row into a 2D array of rows
+
+    :param rows: The 2D array of rows to fill in
+    :param data: The flat data of the region of each row in turn
+    :param n_words: The number of words of the region in each row
+    :param start_columns: The column at which the region starts in each row
+    """
+    if not data.size:
+        return
+    row_ids = numpy.repeat(numpy.arange(len(n_words)), n_words)
+    row_starts = numpy.zeros(len(n_words), dtype="int64")
+    numpy.cumsum(n_words[:-1], out=row_starts[1:])
+    columns = (
+        numpy.arange(data.size) - row_starts[row_ids] +
+        start_columns[row_ids])
+    rows[row_ids, columns] = data
+
+
+def _get_row_region(rows, start_columns, n_words):
+    """ Get a region of each row from a 2D array of rows, as a single array\
+        of the region of each row in turn
+
+    :param rows: The 2D array of rows
+    :param start_columns: The column at which the region starts in each row
+    :param n_words: The number of words of the region in each row
+    """
+    columns = numpy.arange(rows.shape[1])
+    start_columns = numpy.asarray(start_columns).reshape(-1, 1)
+    end_columns = start_columns + numpy.asarray(n_words).reshape(-1, 1)
+    return rows[(columns >= start_columns) & (columns < end_columns)]
+
+
 class SynapseIORowBased(AbstractSynapseIO):
     """ A SynapseRowIO implementation that uses a row for each source neuron,\
         where each row consists of a fixed region, a plastic region, and a\
@@ -114,68 +147,65 @@ class SynapseIORowBased(AbstractSynapseIO):
             n_synapse_types, population_table, synapse_dynamics,
             app_edge, machine_edge):
         # pylint: disable=too-many-arguments, too-many-locals
-        row_ids = range(n_rows)
-        ff_data, ff_size = None, None
-        fp_data, pp_data, fp_size, pp_size = None, None, None, None
+        no_data = numpy.zeros(0, dtype="uint32")
+        no_words = numpy.zeros(n_rows, dtype="uint32")
+        ff_data, ff_size, ff_words = no_data, no_words, no_words
+        fp_data, pp_data, fp_size, pp_size, fp_words, pp_words = (
+            no_data, no_data, no_words, no_words, no_words, no_words)
         if (isinstance(synapse_dynamics, AbstractStaticSynapseDynamics) or
                 isinstance(synapse_dynamics, SynapseDynamicsStructuralStatic)):
 
             # Get the static data
             if isinstance(synapse_dynamics, AbstractSynapseDynamicsStructural):
-                ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
-                    connections, row_indices, n_rows, post_vertex_slice,
-                    n_synapse_types, app_edge=app_edge,
-                    machine_edge=machine_edge)
+                ff_data, ff_size, ff_words = \
+                    synapse_dynamics.get_static_synaptic_data(
+                        connections, row_indices, n_rows, post_vertex_slice,
+                        n_synapse_types, app_edge=app_edge,
+                        machine_edge=machine_edge)
             else:
-                ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
-                    connections, row_indices, n_rows, post_vertex_slice,
-                    n_synapse_types)
-
-            # Blank the plastic data
-            fp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            pp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            fp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
-            pp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+                ff_data, ff_size, ff_words = \
+                    synapse_dynamics.get_static_synaptic_data(
+                        connections, row_indices, n_rows, post_vertex_slice,
+                        n_synapse_types)
         elif (isinstance(synapse_dynamics, SynapseDynamicsSTDP) or
               isinstance(synapse_dynamics, SynapseDynamicsStructuralSTDP)):
 
-            # Blank the static data
-            ff_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
-            ff_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
-
             # Get the plastic data
             if isinstance(synapse_dynamics, AbstractSynapseDynamicsStructural):
-                fp_data, pp_data, fp_size, pp_size = \
+                fp_data, pp_data, fp_size, pp_size, fp_words, pp_words = \
                     synapse_dynamics.get_plastic_synaptic_data(
                         connections, row_indices, n_rows, post_vertex_slice,
                         n_synapse_types, app_edge=app_edge,
                         machine_edge=machine_edge)
             else:
-                fp_data, pp_data, fp_size, pp_size = \
+                fp_data, pp_data, fp_size, pp_size, fp_words, pp_words = \
                     synapse_dynamics.get_plastic_synaptic_data(
                         connections, row_indices, n_rows, post_vertex_slice,
                         n_synapse_types)
 
-        # Add some padding
-        row_lengths = [
-            _N_HEADER_WORDS + pp_data[i].size + fp_data[i].size +
-            ff_data[i].size for i in row_ids]
-        max_length = max(row_lengths) - _N_HEADER_WORDS
+        # Work out the row length, which includes padding
+        pp_words = pp_words.astype("int64")
+        ff_words = ff_words.astype("int64")
+        fp_words = fp_words.astype("int64")
+        max_length = numpy.max(pp_words + ff_words + fp_words)
         max_row_length = population_table.get_allowed_row_length(max_length)
-        padding = [
-            numpy.zeros(
-                max_row_length - (row_length - _N_HEADER_WORDS),
-                dtype="uint32")
-            for row_length in row_lengths]
-
-        # Join the bits into rows
-        items_to_join = [
-            pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding]
-        rows = [numpy.concatenate(items) for items in zip(*items_to_join)]
-        row_data = numpy.concatenate(rows)
+
+        # Fill in the rows; each row is made up of the plastic-plastic size
+        # and data, the fixed-fixed and fixed-plastic sizes, and then the
+        # fixed-fixed and fixed-plastic data, followed by padding
+        rows = numpy.zeros(
+            (n_rows, max_row_length + _N_HEADER_WORDS), dtype="uint32")
+        row_ids = numpy.arange(n_rows)
+        rows[:, 0] = pp_size
+        rows[row_ids, pp_words + 1] = ff_size
+        rows[row_ids, pp_words + 2] = fp_size
+        _fill_rows(rows, pp_data, pp_words, numpy.ones(n_rows, dtype="int64"))
+        _fill_rows(rows, ff_data, ff_words, pp_words + _N_HEADER_WORDS)
+        _fill_rows(
+            rows, fp_data, fp_words, pp_words + ff_words + _N_HEADER_WORDS)
 
         # Return the data
-        return max_row_length, row_data
+        return max_row_length, rows.reshape(-1)
 
     @overrides(AbstractSynapseIO.get_synapses)
     def get_synapses(
@@ -319,14 +349,10 @@ class SynapseIORowBased(AbstractSynapseIO):
 
     @staticmethod
     def _parse_static_data(row_data, dynamics):
-        n_rows = row_data.shape[0]
         ff_size = row_data[:, 1]
         ff_words = dynamics.get_n_static_words_per_row(ff_size)
-        ff_start = _N_HEADER_WORDS
-        ff_end = ff_start + ff_words
-        return (
-            ff_size,
-            [row_data[row, ff_start:ff_end[row]] for row in range(n_rows)])
+        ff_start = numpy.full(row_data.shape[0], _N_HEADER_WORDS)
+        return ff_size, _get_row_region(row_data, ff_start, ff_words)
 
     def _read_static_data(self, dynamics, pre_vertex_slice, post_vertex_slice,
                           n_synapse_types, row_data, delayed_row_data):
@@ -350,22 +376,8 @@ class SynapseIORowBased(AbstractSynapseIO):
 
             # Use the row index to work out the actual delay and source
             n_synapses = dynamics.get_n_synapses_in_rows(ff_size)
-            synapse_ids = range(len(n_synapses))
-            row_stage = numpy.array([
-                i // pre_vertex_slice.n_atoms
-                for i in synapse_ids], dtype="uint32")
-            row_min_delay = (row_stage + 1) * 16
-            connection_min_delay = numpy.concatenate([
-                numpy.repeat(row_min_delay[i], n_synapses[i])
-                for i in synapse_ids])
-            connection_source_extra = numpy.concatenate([
-                numpy.repeat(
-                    row_stage[i] * numpy.uint32(pre_vertex_slice.n_atoms),
-                    n_synapses[i])
-                for i in synapse_ids])
-            delayed_connections["source"] -= connection_source_extra
-            delayed_connections["source"] += pre_vertex_slice.lo_atom
-            delayed_connections["delay"] += connection_min_delay
+            self._convert_delayed_rows(
+                delayed_connections, n_synapses, pre_vertex_slice)
             connections.append(delayed_connections)
 
         return connections
@@ -378,13 +390,11 @@ class SynapseIORowBased(AbstractSynapseIO):
         fp_size = row_data[numpy.arange(n_rows), pp_words + 2]
         fp_words = dynamics.get_n_fixed_plastic_words_per_row(fp_size)
         fp_start = pp_size + _N_HEADER_WORDS
-        fp_end = fp_start + fp_words
-        row_ids = range(n_rows)
         return (
             pp_size,
-            [row_data[row, 1:pp_words[row] + 1] for row in row_ids],
+            _get_row_region(row_data, numpy.ones(n_rows), pp_words),
             fp_size,
-            [row_data[row, fp_start[row]:fp_end[row]] for row in row_ids])
+            _get_row_region(row_data, fp_start, fp_words))
 
     def _read_plastic_data(
             self, dynamics, pre_vertex_slice, post_vertex_slice,
@@ -412,27 +422,27 @@ class SynapseIORowBased(AbstractSynapseIO):
 
             # Use the row index to work out the actual delay and source
             n_synapses = dynamics.get_n_synapses_in_rows(pp_size, fp_size)
-            synapse_ids = range(len(n_synapses))
-            row_stage = numpy.array([
-                (i // pre_vertex_slice.n_atoms)
-                for i in synapse_ids], dtype="uint32")
-            row_min_delay = (row_stage + 1) * 16
-            connection_min_delay = numpy.concatenate([
-                numpy.repeat(row_min_delay[i], n_synapses[i])
-                for i in synapse_ids])
-            connection_source_extra = numpy.concatenate([
-                numpy.repeat(
-                    row_stage[i] * numpy.uint32(pre_vertex_slice.n_atoms),
-                    n_synapses[i])
-                for i in synapse_ids])
-
-            delayed_connections["source"] -= connection_source_extra
-            delayed_connections["source"] += pre_vertex_slice.lo_atom
-            delayed_connections["delay"] += connection_min_delay
+            self._convert_delayed_rows(
+                delayed_connections, n_synapses, pre_vertex_slice)
             connections.append(delayed_connections)
 
         return connections
 
+    @staticmethod
+    def _convert_delayed_rows(connections, n_synapses, pre_vertex_slice):
+        """ Convert connections read from the rows of the delayed matrix,\
+            where each delay stage has a row per source neuron, into their\
+            actual sources and delays.
+        """
+        row_stage = (
+            numpy.arange(len(n_synapses)) //
+            pre_vertex_slice.n_atoms).astype("uint32")
+        connection_stage = numpy.repeat(row_stage, n_synapses)
+        connections["source"] -= (
+            connection_stage * numpy.uint32(pre_vertex_slice.n_atoms))
+        connections["source"] += pre_vertex_slice.lo_atom
+        connections["delay"] += (connection_stage + 1) * 16
+
     @overrides(AbstractSynapseIO.get_block_n_bytes)
     def get_block_n_bytes(self, max_row_length, n_rows):
         return (_N_HEADER_WORDS + max_row_length) * 4 * n_rows
@@ -20,7 +20,8 @@ from spynnaker.pyNN.models.neuron import master_pop_table_generators
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     SynapseDynamicsStatic, AbstractSynapseDynamicsStructural,
     AbstractGenerateOnMachine)
-from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from spynnaker.pyNN.models.neuron.synapse_io import (
+    SynapseGenerationPool, SynapseIORowBased)
 from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
     SpikeSourcePoissonVertex)
 from spynnaker.pyNN.models.utility_models import DelayExtensionVertex
@@ -50,6 +51,10 @@ _SYNAPSE_SDRAM_OVERSCALE = 1.1
 
 _ONE_WORD = struct.Struct("<I")
 
+# The largest gap between synaptic blocks that will be read over rather than
+# starting a new read when reading several blocks at once
+_MAX_READ_GAP_BYTES = 256
+
 
 class SynapticManager(object):
     """ Deals with synapses
@@ -61,6 +66,7 @@ class SynapticManager(object):
         "_one_to_one_connection_dtcm_max_bytes",
         "_poptable_type",
         "_pre_run_connection_holders",
+        "_region_addresses",
         "_retrieved_blocks",
         "_ring_buffer_sigma",
         "_spikes_per_second",
@@ -69,7 +75,8 @@ class SynapticManager(object):
         "_weight_scales",
         "_ring_buffer_shifts",
         "_gen_on_machine",
-        "_max_row_info"]
+        "_max_row_info",
+        "_n_synapse_generation_workers"]
 
     def __init__(self, n_synapse_types, ring_buffer_sigma, spikes_per_second,
                  config, population_table_type=None, synapse_io=None):
@@ -108,6 +115,7 @@ class SynapticManager(object):
         self._ring_buffer_shifts = None
         self._delay_key_index = dict()
         self._retrieved_blocks = dict()
+        self._region_addresses = dict()
 
         # A list of connection holders to be filled in pre-run, indexed by
         # the edge the connection is for
@@ -117,6 +125,11 @@ class SynapticManager(object):
         self._one_to_one_connection_dtcm_max_bytes = config.getint(
             "Simulation", "one_to_one_connection_dtcm_max_bytes")
 
+        # The number of processes to generate synaptic matrices with on host;
+        # 0 means generate in this process from the connector random numbers
+        self._n_synapse_generation_workers = config.getint(
+            "Simulation", "n_synapse_generation_workers")
+
         # Whether to generate on machine or not for a given vertex slice
         self._gen_on_machine = dict()
 
@@ -457,17 +470,24 @@ class SynapticManager(object):
                     if isinstance(app_edge.pre_vertex,
                                   SpikeSourcePoissonVertex):
                         spikes_per_second = app_edge.pre_vertex.rate
-                        if hasattr(spikes_per_second, "__getitem__"):
-                            spikes_per_second = max(spikes_per_second)
-                        elif get_simulator().is_a_pynn_random(
-                                spikes_per_second):
-                            spikes_per_second = get_maximum_probable_value(
-                                spikes_per_second, app_edge.pre_vertex.n_atoms)
                         prob = 1.0 - (
                             (1.0 / 100.0) / app_edge.pre_vertex.n_atoms)
-                        spikes_per_tick = spikes_per_second / steps_per_second
-                        spikes_per_tick = scipy.stats.poisson.ppf(
-                            prob, spikes_per_tick)
+                        if hasattr(spikes_per_second, "__getitem__"):
+                            # The statistics of the rates are kept by the
+                            # vertex, so are only computed when they change
+                            spikes_per_second = app_edge.pre_vertex.max_rate
+                            spikes_per_tick = \
+                                app_edge.pre_vertex.get_max_spikes_per_tick(
+                                    prob, machine_timestep)
+                        else:
+                            if get_simulator().is_a_pynn_random(
+                                    spikes_per_second):
+                                spikes_per_second = \
+                                    get_maximum_probable_value(
+                                        spikes_per_second,
+                                        app_edge.pre_vertex.n_atoms)
+                            spikes_per_tick = scipy.stats.poisson.ppf(
+                                prob, spikes_per_second / steps_per_second)
                     rate_stats[synapse_type].add_items(
                         spikes_per_second, 0, n_connections)
                     total_weights[synapse_type] += spikes_per_tick * (
@@ -581,6 +601,13 @@ class SynapticManager(object):
         # Store a list of synapse info to be generated on the machine
         generate_on_machine = list()
 
+        # Generate the host blocks up front if requested
+        generated_blocks = dict()
+        if self._n_synapse_generation_workers > 0:
+            generated_blocks = self.__generate_blocks(
+                in_edges, post_slices, post_slice_index, post_vertex_slice,
+                weight_scales, graph_mapper, machine_time_step)
+
         # For each machine edge in the vertex, create a synaptic list
         for machine_edge in in_edges:
             app_edge = graph_mapper.get_application_edge(machine_edge)
@@ -623,7 +650,9 @@ class SynapticManager(object):
                             single_synapses, master_pop_table_region,
                             weight_scales, machine_time_step, rinfo,
                             all_syn_block_sz, block_addr, single_addr,
-                            machine_edge=machine_edge)
+                            machine_edge=machine_edge,
+                            synapses=generated_blocks.get(
+                                (machine_edge, synapse_info)))
 
         # Skip blocks that will be written on the machine, but add them
         # to the master population table
@@ -661,6 +690,60 @@ class SynapticManager(object):
 
         return generator_data
 
+    def __generate_blocks(
+            self, in_edges, post_slices, post_slice_index, post_vertex_slice,
+            weight_scales, graph_mapper, machine_time_step):
+        """ Generate the synaptic blocks that might be written from the host\
+            using a pool of workers; only the writing of the blocks to the\
+            spec then has to be done in order.
+        """
+        pool = SynapseGenerationPool(self._n_synapse_generation_workers)
+        for machine_edge in in_edges:
+            app_edge = graph_mapper.get_application_edge(machine_edge)
+            if not isinstance(app_edge, ProjectionApplicationEdge):
+                continue
+            pre_vertex_slice = graph_mapper.get_slice(machine_edge.pre_vertex)
+            pre_slices = graph_mapper.get_slices(app_edge.pre_vertex)
+            pre_slice_idx = graph_mapper.get_machine_vertex_index(
+                machine_edge.pre_vertex)
+            for synapse_info in app_edge.synapse_information:
+                connector = synapse_info.connector
+                dynamics = synapse_info.synapse_dynamics
+
+                # Structural dynamics record the connections as they are
+                # generated, so these must stay in this process
+                if isinstance(dynamics, AbstractSynapseDynamicsStructural):
+                    continue
+
+                # Skip anything that will definitely be generated on machine
+                if (isinstance(
+                        connector, AbstractGenerateConnectorOnMachine) and
+                        connector.generate_on_machine(
+                            synapse_info.weight, synapse_info.delay) and
+                        isinstance(dynamics, AbstractGenerateOnMachine) and
+                        dynamics.generate_on_machine and
+                        not self.__is_direct(
+                            0, connector, pre_vertex_slice,
+                            post_vertex_slice, app_edge)):
+                    continue
+
+                max_row_info = self._get_max_row_info(
+                    synapse_info, post_vertex_slice, app_edge,
+                    machine_time_step)
+                max_n_bytes = pre_vertex_slice.n_atoms * (
+                    max_row_info.undelayed_max_bytes +
+                    (max_row_info.delayed_max_bytes *
+                     app_edge.n_delay_stages))
+                pool.add_block(
+                    (machine_edge, synapse_info), self._synapse_io,
+                    synapse_info, max_n_bytes // 4, pre_slices,
+                    pre_slice_idx, post_slices, post_slice_index,
+                    pre_vertex_slice, post_vertex_slice,
+                    app_edge.n_delay_stages, self._poptable_type,
+                    self._n_synapse_types, weight_scales, machine_time_step,
+                    app_edge, machine_edge)
+        return pool.generate()
+
     def __generate_on_chip_data(
             self, spec, synapse_info, pre_slices,
             pre_slice_index, post_slices, post_slice_index, pre_vertex_slice,
@@ -768,14 +851,22 @@ class SynapticManager(object):
             post_vertex_slice, app_edge, n_synapse_types, single_synapses,
             master_pop_table_region, weight_scales, machine_time_step,
             rinfo, all_syn_block_sz, block_addr, single_addr,
-            machine_edge):
+            machine_edge, synapses=None):
+        if synapses is None:
+            connector = synapse_info.connector
+            seed = connector.get_block_seed(
+                synapse_info, pre_vertex_slice, post_vertex_slice)
+            connector.prepare_synaptic_blocks(pre_slices, post_slices)
+            connector.seed_block(
+                seed, synapse_info.weight, synapse_info.delay)
+            synapses = self._synapse_io.get_synapses(
+                synapse_info, pre_slices, pre_slice_idx, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                app_edge.n_delay_stages, self._poptable_type, n_synapse_types,
+                weight_scales, machine_time_step,
+                app_edge=app_edge, machine_edge=machine_edge)
         (row_data, row_length, delayed_row_data, delayed_row_length,
-         delayed_source_ids, delay_stages) = self._synapse_io.get_synapses(
-             synapse_info, pre_slices, pre_slice_idx, post_slices,
-             post_slice_index, pre_vertex_slice, post_vertex_slice,
-             app_edge.n_delay_stages, self._poptable_type, n_synapse_types,
-             weight_scales, machine_time_step,
-             app_edge=app_edge, machine_edge=machine_edge)
+         delayed_source_ids, delay_stages) = synapses
 
         if app_edge.delay_edge is not None:
             app_edge.delay_edge.pre_vertex.add_delays(
@@ -950,6 +1041,8 @@ class SynapticManager(object):
 
     def clear_connection_cache(self):
         self._retrieved_blocks = dict()
+        self._region_addresses = dict()
+        self._poptable_type.clear_read_tables()
 
     def get_connections_from_machine(
             self, transceiver, placement, machine_edge, graph_mapper,
@@ -984,7 +1077,8 @@ class SynapticManager(object):
             direct_synapses, key, pre_vertex_slice.n_atoms, synapse_info.index,
             using_extra_monitor_cores, placements, data_receiver,
             sender_extra_monitor_core_placement,
-            extra_monitor_cores_for_router_timeout, fixed_routes)
+            extra_monitor_cores_for_router_timeout,
+            handle_time_out_configuration, fixed_routes)
 
         # Get the block for the connections from the delayed pre_vertex
         delayed_data = None
@@ -1006,10 +1100,116 @@ class SynapticManager(object):
             self._weight_scales[placement], data, delayed_data,
             app_edge.n_delay_stages, machine_time_step)
 
+    def read_connections_from_machine(
+            self, transceiver, placement, machine_edges_and_synapse_infos,
+            graph_mapper, routing_infos, using_extra_monitor_cores,
+            placements=None, data_receiver=None,
+            sender_extra_monitor_core_placement=None,
+            extra_monitor_cores_for_router_timeout=None,
+            handle_time_out_configuration=True, fixed_routes=None):
+        """ Read the synaptic blocks of several machine edges ending at a\
+            placement in as few reads as possible, so that subsequent calls\
+            to :py:meth:`get_connections_from_machine` for these edges do\
+            not need to read from the machine.
+
+        :param machine_edges_and_synapse_infos: \
+            The machine edges and the synapse information of each
+        :type machine_edges_and_synapse_infos: \
+            iterable(tuple(ProjectionMachineEdge, SynapseInformation))
+        """
+        # Work out which blocks are needed and not yet read
+        blocks = list()
+        for machine_edge, synapse_info in machine_edges_and_synapse_infos:
+            app_edge = graph_mapper.get_application_edge(machine_edge)
+            if not isinstance(app_edge, ProjectionApplicationEdge):
+                continue
+            pre_vertex_slice = graph_mapper.get_slice(machine_edge.pre_vertex)
+            key = routing_infos.get_first_key_for_edge(machine_edge)
+            blocks.append((key, pre_vertex_slice.n_atoms, synapse_info.index))
+            if app_edge.delay_edge is not None:
+                delayed_key = self._delay_key_index[
+                    app_edge.pre_vertex, pre_vertex_slice.lo_atom,
+                    pre_vertex_slice.hi_atom].first_key
+                blocks.append((
+                    delayed_key,
+                    pre_vertex_slice.n_atoms * app_edge.n_delay_stages,
+                    synapse_info.index))
+        blocks = [
+            (key, n_rows, index) for key, n_rows, index in blocks
+            if (placement, key, index) not in self._retrieved_blocks]
+        if not blocks:
+            return
+
+        # Find where each block is
+        master_pop_table, direct_synapses, indirect_synapses = \
+            self.__compute_addresses(transceiver, placement)
+        locations = self._poptable_type.extract_synaptic_matrix_data_locations(
+            [key for key, _, _ in blocks], master_pop_table, transceiver,
+            placement.x, placement.y)
+        to_read = list()
+        for (key, n_rows, index), items in zip(blocks, locations):
+            if index >= len(items) or items[index][0] == 0:
+                self._retrieved_blocks[placement, key, index] = (None, None)
+                continue
+            max_row_length, offset, is_single = items[index]
+            if is_single:
+                to_read.append((
+                    direct_synapses + offset, n_rows * 4,
+                    (placement, key, index), n_rows, None))
+            else:
+                to_read.append((
+                    indirect_synapses + offset,
+                    self._synapse_io.get_block_n_bytes(
+                        max_row_length, n_rows),
+                    (placement, key, index), n_rows, max_row_length))
+        if not to_read:
+            return
+
+        # Merge the blocks into reads of ranges of memory
+        to_read.sort(key=lambda block: block[0])
+        reads = list()
+        for address, n_bytes, block_id, n_rows, max_row_length in to_read:
+            if (not reads or
+                    address > reads[-1][1] + _MAX_READ_GAP_BYTES):
+                reads.append([address, address + n_bytes, list()])
+            reads[-1][1] = max(reads[-1][1], address + n_bytes)
+            reads[-1][2].append(
+                (address, n_bytes, block_id, n_rows, max_row_length))
+
+        # if exploiting the extra monitor cores, need to set the machine
+        # for data extraction mode
+        if using_extra_monitor_cores and handle_time_out_configuration:
+            data_receiver.set_cores_for_data_extraction(
+                transceiver, extra_monitor_cores_for_router_timeout,
+                placements)
+
+        for start, end, read_blocks in reads:
+            if using_extra_monitor_cores:
+                data = data_receiver.get_data(
+                    transceiver, sender_extra_monitor_core_placement, start,
+                    end - start, fixed_routes)
+            else:
+                data = transceiver.read_memory(
+                    placement.x, placement.y, start, end - start)
+            for address, n_bytes, block_id, n_rows, max_row_length in \
+                    read_blocks:
+                block = data[address - start:address - start + n_bytes]
+                if max_row_length is None:
+                    block, max_row_length = self.__single_block_to_rows(
+                        block, n_rows)
+                self._retrieved_blocks[block_id] = (block, max_row_length)
+
+        if using_extra_monitor_cores and handle_time_out_configuration:
+            data_receiver.unset_cores_for_data_extraction(
+                transceiver, extra_monitor_cores_for_router_timeout,
+                placements)
+
     def __compute_addresses(self, transceiver, placement):
         """ Helper for computing the addresses of the master pop table and\
             synaptic-matrix-related bits.
         """
+        if placement in self._region_addresses:
+            return self._region_addresses[placement]
         master_pop_table = locate_memory_region_for_placement(
             placement, POPULATION_BASED_REGIONS.POPULATION_TABLE.value,
             transceiver)
@@ -1019,6 +1219,8 @@ class SynapticManager(object):
         direct_synapses = locate_memory_region_for_placement(
             placement, POPULATION_BASED_REGIONS.DIRECT_MATRIX.value,
             transceiver) + 4
+        self._region_addresses[placement] = (
+            master_pop_table, direct_synapses, synaptic_matrix)
         return master_pop_table, direct_synapses, synaptic_matrix
 
     def _retrieve_synaptic_block(
@@ -1112,8 +1314,12 @@ class SynapticManager(object):
         else:
             single_block = transceiver.read_memory(
                 placement.x, placement.y, address, synaptic_block_size)
+        return self.__single_block_to_rows(single_block, n_rows)
 
-        # Convert the block into a set of rows
+    @staticmethod
+    def __single_block_to_rows(single_block, n_rows):
+        """ Convert a block of single synapses into a set of rows
+        """
         numpy_block = numpy.zeros((n_rows, 4), dtype="uint32")
         numpy_block[:, 3] = numpy.asarray(
             single_block, dtype="uint8").view("uint32")
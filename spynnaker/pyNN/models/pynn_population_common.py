@@ -2,6 +2,7 @@ import logging
 import numpy
 from six import string_types, iteritems
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.ranged.abstract_sized import AbstractSized
 from pacman.model.constraints import AbstractConstraint
 from pacman.model.constraints.placer_constraints import ChipAndCoreConstraint
 from pacman.model.constraints.partitioner_constraints import (
@@ -14,6 +15,7 @@ from spinn_front_end_common.abstract_models import AbstractChangableAfterRun
 from spynnaker.pyNN.models.abstract_models import (
     AbstractReadParametersBeforeSet, AbstractContainsUnits,
     AbstractPopulationInitializable, AbstractPopulationSettable)
+from spynnaker.pyNN.models.common import ParameterReader
 from .abstract_pynn_model import AbstractPyNNModel
 
 logger = FormatAdapter(logging.getLogger(__file__))
@@ -25,9 +27,10 @@ class PyNNPopulationCommon(object):
         "_change_requires_mapping",
         "_delay_vertex",
         "_first_id",
-        "_has_read_neuron_parameters_this_run",
         "_label",
         "_last_id",
+        "_machine_vertices_read_this_run",
+        "_parameter_reader",
         "_positions",
         "_record_gsyn_file",
         "_record_spike_file",
@@ -120,7 +123,8 @@ class PyNNPopulationCommon(object):
 
         # parameter
         self._change_requires_mapping = True
-        self._has_read_neuron_parameters_this_run = False
+        self._machine_vertices_read_this_run = set()
+        self._parameter_reader = ParameterReader()
 
         # things for pynn demands
         self._all_ids = numpy.arange(
@@ -156,7 +160,13 @@ class PyNNPopulationCommon(object):
 
     def mark_no_changes(self):
         self._change_requires_mapping = False
-        self._has_read_neuron_parameters_this_run = False
+        self._machine_vertices_read_this_run = set()
+
+    def _clear_parameter_cache(self):
+        """ Forget where the parameters of the vertex are held on the\
+            machine, as the data of the vertex will be loaded again
+        """
+        self._parameter_reader.clear_cache()
 
     def __add__(self, other):
         """ Merges populations
@@ -325,8 +335,10 @@ class PyNNPopulationCommon(object):
         # Doesn't make much sense on SpiNNaker
         return self._size
 
-    def _set_check(self, parameter, value):
+    def _set_check(self, parameter, value, selector=None):
         """ Checks for various set methods.
+
+        :param selector: The neurons that are to be set, or None for all
         """
         if not self._vertex_population_settable:
             raise KeyError("Population does not have property {}".format(
@@ -345,7 +357,7 @@ class PyNNPopulationCommon(object):
                 "Parameter must either be the name of a single parameter to"
                 " set, or a dict of parameter: value items to set")
 
-        self._read_parameters_before_set()
+        self._read_parameters_before_set(selector)
 
     def set(self, parameter, value=None):
         """ Set one or more parameters for every cell in the population.
@@ -390,7 +402,7 @@ class PyNNPopulationCommon(object):
         :param parameter: the parameter to set
         :param value: the value of the parameter to set.
         """
-        self._set_check(parameter, value)
+        self._set_check(parameter, value, selector)
 
         # set new parameters
         if type(parameter) is str:
@@ -399,48 +411,73 @@ class PyNNPopulationCommon(object):
             for (key, value) in parameter.iteritems():
                 self._vertex.set_value_by_selector(selector, key, value)
 
-    def _read_parameters_before_set(self):
-        """ Reads parameters from the machine before "set" completes
+    def _read_parameters_before_set(self, selector=None):
+        """ Reads parameters from the machine before "set" completes.  Only\
+            the cores holding the selected neurons are read, and each core is\
+            read at most once per run.
 
+        :param selector: The neurons that are to be set, or None for all
         :return: None
         """
 
-        # If the tools have run before, and not reset, and the read
-        # hasn't already been done, read back the data
+        # If the tools have run before, and not reset, read back the data
+        # of the cores that haven't already been read
         if globals_variables.get_simulator().has_ran \
                 and not globals_variables.get_simulator().has_reset_last \
                 and self._vertex_read_parameters_before_set \
-                and not self._has_read_neuron_parameters_this_run \
                 and not globals_variables.get_simulator().use_virtual_board:
-            # locate machine vertices from the application vertices
-            machine_vertices = globals_variables.get_simulator().graph_mapper\
-                .get_machine_vertices(self._vertex)
+            graph_mapper = globals_variables.get_simulator().graph_mapper
+
+            # Find the neurons that are to be set
+            ids = None
+            if selector is not None:
+                ids = numpy.unique(numpy.array(
+                    AbstractSized(self._vertex.n_atoms).selector_to_ids(
+                        selector), dtype="int64"))
+
+            # go through each machine vertex and find those whose neuron
+            # parameters are to be read
+            placements_and_slices = list()
+            for machine_vertex in graph_mapper.get_machine_vertices(
+                    self._vertex):
+                if machine_vertex in self._machine_vertices_read_this_run:
+                    continue
+
+                # Skip cores without any of the neurons to be set, as these
+                # won't be reloaded
+                vertex_slice = graph_mapper.get_slice(machine_vertex)
+                if ids is not None and not numpy.any(
+                        (ids >= vertex_slice.lo_atom) &
+                        (ids <= vertex_slice.hi_atom)):
+                    continue
 
-            # go through each machine vertex and read the neuron parameters
-            # it contains
-            for machine_vertex in machine_vertices:
-
-                # tell the core to rewrite neuron params back to the
-                # SDRAM space.
                 placement = globals_variables.get_simulator().placements.\
                     get_placement_of_vertex(machine_vertex)
+                placements_and_slices.append((placement, vertex_slice))
+                self._machine_vertices_read_this_run.add(machine_vertex)
 
-                self._vertex.read_parameters_from_machine(
-                    globals_variables.get_simulator().transceiver, placement,
-                    globals_variables.get_simulator().graph_mapper.get_slice(
-                        machine_vertex))
-
-            self._has_read_neuron_parameters_this_run = True
+            # read the neuron parameters of the cores
+            self._parameter_reader.read_parameters(
+                globals_variables.get_simulator().transceiver, self._vertex,
+                placements_and_slices)
 
-    def get_spike_counts(self, spikes, gather=True):
+    def get_spike_counts(self, spikes, gather=True, as_array=False):
         """ Return the number of spikes for each neuron.
+
+        :param spikes: the neuron index and time of each spike
+        :param gather: ignored, as all the spikes are always gathered
+        :param as_array: \
+            If True, return an array of the number of spikes of each neuron\
+            by index, rather than a dictionary; the ID of each neuron is\
+            given by :py:meth:`index_to_id`
+        :return: the number of spikes of each neuron by index
+        :rtype: dict(int, int) or numpy.ndarray
         """
-        n_spikes = {}
         counts = numpy.bincount(spikes[:, 0].astype(dtype=numpy.int32),
                                 minlength=self._vertex.n_atoms)
-        for i in range(self._vertex.n_atoms):
-            n_spikes[i] = counts[i]
-        return n_spikes
+        if as_array:
+            return counts
+        return dict(enumerate(counts.tolist()))
 
     @property
     def positions(self):
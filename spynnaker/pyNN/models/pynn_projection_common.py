@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import logging
 import math
 from spinn_utilities.progress_bar import ProgressBar
@@ -71,6 +72,7 @@ class PyNNProjectionCommon(object):
         connector.set_projection_information(
             pre_synaptic_population, post_synaptic_population, rng,
             machine_time_step)
+        connector.add_projection(self._synapse_information)
 
         # handle max delay
         max_delay = synapse_dynamics_stdp.get_delay_maximum(
@@ -230,7 +232,26 @@ class PyNNProjectionCommon(object):
 
     def _get_synaptic_data(
             self, as_list, data_to_get, fixed_values=None, notify=None,
-            handle_time_out_configuration=True):
+            handle_time_out_configuration=True, as_sparse=False, sort=True):
+        """ Get the connections of the projection in a connection holder
+
+        :param as_list:\
+            True if the data is to be returned as a list, False if it is to\
+            be returned as matrices
+        :param data_to_get: The fields of the connections to return
+        :param fixed_values:\
+            Fields with the same value for every connection, as a list of\
+            tuples of (field name, value)
+        :param notify: A callback to call when the connections are ready
+        :param handle_time_out_configuration:\
+            Whether to set the extra monitor cores up for data extraction
+        :param as_sparse:\
+            True if matrices are to be sparse, with the values of connections\
+            with the same source and target summed
+        :param sort:\
+            True if a list is to be sorted by source and then target
+        :rtype: ConnectionHolder
+        """
         # pylint: disable=too-many-arguments
         post_vertex = self._projection_edge.post_vertex
         pre_vertex = self._projection_edge.pre_vertex
@@ -242,15 +263,14 @@ class PyNNProjectionCommon(object):
             connection_holder = ConnectionHolder(
                 data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
                 self._virtual_connection_list, fixed_values=fixed_values,
-                notify=notify)
+                notify=notify, as_sparse=as_sparse, sort=sort)
             connection_holder.finish()
             return connection_holder
 
         # if not virtual board, make connection holder to be filled in at
         # possible later date
-        connection_holder = ConnectionHolder(
-            data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
-            fixed_values=fixed_values, notify=notify)
+        connection_holder = self._get_connection_holder(
+            as_list, data_to_get, fixed_values, notify, as_sparse, sort)
 
         # If we haven't run, add the holder to get connections, and return it
         # and set up a callback for after run to fill in this connection holder
@@ -262,16 +282,54 @@ class PyNNProjectionCommon(object):
 
         # Otherwise, get the connections now, as we have ran and therefore can
         # get them
-        self.__get_projection_data(
-            data_to_get, pre_vertex, post_vertex, connection_holder,
+        self._get_projections_data(
+            self._spinnaker_control, [(self, [connection_holder])],
+            "Getting {}s for projection between {} and {}".format(
+                data_to_get, pre_vertex.label, post_vertex.label),
             handle_time_out_configuration)
         return connection_holder
 
-    def __get_projection_data(
-            self, data_to_get, pre_vertex, post_vertex, connection_holder,
+    def _get_connection_holder(
+            self, as_list, data_to_get, fixed_values=None, notify=None,
+            as_sparse=False, sort=True):
+        """ Get an empty connection holder for the connections of this\
+            projection
+        """
+        # pylint: disable=too-many-arguments
+        return ConnectionHolder(
+            data_to_get, as_list, self._projection_edge.pre_vertex.n_atoms,
+            self._projection_edge.post_vertex.n_atoms,
+            fixed_values=fixed_values, notify=notify, as_sparse=as_sparse,
+            sort=sort)
+
+    def _requires_reading_from_machine(self):
+        """ Determine if getting the connections of this projection now would\
+            read them from the machine
+
+        :rtype: bool
+        """
+        return (self._virtual_connection_list is None and
+                self._spinnaker_control.has_ran)
+
+    @staticmethod
+    def _get_projections_data(
+            ctl, projection_holders, progress_label,
             handle_time_out_configuration):
-        # pylint: disable=too-many-arguments, too-many-locals
-        ctl = self._spinnaker_control
+        """ Read the connections of several projections from the machine,\
+            reading the blocks of all the projections ending at each core\
+            together, and fill in the connection holders of each projection
+
+        :param ctl: The simulator the projections are in
+        :param projection_holders: \
+            The projections with a list of connection holders of each, which\
+            are all filled in with the connections of the projection
+        :type projection_holders: \
+            list(tuple(PyNNProjectionCommon, list(ConnectionHolder)))
+        :param progress_label: The label of the progress bar
+        :param handle_time_out_configuration: \
+            Whether to set the extra monitor cores up for data extraction
+        """
+        # pylint: disable=too-many-locals
 
         # if using extra monitor functionality, locate extra data items
         if ctl.get_generated_output("UsingAdvancedMonitorSupport"):
@@ -286,13 +344,21 @@ class PyNNProjectionCommon(object):
             receivers = None
             extra_monitor_placements = None
 
-        edges = ctl.graph_mapper.get_machine_edges(self._projection_edge)
-        progress = ProgressBar(
-            edges, "Getting {}s for projection between {} and {}".format(
-                data_to_get, pre_vertex.label, post_vertex.label))
-        for edge in progress.over(edges):
-            placement = ctl.placements.get_placement_of_vertex(
-                edge.post_vertex)
+        # Group the machine edges of the projections by the placement of the
+        # core they end at
+        placement_edges = OrderedDict()
+        for projection, holders in projection_holders:
+            edges = ctl.graph_mapper.get_machine_edges(
+                projection._projection_edge)
+            for edge in edges:
+                placement = ctl.placements.get_placement_of_vertex(
+                    edge.post_vertex)
+                placement_edges.setdefault(placement, list()).append(
+                    (edge, projection, holders))
+
+        progress = ProgressBar(len(placement_edges), progress_label)
+        for placement, edges in progress.over(placement_edges.items()):
+            post_vertex = edges[0][1]._projection_edge.post_vertex
 
             # if using extra monitor data extractor find local receiver
             if extra_monitors is not None:
@@ -308,16 +374,30 @@ class PyNNProjectionCommon(object):
                 receiver = None
                 sender_monitor_place = None
 
-            connections = post_vertex.get_connections_from_machine(
-                ctl.transceiver, placement, edge, ctl.graph_mapper,
-                ctl.routing_infos, self._synapse_information,
-                ctl.machine_time_step, extra_monitors is not None,
-                ctl.placements, receiver, sender_monitor_place,
-                extra_monitors, handle_time_out_configuration,
-                ctl.fixed_routes)
-            if connections is not None:
-                connection_holder.add_connections(connections)
-        connection_holder.finish()
+            post_vertex.read_connections_from_machine(
+                ctl.transceiver, placement, [
+                    (edge, projection._synapse_information)
+                    for edge, projection, _ in edges],
+                ctl.graph_mapper, ctl.routing_infos,
+                extra_monitors is not None, ctl.placements, receiver,
+                sender_monitor_place, extra_monitors,
+                handle_time_out_configuration, ctl.fixed_routes)
+
+            for edge, projection, holders in edges:
+                connections = post_vertex.get_connections_from_machine(
+                    ctl.transceiver, placement, edge, ctl.graph_mapper,
+                    ctl.routing_infos, projection._synapse_information,
+                    ctl.machine_time_step, extra_monitors is not None,
+                    ctl.placements, receiver, sender_monitor_place,
+                    extra_monitors, handle_time_out_configuration,
+                    ctl.fixed_routes)
+                if connections is not None:
+                    for connection_holder in holders:
+                        connection_holder.add_connections(connections)
+
+        for _, holders in projection_holders:
+            for connection_holder in holders:
+                connection_holder.finish()
 
     def _clear_cache(self):
         post_vertex = self._projection_edge.post_vertex
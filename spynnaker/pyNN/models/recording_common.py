@@ -1,7 +1,6 @@
 from collections import defaultdict
 import logging
 import numpy
-from six.moves import xrange
 from spinn_utilities import logger_utils
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.timer import Timer
@@ -42,6 +41,11 @@ class RecordingCommon(object):
         self._indices_to_record = defaultdict(
             lambda: numpy.repeat(False, population.size))
 
+        # The data extracted of each variable, by variable name, with the
+        # number of resets, of clears of the recording and of machine time
+        # steps when it was extracted
+        self._extracted_data = dict()
+
     def _record(self, variable, sampling_interval=None, to_file=None,
                 indexes=None):
         """ Tell the vertex to record data.
@@ -54,6 +58,7 @@ class RecordingCommon(object):
         """
 
         get_simulator().verify_not_running()
+        self._clear_extracted_data([variable])
         # tell vertex its recording
         if variable == "spikes":
             if not isinstance(self._population._vertex,
@@ -102,31 +107,49 @@ class RecordingCommon(object):
         """
 
     @staticmethod
-    def pynn7_format(data, ids, sampling_interval, data2=None):
+    def pynn7_format(data, ids, sampling_interval, data2=None,
+                     structured=False):
+        """ Convert data in matrix format to the PyNN 0.7 format of a row\
+            per neuron per sampled time step, ordered by neuron and then time
+
+        :param data: the data, with a row per time step and a column per\
+            neuron
+        :param ids: the neuron ID of each column
+        :param sampling_interval: the time between the rows
+        :param data2: more data in the same format as data, or None
+        :param structured: \
+            If True, return a structured array with fields "id", "time",\
+            "data" and, if data2 is given, "data2", rather than a 2D array\
+            of floats
+        :rtype: numpy.ndarray
+        """
         n_machine_time_steps = len(data)
         n_neurons = len(ids)
         column_length = n_machine_time_steps * n_neurons
-        times = [i * sampling_interval
-                 for i in xrange(0, n_machine_time_steps)]
-        if data2 is None:
-            pynn7 = numpy.column_stack((
-                numpy.repeat(ids, n_machine_time_steps, 0),
-                numpy.tile(times, n_neurons),
-                numpy.transpose(data).reshape(column_length)))
-        else:
-            pynn7 = numpy.column_stack((
-                numpy.repeat(ids, n_machine_time_steps, 0),
-                numpy.tile(times, n_neurons),
-                numpy.transpose(data).reshape(column_length),
-                numpy.transpose(data2).reshape(column_length)))
+        times = numpy.arange(n_machine_time_steps) * sampling_interval
+        columns = [
+            numpy.repeat(ids, n_machine_time_steps, 0),
+            numpy.tile(times, n_neurons),
+            numpy.transpose(data).reshape(column_length)]
+        if data2 is not None:
+            columns.append(numpy.transpose(data2).reshape(column_length))
+        if not structured:
+            return numpy.column_stack(columns)
+
+        names = ["id", "time", "data", "data2"][:len(columns)]
+        pynn7 = numpy.empty(column_length, dtype=[
+            (name, column.dtype) for name, column in zip(names, columns)])
+        for name, column in zip(names, columns):
+            pynn7[name] = column
         return pynn7
 
-    def _get_recorded_pynn7(self, variable):
+    def _get_recorded_pynn7(self, variable, structured=False):
         if variable == "spikes":
             data = self._get_spikes()
 
         (data, ids, sampling_interval) = self._get_recorded_matrix(variable)
-        return self.pynn7_format(data, ids, sampling_interval)
+        return self.pynn7_format(
+            data, ids, sampling_interval, structured=structured)
 
     def _get_recorded_matrix(self, variable):
         """ Perform safety checks and get the recorded data from the vertex\
@@ -175,15 +198,69 @@ class RecordingCommon(object):
         else:
             # assuming we got here, everything is ok, so we should go get the
             # data
-            results = self._population._vertex.get_data(
-                variable, sim.no_machine_time_steps, sim.placements,
-                sim.graph_mapper, sim.buffer_manager, sim.machine_time_step)
+            vertex = self._population._vertex
+            results = self.__get_extracted(
+                variable, vertex.get_n_recording_clears(variable),
+                lambda: vertex.get_data(
+                    variable, sim.no_machine_time_steps, sim.placements,
+                    sim.graph_mapper, sim.buffer_manager,
+                    sim.machine_time_step),
+                lambda first_machine_time_step: vertex.get_data_since(
+                    variable, first_machine_time_step,
+                    sim.no_machine_time_steps, sim.placements,
+                    sim.graph_mapper, sim.buffer_manager,
+                    sim.machine_time_step),
+                self.__append_rows)
             (data, indexes, sampling_interval) = results
 
         get_simulator().add_extraction_timing(
             timer.take_sample())
         return (data, indexes, sampling_interval)
 
+    def _iter_recorded_matrix(self, variable, chunk_steps):
+        """ Perform safety checks and get the recorded data from the vertex\
+            in matrix format, in blocks of time steps so that only one block\
+            is held in memory at once.
+
+        :param variable: the variable name to read. supported variable names
+            are :'gsyn_exc', 'gsyn_inh', 'v'
+        :param chunk_steps: \
+            the number of machine time steps of data in each block
+        :return: a generator of tuples of the data of each block, the neuron\
+            IDs of the columns, the sampling interval and the time in\
+            machine time steps of the first row of the block
+        """
+        sim = get_simulator()
+        sim.verify_not_running()
+
+        # check that we're in a state to get the data
+        if not isinstance(
+                self._population._vertex, AbstractNeuronRecordable):
+            raise ConfigurationException(
+                "This population has not got the capability to record {}"
+                .format(variable))
+
+        if not self._population._vertex.is_recording(variable):
+            raise ConfigurationException(
+                "This population has not been set to record {}"
+                .format(variable))
+
+        if not sim.has_ran:
+            logger.warning(
+                "The simulation has not yet run, therefore {} cannot"
+                " be retrieved, hence there will be no data".format(variable))
+            return iter(())
+        if sim.use_virtual_board:
+            logger.warning(
+                "The simulation is using a virtual machine and so has not"
+                " truly ran, hence there will be no data")
+            return iter(())
+
+        return self._population._vertex.iter_data(
+            variable, sim.no_machine_time_steps, sim.placements,
+            sim.graph_mapper, sim.buffer_manager, sim.machine_time_step,
+            chunk_steps)
+
     def _get_spikes(self):
         """ How to get spikes from a vertex.
 
@@ -213,15 +290,108 @@ class RecordingCommon(object):
 
         # assuming we got here, everything is OK, so we should go get the
         # spikes
-        return self._population._vertex.get_spikes(
-            sim.placements, sim.graph_mapper, sim.buffer_manager,
-            sim.machine_time_step)
+        vertex = self._population._vertex
+        return self.__get_extracted(
+            "spikes", vertex.get_n_spike_recording_clears(),
+            lambda: vertex.get_spikes(
+                sim.placements, sim.graph_mapper, sim.buffer_manager,
+                sim.machine_time_step),
+            lambda first_machine_time_step: vertex.get_spikes_since(
+                first_machine_time_step, sim.placements, sim.graph_mapper,
+                sim.buffer_manager, sim.machine_time_step),
+            self.__append_spikes)
+
+    def __get_extracted(
+            self, variable, n_clears, extract, extract_since, append):
+        """ Get the data of a variable, reusing the data extracted before\
+            if there has been no reset or clear of the recording since.\
+            After a continued run, only the data recorded by the new run is\
+            extracted.
+
+        :param variable: the variable name of the data
+        :param n_clears: the number of times the recording of the variable\
+            has been cleared, or None if not known, in which case the data\
+            is always extracted again
+        :param extract: function to extract all of the data
+        :param extract_since: \
+            function to extract the data from a machine time step onwards
+        :param append: \
+            function to add newly extracted data to that extracted before
+        :return: a copy of the data, so that changing it does not change\
+            the data kept for later calls
+        """
+        sim = get_simulator()
+        n_resets = sim.n_resets
+        n_machine_time_steps = sim.no_machine_time_steps
+        result = None
+        if variable in self._extracted_data and n_clears is not None:
+            extracted_resets, extracted_clears, extracted_steps, extracted = \
+                self._extracted_data[variable]
+            if (extracted_resets == n_resets and
+                    extracted_clears == n_clears and
+                    n_machine_time_steps is not None):
+                if extracted_steps == n_machine_time_steps:
+                    return self.__copy_extracted(extracted)
+                if extracted_steps < n_machine_time_steps:
+                    result = append(extracted, extract_since(extracted_steps))
+        if result is None:
+            result = extract()
+        self._extracted_data[variable] = (
+            n_resets, n_clears, n_machine_time_steps, result)
+        return self.__copy_extracted(result)
+
+    @staticmethod
+    def __copy_extracted(extracted):
+        """ Copy the arrays and lists of extracted data, so that the caller\
+            can change them
+        """
+        if isinstance(extracted, tuple):
+            return tuple(
+                RecordingCommon.__copy_extracted(item) for item in extracted)
+        if isinstance(extracted, numpy.ndarray):
+            return extracted.copy()
+        if isinstance(extracted, list):
+            return list(extracted)
+        return extracted
+
+    @staticmethod
+    def __append_rows(extracted, new):
+        """ Add rows of matrix data to the rows extracted before
+        """
+        data, indexes, sampling_interval = new
+        if data is not None and extracted[0] is not None:
+            data = numpy.concatenate((extracted[0], data))
+        return (data, indexes, sampling_interval)
+
+    @staticmethod
+    def __append_spikes(extracted, new):
+        """ Add spikes to the spikes extracted before, keeping the order of\
+            neuron ID and then time
+        """
+        spikes = numpy.concatenate((extracted, new))
+
+        # The new spikes are all later than those before, so a stable sort
+        # on the ID keeps the times of each ID in order
+        return spikes[numpy.argsort(spikes[:, 0], kind="mergesort")]
+
+    def _clear_extracted_data(self, variables=None):
+        """ Forget the data extracted of some variables, so that it is\
+            extracted again when next asked for
+
+        :param variables: the variables to forget, or None for all
+        """
+        if variables is None:
+            self._extracted_data.clear()
+        else:
+            for variable in variables:
+                self._extracted_data.pop(variable, None)
 
     def _turn_off_all_recording(self, indexes=None):
         """ Turns off recording, is used by a pop saying `.record()`
 
         :rtype: None
         """
+        self._clear_extracted_data()
 
         # check for standard record which includes spikes
         if isinstance(self._population._vertex, AbstractNeuronRecordable):
@@ -62,6 +62,7 @@ class SpikeSourceArrayVertex(
 
         # handle recording
         self._spike_recorder = EIEIOSpikeRecorder()
+        self._n_spike_recording_clears = 0
         self._spike_recorder_buffer_size = spike_recorder_buffer_size
         self._buffer_size_before_receive = buffer_size_before_receive
 
@@ -161,6 +162,11 @@ class SpikeSourceArrayVertex(
             buffer_manager.clear_recorded_data(
                 placement.x, placement.y, placement.p,
                 SpikeSourceArrayVertex.SPIKE_RECORDING_REGION_ID)
+        self._n_spike_recording_clears += 1
+
+    @overrides(AbstractSpikeRecordable.get_n_spike_recording_clears)
+    def get_n_spike_recording_clears(self):
+        return self._n_spike_recording_clears
 
     @staticmethod
     def set_model_max_atoms_per_core(new_value=sys.maxsize):
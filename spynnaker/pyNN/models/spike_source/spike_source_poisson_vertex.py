@@ -19,11 +19,14 @@ from spinn_front_end_common.abstract_models.impl import (
 from spinn_front_end_common.interface.simulation import simulation_utilities
 from spinn_front_end_common.interface.buffer_management import (
     recording_utilities)
+from spinn_front_end_common.interface.provenance import (
+    AbstractProvidesLocalProvenanceData)
 from spinn_front_end_common.utilities import (
     helpful_functions, globals_variables)
 from spinn_front_end_common.utilities.constants import (
     SYSTEM_BYTES_REQUIREMENT, SARK_PER_MALLOC_SDRAM_USAGE)
-from spinn_front_end_common.utilities.utility_objs import ExecutableType
+from spinn_front_end_common.utilities.utility_objs import (
+    ExecutableType, ProvenanceDataItem)
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, MultiSpikeRecorder, SimplePopulationSettable)
@@ -72,7 +75,7 @@ class SpikeSourcePoissonVertex(
         AbstractProvidesOutgoingPartitionConstraints,
         AbstractChangableAfterRun, AbstractReadParametersBeforeSet,
         AbstractRewritesDataSpecification, SimplePopulationSettable,
-        ProvidesKeyToAtomMappingImpl):
+        ProvidesKeyToAtomMappingImpl, AbstractProvidesLocalProvenanceData):
     """ A Poisson Spike source object
     """
 
@@ -100,11 +103,24 @@ class SpikeSourcePoissonVertex(
 
         # check for changes parameters
         self._change_requires_mapping = True
-        self._change_requires_neuron_parameters_reload = False
 
         # Store the parameters
         self._rate = utility_calls.convert_param_to_numpy(rate, n_neurons)
+
+        # The sources whose parameters have changed since they were last
+        # written, and the time between spikes last written for each slice
+        self._changed_atoms = numpy.zeros(n_neurons, dtype="bool")
+        self._written_time_between_spikes = dict()
+
+        # The number of times that the parameters of a core have been read
+        # back and reloaded after the first run
+        self._n_parameter_readbacks = 0
+        self._n_parameter_reloads = 0
         self._rate_change = numpy.zeros(self._rate.size)
+
+        # Statistics of the rates, which are expensive to compute, stored
+        # until the rates change
+        self._rate_stats = dict()
         self._start = utility_calls.convert_param_to_numpy(start, n_neurons)
         self._duration = utility_calls.convert_param_to_numpy(
             duration, n_neurons)
@@ -114,6 +130,7 @@ class SpikeSourcePoissonVertex(
 
         # Prepare for recording, and to get spikes
         self._spike_recorder = MultiSpikeRecorder()
+        self._n_spike_recording_clears = 0
         self._time_between_requests = config.getint(
             "Buffers", "time_between_requests")
         self._receive_buffer_host = config.get(
@@ -143,15 +160,16 @@ class SpikeSourcePoissonVertex(
     def mark_no_changes(self):
         self._change_requires_mapping = False
 
-    @overrides(SimplePopulationSettable.set_value)
-    def set_value(self, key, value):
-        SimplePopulationSettable.set_value(self, key, value)
-        self._change_requires_neuron_parameters_reload = True
-
     def _max_spikes_per_ts(
             self, vertex_slice, n_machine_time_steps, machine_time_step):
+        stats_key = ("max_spikes_per_ts", vertex_slice.lo_atom,
+                     vertex_slice.hi_atom, n_machine_time_steps,
+                     machine_time_step)
+        if stats_key in self._rate_stats:
+            return self._rate_stats[stats_key]
         max_rate = numpy.amax(self._rate[vertex_slice.as_slice])
         if max_rate == 0:
+            self._rate_stats[stats_key] = 0
             return 0
         ts_per_second = MICROSECONDS_PER_SECOND / float(machine_time_step)
         chance_ts = n_machine_time_steps
@@ -160,7 +178,42 @@ class SpikeSourcePoissonVertex(
         max_spikes_per_ts = scipy.stats.poisson.ppf(
             1.0 - (1.0 / float(chance_ts)),
             float(max_rate) / ts_per_second)
-        return int(math.ceil(max_spikes_per_ts)) + 1.0
+        self._rate_stats[stats_key] = int(math.ceil(max_spikes_per_ts)) + 1.0
+        return self._rate_stats[stats_key]
+
+    @property
+    def max_rate(self):
+        """ The highest rate of any source in the population
+        """
+        if "max_rate" not in self._rate_stats:
+            self._rate_stats["max_rate"] = numpy.amax(self._rate)
+        return self._rate_stats["max_rate"]
+
+    def get_max_spikes_per_tick(self, probability, machine_time_step):
+        """ Get the number of spikes in a time step that the source with the\
+            highest rate will not exceed with the given probability
+
+        :param probability: the probability of not exceeding the value
+        :param machine_time_step: the time step of the simulation in\
+            microseconds
+        :rtype: float
+        """
+        stats_key = ("max_spikes_per_tick", probability, machine_time_step)
+        if stats_key not in self._rate_stats:
+            steps_per_second = (
+                MICROSECONDS_PER_SECOND / float(machine_time_step))
+            self._rate_stats[stats_key] = scipy.stats.poisson.ppf(
+                probability, self.max_rate / steps_per_second)
+        return self._rate_stats[stats_key]
+
+    def _get_total_max_spikes(self):
+        """ Get the sum over the sources of the number of spikes that each\
+            source will not exceed in a second with probability 1 - 1 / rate
+        """
+        if "total_max_spikes" not in self._rate_stats:
+            self._rate_stats["total_max_spikes"] = numpy.sum(
+                scipy.stats.poisson.ppf(1.0 - (1.0 / self._rate), self._rate))
+        return self._rate_stats["total_max_spikes"]
 
     @inject_items({
         "n_machine_time_steps": "TotalMachineTimeSteps",
@@ -233,7 +286,9 @@ class SpikeSourcePoissonVertex(
     def rate(self, rate):
         new_rate = utility_calls.convert_param_to_numpy(rate, self._n_atoms)
         self._rate_change = new_rate - self._rate
+        self._mark_changed(self._rate, new_rate)
         self._rate = new_rate
+        self._rate_stats = dict()
 
     @property
     def start(self):
@@ -241,8 +296,9 @@ class SpikeSourcePoissonVertex(
 
     @start.setter
     def start(self, start):
-        self._start = utility_calls.convert_param_to_numpy(
-            start, self._n_atoms)
+        new_start = utility_calls.convert_param_to_numpy(start, self._n_atoms)
+        self._mark_changed(self._start, new_start)
+        self._start = new_start
 
     @property
     def duration(self):
@@ -250,8 +306,61 @@ class SpikeSourcePoissonVertex(
 
     @duration.setter
     def duration(self, duration):
-        self._duration = utility_calls.convert_param_to_numpy(
+        new_duration = utility_calls.convert_param_to_numpy(
             duration, self._n_atoms)
+        self._mark_changed(self._duration, new_duration)
+        self._duration = new_duration
+
+    def _mark_changed(self, old_values, new_values):
+        """ Record the sources whose values of a parameter have changed
+
+        :param old_values: The values of the parameter before the change
+        :param new_values: The values of the parameter after the change
+        """
+        self._changed_atoms |= ~(
+            (old_values == new_values) |
+            (numpy.isnan(old_values) & numpy.isnan(new_values)))
+
+    def _is_slice_changed(
+            self, vertex_slice, machine_time_step, time_scale_factor):
+        """ Determine if the parameters of a slice must be rewritten, either\
+            because the parameters of a source have changed, or because the\
+            sources must now send spikes more quickly than the time between\
+            spikes last written allows
+
+        :param vertex_slice: The slice of the sources
+        :rtype: bool
+        """
+        if self._changed_atoms[vertex_slice.as_slice].any():
+            return True
+        written = self._written_time_between_spikes.get(
+            (vertex_slice.lo_atom, vertex_slice.hi_atom))
+        return written is None or written > self._get_time_between_spikes(
+            machine_time_step, time_scale_factor)
+
+    def _get_time_between_spikes(self, machine_time_step, time_scale_factor):
+        """ Get the number of microseconds between sending spikes
+
+        :rtype: int
+        """
+        if numpy.sum(self._rate) <= 0:
+
+            # If the rate is 0 or less, set a "time between spikes" of 1
+            # to ensure that some time is put between spikes in event
+            # of a rate change later on
+            return 1
+        max_spikes = self._get_total_max_spikes()
+        spikes_per_timestep = (
+            max_spikes / (MICROSECONDS_PER_SECOND // machine_time_step))
+        # avoid a possible division by zero / small number (which may
+        # result in a value that doesn't fit in a uint32) by only
+        # setting time_between_spikes if spikes_per_timestep is > 1
+        time_between_spikes = 1.0
+        if spikes_per_timestep > 1:
+            time_between_spikes = (
+                (machine_time_step * time_scale_factor) /
+                (spikes_per_timestep * 2.0))
+        return int(time_between_spikes)
 
     @property
     def seed(self):
@@ -365,27 +474,11 @@ class SpikeSourcePoissonVertex(
         self._n_data_specs += 1
 
         # Write the number of microseconds between sending spikes
-        total_mean_rate = numpy.sum(self._rate)
-        if total_mean_rate > 0:
-            max_spikes = numpy.sum(scipy.stats.poisson.ppf(
-                1.0 - (1.0 / self._rate), self._rate))
-            spikes_per_timestep = (
-                max_spikes / (MICROSECONDS_PER_SECOND // machine_time_step))
-            # avoid a possible division by zero / small number (which may
-            # result in a value that doesn't fit in a uint32) by only
-            # setting time_between_spikes if spikes_per_timestep is > 1
-            time_between_spikes = 1.0
-            if spikes_per_timestep > 1:
-                time_between_spikes = (
-                    (machine_time_step * time_scale_factor) /
-                    (spikes_per_timestep * 2.0))
-            spec.write_value(data=int(time_between_spikes))
-        else:
-
-            # If the rate is 0 or less, set a "time between spikes" of 1
-            # to ensure that some time is put between spikes in event
-            # of a rate change later on
-            spec.write_value(data=1)
+        time_between_spikes = self._get_time_between_spikes(
+            machine_time_step, time_scale_factor)
+        spec.write_value(data=time_between_spikes)
+        self._written_time_between_spikes[
+            vertex_slice.lo_atom, vertex_slice.hi_atom] = time_between_spikes
 
         # Write the number of seconds per timestep (unsigned long fract)
         spec.write_value(
@@ -473,6 +566,9 @@ class SpikeSourcePoissonVertex(
 
         spec.write_array(data)
 
+        # The parameters of the slice now match those on the machine
+        self._changed_atoms[vertex_slice.as_slice] = False
+
     @staticmethod
     def _convert_ms_to_n_timesteps(value, machine_time_step):
         return numpy.round(
@@ -550,6 +646,15 @@ class SpikeSourcePoissonVertex(
             self, spec, placement, machine_time_step, time_scale_factor,
             graph_mapper, routing_info, graph):
         # pylint: disable=too-many-arguments, arguments-differ
+        vertex_slice = graph_mapper.get_slice(placement.vertex)
+
+        # If nothing on this core has changed, write no regions, so that
+        # nothing is written to the machine
+        if not self._is_slice_changed(
+                vertex_slice, machine_time_step, time_scale_factor):
+            spec.end_specification()
+            return
+        self._n_parameter_reloads += 1
 
         # reserve the neuron parameters data region
         self._reserve_poisson_params_region(placement, graph_mapper, spec)
@@ -557,8 +662,7 @@ class SpikeSourcePoissonVertex(
         # allocate parameters
         self._write_poisson_parameters(
             spec=spec, graph=graph, placement=placement,
-            routing_info=routing_info,
-            vertex_slice=graph_mapper.get_slice(placement.vertex),
+            routing_info=routing_info, vertex_slice=vertex_slice,
             machine_time_step=machine_time_step,
             time_scale_factor=time_scale_factor)
 
@@ -568,40 +672,45 @@ class SpikeSourcePoissonVertex(
     @overrides(AbstractRewritesDataSpecification
                .requires_memory_regions_to_be_reloaded)
     def requires_memory_regions_to_be_reloaded(self):
-        return self._change_requires_neuron_parameters_reload
+        return bool(self._changed_atoms.any())
 
     @overrides(AbstractRewritesDataSpecification.mark_regions_reloaded)
     def mark_regions_reloaded(self):
-        self._change_requires_neuron_parameters_reload = False
+        self._changed_atoms[:] = False
 
     @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
     def read_parameters_from_machine(
             self, transceiver, placement, vertex_slice):
+        region, offset, n_bytes = self.get_parameters_location(vertex_slice)
 
         # locate sdram address to where the neuron parameters are stored
         poisson_parameter_region_sdram_address = \
             helpful_functions.locate_memory_region_for_placement(
-                placement, _REGIONS.POISSON_PARAMS_REGION.value, transceiver)
+                placement, region, transceiver)
+
+        # get data from the machine
+        byte_array = transceiver.read_memory(
+            placement.x, placement.y,
+            poisson_parameter_region_sdram_address + offset, n_bytes)
+        self.update_parameters_from_data(byte_array, vertex_slice)
+
+    @overrides(AbstractReadParametersBeforeSet.get_parameters_location)
+    def get_parameters_location(self, vertex_slice):
 
         # shift past the extra stuff before neuron parameters that we don't
         # need to read
-        poisson_parameter_parameters_sdram_address = \
-            poisson_parameter_region_sdram_address + \
-            START_OF_POISSON_GENERATOR_PARAMETERS
-
-        # get size of poisson params
         size_of_region = self.get_params_bytes(vertex_slice)
         size_of_region -= START_OF_POISSON_GENERATOR_PARAMETERS
+        return (_REGIONS.POISSON_PARAMS_REGION.value,
+                START_OF_POISSON_GENERATOR_PARAMETERS, size_of_region)
 
-        # get data from the machine
-        byte_array = transceiver.read_memory(
-            placement.x, placement.y,
-            poisson_parameter_parameters_sdram_address, size_of_region)
+    @overrides(AbstractReadParametersBeforeSet.update_parameters_from_data)
+    def update_parameters_from_data(self, data, vertex_slice):
 
         # Convert the data to parameter values
         (start, end, is_fast_source, exp_minus_lambda, isi,
          time_to_next_spike) = _PoissonStruct.read_data(
-             byte_array, 0, vertex_slice.n_atoms)
+             data, 0, vertex_slice.n_atoms)
 
         # Convert start values as timesteps into milliseconds
         self._start[vertex_slice.as_slice] = self._convert_n_timesteps_to_ms(
@@ -625,10 +734,12 @@ class SpikeSourcePoissonVertex(
         self._rate[vertex_slice.as_slice] = (
             spikes_per_tick *
             (MICROSECONDS_PER_SECOND / float(self._machine_time_step)))
+        self._rate_stats = dict()
 
         # Store the updated time until next spike so that it can be
         # rewritten when the parameters are loaded
         self._time_to_spike[vertex_slice.as_slice] = time_to_next_spike
+        self._n_parameter_readbacks += 1
 
     @inject_items({
         "machine_time_step": "MachineTimeStep",
@@ -715,6 +826,11 @@ class SpikeSourcePoissonVertex(
             buffer_manager.clear_recorded_data(
                 placement.x, placement.y, placement.p,
                 SpikeSourcePoissonVertex.SPIKE_RECORDING_REGION_ID)
+        self._n_spike_recording_clears += 1
+
+    @overrides(AbstractSpikeRecordable.get_n_spike_recording_clears)
+    def get_n_spike_recording_clears(self):
+        return self._n_spike_recording_clears
 
     def describe(self):
         """
@@ -739,3 +855,13 @@ class SpikeSourcePoissonVertex(
             "parameters": parameters,
         }
         return context
+
+    @overrides(AbstractProvidesLocalProvenanceData.get_local_provenance_data)
+    def get_local_provenance_data(self):
+        return [
+            ProvenanceDataItem(
+                [self.label, "Times_poisson_parameters_read_back"],
+                self._n_parameter_readbacks),
+            ProvenanceDataItem(
+                [self.label, "Times_poisson_parameters_reloaded"],
+                self._n_parameter_reloads)]
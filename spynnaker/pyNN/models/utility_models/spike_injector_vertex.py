@@ -21,6 +21,7 @@ class SpikeInjectorVertex(
     """
     __slots__ = [
         "_buffer_size_before_receive",
+        "_n_spike_recording_clears",
         "_receive_port",
         "_requires_mapping",
         "_spike_buffer_max_size",
@@ -56,6 +57,7 @@ class SpikeInjectorVertex(
 
         # Set up for recording
         self._spike_recorder = EIEIOSpikeRecorder()
+        self._n_spike_recording_clears = 0
         self._spike_buffer_max_size = spike_buffer_max_size
         if spike_buffer_max_size is None:
             self._spike_buffer_max_size = config.getint(
@@ -129,6 +131,11 @@ class SpikeInjectorVertex(
             buffer_manager.clear_recorded_data(
                 placement.x, placement.y, placement.p,
                 SpikeInjectorVertex.SPIKE_RECORDING_REGION_ID)
+        self._n_spike_recording_clears += 1
+
+    @overrides(AbstractSpikeRecordable.get_n_spike_recording_clears)
+    def get_n_spike_recording_clears(self):
+        return self._n_spike_recording_clears
 
     @overrides(AbstractProvidesOutgoingPartitionConstraints.
                get_outgoing_partition_constraints)
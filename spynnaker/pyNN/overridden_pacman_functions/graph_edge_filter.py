@@ -5,7 +5,8 @@ from pacman.model.graphs.machine import MachineGraph
 from pacman.model.graphs.common import GraphMapper
 from spynnaker.pyNN.exceptions import FilterableException
 from spynnaker.pyNN.models.abstract_models import AbstractFilterableEdge
-from spynnaker.pyNN.models.neural_projections import ProjectionApplicationEdge
+from spynnaker.pyNN.models.neural_projections import (
+    DelayedMachineEdge, ProjectionMachineEdge)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamicsStructural)
 
@@ -37,16 +38,33 @@ class GraphEdgeFilter(object):
                 vertex, graph_mapper, new_machine_graph, new_graph_mapper)
 
         # start checking edges to decide which ones need pruning....
+        n_edges = 0
+        n_pruned_edges = 0
+        n_pruned_partitions = 0
         for partition in progress.over(machine_graph.outgoing_edge_partitions):
+            n_kept_edges = 0
             for edge in partition.edges:
+                n_edges += 1
                 if self._is_filterable(edge, graph_mapper):
                     logger.debug("this edge was pruned %s", edge)
+                    n_pruned_edges += 1
                     continue
                 logger.debug("this edge was not pruned %s", edge)
+                n_kept_edges += 1
                 self._add_edge_to_new_graph(
                     edge, partition, graph_mapper, new_machine_graph,
                     new_graph_mapper)
 
+            # A partition with no edges left needs no keys or routes
+            if not n_kept_edges:
+                n_pruned_partitions += 1
+
+        if n_pruned_edges:
+            logger.info(
+                "Pruned %d of %d machine edges, leaving %d outgoing edge "
+                "partitions without any edges to route", n_pruned_edges,
+                n_edges, n_pruned_partitions)
+
         # returned the pruned graph and graph_mapper
         return new_machine_graph, new_graph_mapper
 
@@ -76,9 +94,11 @@ class GraphEdgeFilter(object):
     def _is_filterable(edge, graph_mapper):
         app_edge = graph_mapper.get_application_edge(edge)
 
-        # Don't filter edges which have structural synapse dynamics
-        if isinstance(app_edge, ProjectionApplicationEdge):
-            for syn_info in app_edge.synapse_information:
+        # Don't filter edges which have structural synapse dynamics, as the
+        # connections they could make are only known at run time; this
+        # includes the edges from the delay extensions
+        if isinstance(edge, (ProjectionMachineEdge, DelayedMachineEdge)):
+            for syn_info in edge.synapse_information:
                 if isinstance(syn_info.synapse_dynamics,
                               AbstractSynapseDynamicsStructural):
                     return False
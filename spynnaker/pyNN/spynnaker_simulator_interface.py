@@ -29,6 +29,11 @@ class SpynnakerSimulatorInterface(SimulatorInterface):
     def has_reset_last(self):
         pass
 
+    # declared in common and used in common
+    @abstractproperty
+    def n_resets(self):
+        pass
+
     # Used at common level but depends on PyNN so individual implementations
     @abstractmethod
     def is_a_pynn_random(self, thing):
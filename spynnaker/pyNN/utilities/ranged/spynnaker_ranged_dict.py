@@ -17,3 +17,34 @@ class SpynnakerRangeDictionary(RangeDictionary):
         :return: AbstractList in this case a RangedList
         """
         return SpynnakerRangedList(size, value, key)
+
+    def is_dirty(self, slice_start=0, slice_stop=None):
+        """ Determine if any value of any key in a range of IDs has been set\
+            since the range was last marked as clean.  Lists that do not\
+            track changes are always considered to have changed.
+
+        :param slice_start: The first ID of the range
+        :param slice_stop: One more than the last ID of the range, or None\
+            for the end of the range
+        :rtype: bool
+        """
+        for key in self.keys():
+            ranged_list = self.get_list(key)
+            if not isinstance(ranged_list, SpynnakerRangedList):
+                return True
+            if ranged_list.is_dirty(slice_start, slice_stop):
+                return True
+        return False
+
+    def mark_clean(self, slice_start=0, slice_stop=None):
+        """ Mark a range of IDs of every key as matching the values last\
+            written
+
+        :param slice_start: The first ID of the range
+        :param slice_stop: One more than the last ID of the range, or None\
+            for the end of the range
+        """
+        for key in self.keys():
+            ranged_list = self.get_list(key)
+            if isinstance(ranged_list, SpynnakerRangedList):
+                ranged_list.mark_clean(slice_start, slice_stop)
@@ -1,9 +1,27 @@
+import numpy
 from spinn_utilities.overrides import overrides
 from spinn_utilities.ranged.ranged_list import RangedList
 from spinn_front_end_common.utilities import globals_variables
 
 
 class SpynnakerRangedList(RangedList):
+    """ A ranged list that also keeps track of the IDs whose values have\
+        been set since they were last marked as clean
+    """
+
+    __slots__ = [
+        # Whether the value of each ID has been set since it was last marked
+        # as clean
+        "_dirty"]
+
+    def __init__(
+            self, size=None, value=None, key=None, use_list_as_value=False):
+        self._dirty = None
+        super(SpynnakerRangedList, self).__init__(
+            size, value, key, use_list_as_value)
+
+        # The initial values are not a change
+        self._dirty = numpy.zeros(len(self), dtype="bool")
 
     @staticmethod
     @overrides(RangedList.is_list)
@@ -22,3 +40,51 @@ class SpynnakerRangedList(RangedList):
             return value.next(n=size)
 
         return RangedList.as_list(value, size, ids)
+
+    @overrides(RangedList.set_value)
+    def set_value(self, value, use_list_as_value=False):
+        RangedList.set_value(self, value, use_list_as_value)
+        self._mark_dirty(0, len(self))
+
+    @overrides(RangedList.set_value_by_id)
+    def set_value_by_id(self, id, value):  # @ReservedAssignment
+        RangedList.set_value_by_id(self, id, value)
+        if self._dirty is not None:
+            self._dirty[id] = True
+
+    @overrides(RangedList.set_value_by_slice)
+    def set_value_by_slice(
+            self, slice_start, slice_stop, value, use_list_as_value=False):
+        RangedList.set_value_by_slice(
+            self, slice_start, slice_stop, value, use_list_as_value)
+        start, stop, _ = slice(slice_start, slice_stop).indices(len(self))
+        self._mark_dirty(start, stop)
+
+    def _mark_dirty(self, start, stop):
+        """ Record that the values of a range of IDs have been set
+
+        :param start: The first ID set
+        :param stop: One more than the last ID set
+        """
+        if self._dirty is not None:
+            self._dirty[start:stop] = True
+
+    def is_dirty(self, slice_start=0, slice_stop=None):
+        """ Determine if any value in a range of IDs has been set since the\
+            range was last marked as clean
+
+        :param slice_start: The first ID of the range
+        :param slice_stop: One more than the last ID of the range, or None\
+            for the end of the list
+        :rtype: bool
+        """
+        return bool(self._dirty[slice_start:slice_stop].any())
+
+    def mark_clean(self, slice_start=0, slice_stop=None):
+        """ Mark a range of IDs as matching the values last written
+
+        :param slice_start: The first ID of the range
+        :param slice_stop: One more than the last ID of the range, or None\
+            for the end of the list
+        """
+        self._dirty[slice_start:slice_stop] = False
@@ -22,6 +22,10 @@ class SpynnakerFailedState(SpynnakerSimulatorInterface, FailedState, object):
     def has_reset_last(self):
         raise ConfigurationException(FAILED_STATE_MSG)
 
+    @property
+    def n_resets(self):
+        raise ConfigurationException(FAILED_STATE_MSG)
+
     def is_a_pynn_random(self, thing):
         raise ConfigurationException(FAILED_STATE_MSG)
 
@@ -2,6 +2,7 @@
 utility class containing simple helper methods
 """
 from decimal import Decimal
+from itertools import islice
 import os
 import logging
 import math
@@ -70,49 +71,184 @@ def convert_to(value, data_type):
             numpy.dtype(data_type.struct_encoding))
 
 
+def convert_to_array(values, data_type):
+    """ Convert an array of values to a given data type, rounding to the\
+        nearest representable value and saturating at the limits of the type.\
+        As the scales of the data types are powers of two, the scaling is\
+        exact, so the result is the same as that of :py:func:`convert_to`\
+        for each value within the range of the type.  Values converted to a\
+        floating point type are neither rounded nor saturated.
+
+    :param values: The values to convert, as an array or a single value
+    :param data_type: The data type to convert to
+    :return: The converted data as a numpy array of the data type
+    :rtype: numpy.ndarray
+    """
+    dtype = numpy.dtype(data_type.struct_encoding)
+    if dtype.kind == "f":
+        return numpy.asarray(values, dtype="float64").astype(dtype)
+    info = numpy.iinfo(dtype)
+    scaled = numpy.round(
+        numpy.asarray(values, dtype="float64") * float(data_type.scale))
+
+    # The maximum of a 64-bit type is not representable as a float, and the
+    # nearest float is just out of range of the type
+    high = float(info.max)
+    if int(high) > info.max:
+        high = numpy.nextafter(high, 0)
+    return numpy.clip(scaled, float(info.min), high).astype(dtype)
+
+
+def convert_from_array(values, data_type):
+    """ Convert an array of values of a given data type back to floats
+
+    :param values: The values to convert
+    :param data_type: The data type of the values
+    :return: The converted data
+    :rtype: numpy.ndarray(dtype="float64")
+    """
+    return numpy.asarray(values, dtype="float64") / float(data_type.scale)
+
+
+def _parse_columns(lines, n_columns, split_value, evaluator, n_fields=None):
+    """ Parse the first columns of some lines of values.  Lines that are all\
+        plain numbers are converted as a block by numpy; only if this fails\
+        are the lines parsed in turn, evaluating any values that are not\
+        plain numbers.
+
+    :param lines: The lines to parse, none of which are comments
+    :param n_columns: The number of columns to keep
+    :param split_value: The pattern separating the columns
+    :param evaluator: The evaluator of values that are not plain numbers
+    :param n_fields: The number of values each line must have, or None if\
+        lines may have any number of values from n_columns up
+    :rtype: numpy.ndarray(dtype="float64")
+    """
+    n_line_fields = len(lines[0].split(split_value))
+    text = "".join(lines)
+    if (n_line_fields >= n_columns and
+            n_fields in (None, n_line_fields) and
+            text.count(split_value) == len(lines) * (n_line_fields - 1)):
+        fields = text.replace(split_value, " ").split()
+        if len(fields) == len(lines) * n_line_fields:
+            try:
+                values = numpy.array(fields, dtype="float64")
+                return values.reshape(
+                    len(lines), n_line_fields)[:, :n_columns]
+            except ValueError:
+                # Some values are not plain numbers
+                pass
+
+    values = numpy.empty((len(lines), n_columns), dtype="float64")
+    for row, line in enumerate(lines):
+        fields = line.split(split_value)
+        if len(fields) < n_columns or (
+                n_fields is not None and len(fields) != n_fields):
+            raise ValueError("Expected {} values in line {}".format(
+                n_fields or n_columns, line.strip()))
+        for column, value in enumerate(fields[:n_columns]):
+            try:
+                values[row, column] = float(value)
+            except ValueError:
+                values[row, column] = float(evaluator.eval(value))
+    return values
+
+
+def read_columns_from_file(
+        file_path, n_columns, split_value="\t", chunk_lines=100000,
+        n_fields=None):
+    """ Read the first columns of a file of values, a line per row.  Text\
+        files are read a chunk of lines at a time, ignoring comment lines\
+        starting with #.  Files ending in .npy are instead loaded as a\
+        memory-mapped 2D numpy array, as written by\
+        :py:func:`write_columns_to_file`.
+
+    :param file_path: absolute path to the file
+    :type file_path: str
+    :param n_columns: The number of columns to read
+    :type n_columns: int
+    :param split_value: the pattern separating the columns of text files
+    :type split_value: str
+    :param chunk_lines: the number of lines of text to parse at once
+    :type chunk_lines: int
+    :param n_fields: the number of values each line of text must have, or\
+        None if lines may have any number of values from n_columns up
+    :type n_fields: int or None
+    :return: a row per line with the first n_columns values of the line
+    :rtype: numpy.ndarray(dtype="float64")
+    """
+    if file_path.endswith(".npy"):
+        return numpy.load(file_path, mmap_mode="r")[:, :n_columns]
+
+    evaluator = SafeEval()
+    chunks = list()
+    with open(file_path, 'r') as f:
+        while True:
+            lines = list(islice(f, chunk_lines))
+            if not lines:
+                break
+            lines = [line if line.endswith("\n") else line + "\n"
+                     for line in lines
+                     if line.strip() and not line.startswith('#')]
+            if lines:
+                chunks.append(_parse_columns(
+                    lines, n_columns, split_value, evaluator, n_fields))
+    if not chunks:
+        return numpy.empty((0, n_columns), dtype="float64")
+    return numpy.concatenate(chunks)
+
+
+def write_columns_to_file(file_path, values):
+    """ Write columns of values as a .npy file, which\
+        :py:func:`read_columns_from_file` can load without parsing any text
+
+    :param file_path: absolute path to the file, which should end in .npy
+    :type file_path: str
+    :param values: a row per line with the values of the line, in the same\
+        order as the columns of the text format
+    :type values: numpy.ndarray
+    """
+    check_directory_exists_and_create_if_not(file_path)
+    numpy.save(file_path, numpy.asarray(values, dtype="float64"))
+
+
 def read_in_data_from_file(
         file_path, min_atom, max_atom, min_time, max_time, extra=False):
     """ Read in a file of data values where the values are in a format of:
         <time>\t<atom ID>\t<data value>
 
-    :param file_path: absolute path to a file containing the data
+    :param file_path: absolute path to a file containing the data, or to a\
+        .npy file of the same columns
     :param min_atom: min neuron ID to which neurons to read in
     :param max_atom: max neuron ID to which neurons to read in
     :param min_time: min time slot to read neurons values of.
     :param max_time: max time slot to read neurons values of.
-    :return: a numpy array of (time stamp, atom ID, data value)
+    :param extra: True if each line of text has a fourth value, which is\
+        ignored; False if each has exactly three values
+    :return: a numpy array of (atom ID, time stamp, data value)
     """
-    times = list()
-    atom_ids = list()
-    data_items = list()
-    evaluator = SafeEval()
-    with open(file_path, 'r') as f:
-        for line in f.readlines():
-            if line.startswith('#'):
-                continue
-            if extra:
-                time, neuron_id, data_value, extra = line.split("\t")
-            else:
-                time, neuron_id, data_value = line.split("\t")
-            time = float(evaluator.eval(time))
-            neuron_id = int(evaluator.eval(neuron_id))
-            data_value = float(evaluator.eval(data_value))
-            if (min_atom <= neuron_id < max_atom and
-                    min_time <= time < max_time):
-                times.append(time)
-                atom_ids.append(neuron_id)
-                data_items.append(data_value)
-            else:
-                print("failed to enter {}:{}".format(neuron_id, time))
-
-    result = numpy.dstack((atom_ids, times, data_items))[0]
-    return result[numpy.lexsort((times, atom_ids))]
+    # pylint: disable=too-many-arguments
+    values = read_columns_from_file(
+        file_path, 3, n_fields=4 if extra else 3)
+    times = values[:, 0]
+    atom_ids = values[:, 1]
+    keep = ((min_atom <= atom_ids) & (atom_ids < max_atom) &
+            (min_time <= times) & (times < max_time))
+    if not numpy.all(keep):
+        logger.debug("{} values outside of the ranges were not read".format(
+            len(keep) - numpy.count_nonzero(keep)))
+
+    result = numpy.column_stack(
+        (atom_ids[keep], times[keep], values[keep, 2]))
+    return result[numpy.lexsort((result[:, 1], result[:, 0]))]
 
 
 def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
                           min_time=0, max_time=float('inf'), split_value="\t"):
     """ Read spikes from a file formatted as:\
-        <time>\t<neuron ID>
+        <time>\t<neuron ID>\
+        or from a .npy file of the same columns, as written by\
+        :py:func:`write_columns_to_file`
 
     :param file_path: absolute path to a file containing spike values
     :type file_path: str
@@ -127,8 +263,8 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     :param split_value: the pattern to split by
     :type split_value: str
     :return:\
-        a numpy array with max_atom elements each of which is a list of\
-        spike times.
+        a numpy array with a row of neuron ID and spike time for each\
+        spike, sorted by neuron ID and then time
     :rtype: numpy.array(int, int)
     """
     # pylint: disable=too-many-arguments
@@ -144,22 +280,15 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     if max_time is None:
         max_time = float('inf')
 
-    data = []
-    with open(file_path, 'r') as fsource:
-        read_data = fsource.readlines()
-
-    evaluator = SafeEval()
-    for line in read_data:
-        if line.startswith('#'):
-            continue
-        values = line.split(split_value)
-        time = float(evaluator.eval(values[0]))
-        neuron_id = float(evaluator.eval(values[1]))
-        if (min_atom <= neuron_id < max_atom and
-                min_time <= time < max_time):
-            data.append([neuron_id, time])
-    data.sort()
-    return numpy.array(data)
+    values = read_columns_from_file(file_path, 2, split_value)
+    times = values[:, 0]
+    neuron_ids = values[:, 1]
+    keep = ((min_atom <= neuron_ids) & (neuron_ids < max_atom) &
+            (min_time <= times) & (times < max_time))
+    times = times[keep]
+    neuron_ids = neuron_ids[keep]
+    order = numpy.lexsort((times, neuron_ids))
+    return numpy.column_stack((neuron_ids[order], times[order]))
 
 
 def get_probable_maximum_selected(
@@ -0,0 +1,113 @@
+import socket
+import numpy
+import pytest
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spinnman.messages.eieio import read_eieio_data_message
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.connections import SpynnakerPoissonControlConnection
+
+
+class _Sink(object):
+    """ Receives the messages sent to a local UDP port
+    """
+
+    def __init__(self):
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.settimeout(0.1)
+        self.port = self._socket.getsockname()[1]
+
+    def receive(self):
+        """ Get the keys and payloads of all the messages received
+        """
+        keys_payloads = list()
+        while True:
+            try:
+                data = self._socket.recv(1024)
+            except socket.timeout:
+                return keys_payloads
+            message = read_eieio_data_message(data, 0)
+            while message.is_next_element:
+                element = message.next_element
+                keys_payloads.append((element.key, element.payload))
+
+    def close(self):
+        self._socket.close()
+
+
+def _make_connection(sink, n_neurons):
+    connection = SpynnakerPoissonControlConnection(
+        poisson_labels=["pop"], local_port=None)
+
+    # Set up the sending side as reading the database would
+    connection._sender_connection = UDPConnection(local_host="127.0.0.1")
+    connection._send_address_details["pop_control"] = (
+        "127.0.0.1", sink.port)
+    connection._atom_id_to_key["pop_control"] = {
+        i: 0x10000 + i for i in range(n_neurons)}
+    return connection
+
+
+def test_set_rates():
+    sink = _Sink()
+    connection = _make_connection(sink, 100)
+    try:
+        rates = [(i, i * 1.5) for i in range(70)]
+        connection.set_rates("pop", rates)
+        assert sink.receive() == [
+            (0x10000 + i, int(round(rate * 32768))) for i, rate in rates]
+
+        connection.set_rate("pop_control", 99, 0.1)
+        assert sink.receive() == [(0x10000 + 99, 3277)]
+    finally:
+        connection.close()
+        sink.close()
+
+
+def test_set_rates_array_skips_unchanged():
+    sink = _Sink()
+    connection = _make_connection(sink, 100)
+    try:
+        ids = numpy.arange(100)
+        rates = numpy.linspace(0, 20, 100)
+        connection.set_rates_array("pop", ids, rates, skip_unchanged=True)
+        received = sink.receive()
+        assert [key for key, _ in received] == list(0x10000 + ids)
+        assert numpy.array_equal(
+            [payload for _, payload in received],
+            numpy.round(rates * 32768))
+
+        # Only the changed rates are sent again
+        rates[[5, 50]] = 3.0
+        connection.set_rates_array("pop", ids, rates, skip_unchanged=True)
+        assert sink.receive() == [
+            (0x10000 + 5, 3 * 32768), (0x10000 + 50, 3 * 32768)]
+        connection.set_rates_array("pop", ids, rates, skip_unchanged=True)
+        assert sink.receive() == []
+
+        # Unchanged rates are sent by default
+        connection.set_rates_array("pop", ids[:2], rates[:2])
+        assert sink.receive() == [
+            (0x10000 + i, int(round(rates[i] * 32768))) for i in range(2)]
+
+        # Unless asked to send them anyway
+        connection.clear_sent_rates("pop")
+        connection.set_rates_array("pop", ids[:3], 1.0, skip_unchanged=True)
+        assert sink.receive() == [(0x10000 + i, 32768) for i in range(3)]
+    finally:
+        connection.close()
+        sink.close()
+
+
+def test_set_rates_array_out_of_range():
+    sink = _Sink()
+    connection = _make_connection(sink, 10)
+    try:
+        with pytest.raises(ConfigurationException):
+            connection.set_rates_array("pop", [1, 2], [10.0, 70000.0])
+        with pytest.raises(ConfigurationException):
+            connection.set_rate("pop", 3, -70000.0)
+        assert sink.receive() == []
+    finally:
+        connection.close()
+        sink.close()
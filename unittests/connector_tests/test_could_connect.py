@@ -0,0 +1,171 @@
+import numpy
+from pacman.model.graphs.common import Slice
+from pacman.model.graphs.machine import SimpleMachineVertex
+from spynnaker.pyNN.models.neural_projections import (
+    DelayedMachineEdge, ProjectionMachineEdge, SynapseInformation)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector, ArrayConnector, DistanceDependentProbabilityConnector,
+    FixedProbabilityConnector, FromListConnector,
+    IndexBasedProbabilityConnector, OneToOneConnector)
+from spynnaker.pyNN.models.neural_projections.connectors.distance_cache \
+    import DistanceCache
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic, SynapseDynamicsStructuralStatic)
+from spynnaker.pyNN.overridden_pacman_functions.graph_edge_filter import (
+    GraphEdgeFilter)
+from unittests.connector_tests.test_distance_cache import (
+    _Population, _Space)
+from unittests.mocks import MockSimulator, MockPopulation, MockRNG
+
+_SLICES = [Slice(0, 9), Slice(10, 19), Slice(20, 29)]
+
+
+class _GraphMapper(object):
+    def __init__(self):
+        self._slices = dict()
+
+    def add_vertex_mapping(self, machine_vertex, vertex_slice):
+        self._slices[machine_vertex] = vertex_slice
+
+    def get_slice(self, machine_vertex):
+        return self._slices[machine_vertex]
+
+    def get_application_edge(self, machine_edge):
+        return None
+
+
+def _set_populations(connector, n_pre=30, n_post=30):
+    connector.set_projection_information(
+        MockPopulation(n_pre, "pre"), MockPopulation(n_post, "post"),
+        MockRNG(), 1000)
+    return connector
+
+
+def _check_exact(connector):
+    """ Check that could_connect is True exactly for the non-empty blocks
+    """
+    for pre_slice in _SLICES:
+        for post_slice in _SLICES:
+            block = connector.create_synaptic_block(
+                1.0, 1.0, _SLICES, 0, _SLICES, 0, pre_slice, post_slice, 0)
+            assert connector.could_connect(pre_slice, post_slice) == (
+                len(block) > 0)
+
+
+def test_one_to_one():
+    MockSimulator.setup()
+    _check_exact(_set_populations(OneToOneConnector(None)))
+
+
+def test_from_list():
+    MockSimulator.setup()
+    _check_exact(_set_populations(FromListConnector(
+        [(0, 5), (3, 25), (15, 15), (29, 0)])))
+
+
+def test_array():
+    MockSimulator.setup()
+    array = numpy.zeros((30, 30), dtype="int")
+    array[5, 25] = 1
+    array[12, 3] = 1
+    _check_exact(_set_populations(ArrayConnector(array)))
+
+
+def test_index_based_probability():
+    MockSimulator.setup()
+    _check_exact(_set_populations(
+        IndexBasedProbabilityConnector("abs(i - j) < 5")))
+
+
+def test_fixed_probability():
+    MockSimulator.setup()
+    _check_exact(_set_populations(FixedProbabilityConnector(0.0)))
+    connector = _set_populations(FixedProbabilityConnector(0.1))
+    assert connector.could_connect(_SLICES[0], _SLICES[2])
+
+
+def test_distance_dependent_probability():
+    MockSimulator.setup()
+    DistanceCache.clear_shared()
+    connector = DistanceDependentProbabilityConnector("d < 2")
+    connector.set_space(_Space())
+    connector.set_projection_information(
+        _Population(30, "pre", 1), _Population(30, "post", 2), MockRNG(),
+        1000)
+    for pre_slice in _SLICES:
+        for post_slice in _SLICES:
+            could_connect = connector.could_connect(pre_slice, post_slice)
+            for _ in range(5):
+                block = connector.create_synaptic_block(
+                    1.0, 1.0, _SLICES, 0, _SLICES, 0, pre_slice, post_slice,
+                    0)
+                assert could_connect or not len(block)
+
+
+def _make_vertices(graph_mapper):
+    vertices = list()
+    for vertex_slice in _SLICES:
+        vertex = SimpleMachineVertex(resources=None)
+        graph_mapper.add_vertex_mapping(vertex, vertex_slice)
+        vertices.append(vertex)
+    return vertices
+
+
+def test_filter_projection_machine_edge():
+    MockSimulator.setup()
+    graph_mapper = _GraphMapper()
+    vertices = _make_vertices(graph_mapper)
+
+    one_to_one = _set_populations(OneToOneConnector(None))
+    from_list = _set_populations(FromListConnector([(0, 25)]))
+    synapse_information = [
+        SynapseInformation(one_to_one, SynapseDynamicsStatic(), 0),
+        SynapseInformation(from_list, SynapseDynamicsStatic(), 0)]
+
+    # Kept if any connector could make a connection
+    assert not ProjectionMachineEdge(
+        synapse_information, vertices[0], vertices[0]).filter_edge(
+            graph_mapper)
+    assert not ProjectionMachineEdge(
+        synapse_information, vertices[0], vertices[2]).filter_edge(
+            graph_mapper)
+    assert ProjectionMachineEdge(
+        synapse_information, vertices[1], vertices[2]).filter_edge(
+            graph_mapper)
+
+    # An all-to-all connector can always connect
+    assert not ProjectionMachineEdge(
+        synapse_information + [SynapseInformation(
+            _set_populations(AllToAllConnector()), SynapseDynamicsStatic(),
+            0)],
+        vertices[1], vertices[2]).filter_edge(graph_mapper)
+
+    # The filtered edges are counted in the provenance of each connector
+    for connector in (one_to_one, from_list):
+        n_filtered = [
+            item.value for item in connector.get_provenance_data()
+            if item.names[-1] == "Number_of_machine_edges_filtered"]
+        assert n_filtered == [1]
+
+
+def test_structural_edges_not_filtered():
+    MockSimulator.setup()
+    graph_mapper = _GraphMapper()
+    vertices = _make_vertices(graph_mapper)
+
+    # A connector that makes no connections is used to start structural
+    # plasticity with no synapses, which must still be able to form later
+    static = [SynapseInformation(
+        _set_populations(FixedProbabilityConnector(0.0)),
+        SynapseDynamicsStatic(), 0)]
+    structural = [SynapseInformation(
+        _set_populations(FixedProbabilityConnector(0.0)),
+        SynapseDynamicsStructuralStatic(), 0)]
+    for edge_type in (ProjectionMachineEdge, DelayedMachineEdge):
+        assert GraphEdgeFilter._is_filterable(
+            edge_type(static, vertices[0], vertices[1]), graph_mapper)
+        assert not GraphEdgeFilter._is_filterable(
+            edge_type(structural, vertices[0], vertices[1]), graph_mapper)
+        assert not GraphEdgeFilter._is_filterable(
+            edge_type(static + structural, vertices[0], vertices[1]),
+            graph_mapper)
@@ -0,0 +1,113 @@
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector)
+from spynnaker.pyNN.models.neural_projections.connectors.distance_cache \
+    import DistanceCache
+from unittests.mocks import MockSimulator, MockPopulation
+
+
+class _Space(object):
+    """ Measures distances as PyNN does, counting the pairs measured
+    """
+
+    def __init__(self):
+        self.n_distances = 0
+
+    def distances(self, A, B, expand=False):
+        self.n_distances += A.shape[1] * B.shape[1]
+        d = A[:, :, None] - B[:, None, :]
+        if expand:
+            return d
+        return numpy.sqrt(numpy.sum(d ** 2, axis=0))
+
+
+class _Population(MockPopulation):
+    def __init__(self, size, label, seed):
+        super(_Population, self).__init__(size, label)
+        self.positions = numpy.random.RandomState(seed).uniform(
+            0, 10, (3, size))
+
+
+def _full_distances(pre, post, expand=False):
+    d = pre.positions[:, :, None] - post.positions[:, None, :]
+    if expand:
+        return d
+    return numpy.sqrt(numpy.sum(d ** 2, axis=0))
+
+
+def test_blocks_match_full_distances():
+    pre = _Population(100, "pre", 1)
+    post = _Population(50, "post", 2)
+    space = _Space()
+    cache = DistanceCache(1024 * 1024)
+    pre_slice = Slice(10, 39)
+    post_slice = Slice(20, 49)
+    d = cache.get_distances(space, pre, post, pre_slice, post_slice)
+    assert numpy.allclose(d, _full_distances(pre, post)[10:40, 20:50])
+    d = cache.get_distances(space, pre, post, pre_slice, post_slice, True)
+    assert numpy.allclose(
+        d, _full_distances(pre, post, True)[:, 10:40, 20:50])
+
+    # Asking again uses the blocks kept
+    assert space.n_distances == 2 * 30 * 30
+    cache.get_distances(space, pre, post, pre_slice, post_slice)
+    assert space.n_distances == 2 * 30 * 30
+    assert cache.n_bytes == 4 * 30 * 30 * 8
+
+
+def test_least_recently_used_blocks_are_dropped():
+    pre = _Population(100, "pre", 1)
+    post = _Population(100, "post", 2)
+    space = _Space()
+    block_bytes = 10 * 10 * 8
+    cache = DistanceCache(3 * block_bytes)
+    slices = [Slice(lo, lo + 9) for lo in range(0, 100, 10)]
+    for pre_slice in slices[:3]:
+        cache.get_distances(space, pre, post, pre_slice, slices[0])
+    cache.get_distances(space, pre, post, slices[0], slices[0])
+    cache.get_distances(space, pre, post, slices[3], slices[0])
+    assert cache.n_bytes == 3 * block_bytes
+    n_distances = space.n_distances
+
+    # The second block was the least recently used, so was dropped
+    cache.get_distances(space, pre, post, slices[0], slices[0])
+    cache.get_distances(space, pre, post, slices[2], slices[0])
+    assert space.n_distances == n_distances
+    cache.get_distances(space, pre, post, slices[1], slices[0])
+    assert space.n_distances == n_distances + 100
+
+    # A block larger than the limit is computed but not kept
+    cache.get_distances(space, pre, post, Slice(0, 99), Slice(0, 99))
+    assert cache.n_bytes == 3 * block_bytes
+
+
+def test_distance_dependent_weights():
+    MockSimulator.setup()
+    DistanceCache.clear_shared()
+    pre = _Population(20, "pre", 1)
+    post = _Population(20, "post", 2)
+    space = _Space()
+    connector = AllToAllConnector()
+    connector.set_space(space)
+    connector.set_projection_information(pre, post, None, 1000)
+    pre_slice = Slice(5, 14)
+    post_slice = Slice(0, 9)
+    block = connector.create_synaptic_block(
+        "d * 2", "d + 1.5", [pre_slice], 0, [post_slice], 0, pre_slice,
+        post_slice, 0)
+    d = _full_distances(pre, post)[block["source"], block["target"]]
+    assert numpy.allclose(block["weight"], d * 2)
+    assert numpy.allclose(block["delay"], d + 1.5)
+
+    # The weights and delays share the distances of the block
+    assert space.n_distances == 10 * 10
+
+    # Functions are given the distances along each axis
+    block = connector.create_synaptic_block(
+        lambda d: d[0] ** 2, 1.0, [pre_slice], 0, [post_slice], 0,
+        pre_slice, post_slice, 0)
+    d = _full_distances(pre, post, True)[
+        0, block["source"], block["target"]]
+    assert numpy.allclose(block["weight"], d ** 2)
+    DistanceCache.clear_shared()
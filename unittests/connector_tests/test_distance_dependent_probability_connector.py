@@ -0,0 +1,75 @@
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    DistanceDependentProbabilityConnector)
+from spynnaker.pyNN.models.neural_projections.connectors.distance_cache \
+    import DistanceCache
+from spynnaker.pyNN.utilities import utility_calls
+from unittests.connector_tests.test_distance_cache import (
+    _full_distances, _Population, _Space)
+from unittests.mocks import MockSimulator, MockRNG
+
+
+def _make_connector(d_expression, n_pre, n_post, seed):
+    MockSimulator.setup()
+    DistanceCache.clear_shared()
+    pre = _Population(n_pre, "pre", 1)
+    post = _Population(n_post, "post", 2)
+    connector = DistanceDependentProbabilityConnector(d_expression)
+    connector.set_space(_Space())
+    rng = MockRNG()
+    rng.seed(seed)
+    connector.set_projection_information(pre, post, rng, 1000)
+    return connector, pre, post
+
+
+def test_blocks_follow_probabilities():
+    connector, pre, post = _make_connector("exp(-d / 3.0)", 60, 40, 5)
+    probs = numpy.exp(-_full_distances(pre, post) / 3.0)
+    pre_slices = [Slice(0, 29), Slice(30, 59)]
+    post_slices = [Slice(0, 19), Slice(20, 39)]
+    n_trials = 200
+    counts = numpy.zeros((60, 40))
+    for _ in range(n_trials):
+        for pre_slice in pre_slices:
+            for post_slice in post_slices:
+                block = connector.create_synaptic_block(
+                    1.0, 1.0, pre_slices, 0, post_slices, 0, pre_slice,
+                    post_slice, 0)
+                assert numpy.all(numpy.diff(
+                    block["source"] * 40 + block["target"]) > 0)
+                counts[block["source"], block["target"]] += 1
+
+    # Each connection is made as often as its probability suggests
+    assert numpy.all(numpy.abs(counts - n_trials * probs) <= 6 * numpy.sqrt(
+        n_trials * probs * (1 - probs)) + 1)
+    assert abs(numpy.sum(counts) - n_trials * numpy.sum(probs)) < 3 * \
+        numpy.sqrt(n_trials * numpy.sum(probs * (1 - probs)))
+
+
+def test_no_self_connections():
+    connector, pre, _ = _make_connector("d < 4", 60, 60, 5)
+    connector.set_projection_information(pre, pre, MockRNG(), 1000)
+    connector.allow_self_connections = False
+    pre_slice = Slice(0, 29)
+    post_slice = Slice(10, 39)
+    block = connector.create_synaptic_block(
+        1.0, 1.0, [pre_slice], 0, [post_slice], 0, pre_slice, post_slice, 0)
+    assert len(block) > 0
+    assert not numpy.any(block["source"] == block["target"])
+
+
+def test_maxima_match_dense_probabilities():
+    # More post-neurons than fit in a block of the maximum probabilities
+    connector, pre, post = _make_connector("d[0] < 2", 3, 500000, 5)
+    probs = (_full_distances(pre, post, True)[0] < 2).astype("float")
+    post_slice = Slice(100, 199)
+    assert connector.get_n_connections_to_post_vertex_maximum() == \
+        utility_calls.get_probable_maximum_selected(
+            3 * 500000, 500000, numpy.amax(probs))
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        1.0, post_slice) == numpy.ceil(
+            utility_calls.get_probable_maximum_selected(
+                3 * 500000, 100, numpy.amax(probs[:, 100:200])))
+    assert numpy.array_equal(
+        connector._get_max_probs(), numpy.amax(probs, axis=0))
@@ -0,0 +1,77 @@
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector, FixedProbabilityConnector)
+from unittests.mocks import MockSimulator, MockPopulation, MockRNG
+
+
+def _make_connector(p_connect, n_pre, n_post, seed,
+                    allow_self_connections=True):
+    MockSimulator.setup()
+    connector = FixedProbabilityConnector(
+        p_connect, allow_self_connections=allow_self_connections)
+    rng = MockRNG()
+    rng.seed(seed)
+    connector.set_projection_information(
+        MockPopulation(n_pre, "pre"), MockPopulation(n_post, "post"), rng,
+        1000)
+    return connector
+
+
+@pytest.mark.parametrize("p_connect", [0.0, 0.001, 0.1, 0.5, 0.9, 1.0])
+def test_sample_indices(p_connect):
+    rng = numpy.random.RandomState(3)
+    n_items = 100000
+    indices = AbstractConnector._sample_indices(n_items, p_connect, rng)
+    assert numpy.all(numpy.diff(indices) > 0)
+    assert numpy.all((indices >= 0) & (indices < n_items))
+    mean = n_items * p_connect
+    assert abs(len(indices) - mean) <= 5 * numpy.sqrt(
+        mean * (1 - p_connect))
+
+    # The items chosen are spread evenly over the range
+    if len(indices) > 1000:
+        counts = numpy.bincount(indices * 10 // n_items, minlength=10)
+        assert numpy.all(numpy.abs(counts - mean / 10) <= 5 * numpy.sqrt(
+            mean / 10))
+
+
+def test_each_connection_equally_likely():
+    connector = _make_connector(0.2, 30, 20, 7)
+    pre_slice = Slice(0, 29)
+    post_slice = Slice(0, 19)
+    n_trials = 500
+    counts = numpy.zeros((30, 20))
+    for _ in range(n_trials):
+        block = connector.create_synaptic_block(
+            1.0, 2.0, [pre_slice], 0, [post_slice], 0, pre_slice,
+            post_slice, 0)
+        counts[block["source"], block["target"]] += 1
+        assert numpy.all(block["weight"] == 1.0)
+        assert numpy.all(block["delay"] == 2.0)
+    assert numpy.all(numpy.abs(counts - n_trials * 0.2) <= 6 * numpy.sqrt(
+        n_trials * 0.2 * 0.8))
+
+
+def test_no_self_connections():
+    # The slices are not aligned, so the neurons with the same ID are not on
+    # the diagonal of the block
+    connector = _make_connector(1.0, 100, 100, 7, False)
+    pre_slice = Slice(0, 49)
+    post_slice = Slice(25, 74)
+    block = connector.create_synaptic_block(
+        1.0, 1.0, [pre_slice], 0, [post_slice], 0, pre_slice, post_slice, 0)
+    assert len(block) == 50 * 50 - 25
+    assert not numpy.any(block["source"] == block["target"])
+
+
+def test_sparse_block_size():
+    connector = _make_connector(0.0001, 10000, 10000, 7)
+    pre_slice = Slice(0, 9999)
+    post_slice = Slice(0, 9999)
+    block = connector.create_synaptic_block(
+        1.0, 1.0, [pre_slice], 0, [post_slice], 0, pre_slice, post_slice, 0)
+    assert abs(len(block) - 10000) < 500
+    assert numpy.all(block["source"] < 10000)
+    assert numpy.all(block["target"] < 10000)
@@ -59,3 +59,44 @@ def test_connector(
         weights, delays, [], 0, [], 0, Slice(0, 10), Slice(0, 10), 1)
     assert(numpy.array_equal(block["weight"], numpy.array(expected_weights)))
     assert(numpy.array_equal(block["delay"], numpy.array(expected_delays)))
+
+
+def test_slice_index_matches_full_scan():
+    MockSimulator.setup()
+    rng = numpy.random.RandomState(42)
+    n_pre = 1000
+    n_post = 500
+    n_conns = 20000
+    clist = numpy.column_stack((
+        rng.randint(0, n_pre, n_conns), rng.randint(0, n_post, n_conns),
+        rng.uniform(0, 1, n_conns), rng.randint(1, 16, n_conns)))
+    connector = FromListConnector(clist)
+    sources = clist[:, 0]
+    targets = clist[:, 1]
+    pre_slices = [Slice(lo, min(lo + 255, n_pre - 1))
+                  for lo in range(0, n_pre, 256)]
+    post_slices = [Slice(lo, min(lo + 99, n_post - 1))
+                   for lo in range(0, n_post, 100)]
+    for post_slice in post_slices:
+        post_mask = ((targets >= post_slice.lo_atom) &
+                     (targets <= post_slice.hi_atom))
+        assert (connector.get_n_connections_from_pre_vertex_maximum(
+            None, post_slice) ==
+            numpy.max(numpy.bincount(sources[post_mask].astype("int64"))))
+        delay_mask = post_mask & (clist[:, 3] >= 2) & (clist[:, 3] <= 5)
+        assert (connector.get_n_connections_from_pre_vertex_maximum(
+            None, post_slice, 2, 5) ==
+            numpy.max(numpy.bincount(sources[delay_mask].astype("int64"))))
+        for pre_slice in pre_slices:
+            mask = (post_mask & (sources >= pre_slice.lo_atom) &
+                    (sources <= pre_slice.hi_atom))
+            block = connector.create_synaptic_block(
+                None, None, pre_slices, 0, post_slices, 0, pre_slice,
+                post_slice, 0)
+            expected = numpy.lexsort((targets[mask], sources[mask]))
+            assert numpy.array_equal(block["source"], sources[mask][expected])
+            assert numpy.array_equal(block["target"], targets[mask][expected])
+            assert numpy.array_equal(
+                block["weight"], clist[mask, 2][expected])
+            assert numpy.array_equal(
+                block["delay"], clist[mask, 3][expected])
@@ -0,0 +1,72 @@
+import time
+import numpy
+from spynnaker.pyNN.external_devices_models.push_bot.push_bot_ethernet \
+    import PushBotRetinaConnection
+from spynnaker.pyNN.external_devices_models.push_bot.push_bot_parameters \
+    import PushBotRetinaResolution
+
+
+class _FakeWiFiConnection(object):
+    """ A connection that never receives anything itself; the data is\\
+        given to the retina connection directly
+    """
+
+    def is_ready_to_receive(self, timeout=0):
+        time.sleep(timeout)
+        return False
+
+    def get_receive_method(self):
+        return None
+
+
+class _RecordingRetinaConnection(PushBotRetinaConnection):
+    def __init__(self, resolution):
+        super(_RecordingRetinaConnection, self).__init__(
+            "retina", _FakeWiFiConnection(), resolution, local_port=None)
+        self.neuron_ids = list()
+
+    def send_spikes(self, label, neuron_ids, send_full_keys=False):
+        self.neuron_ids.extend(neuron_ids)
+
+
+def _make_stream(rng, n_events, n_texts):
+    """ Make a stream of events, with text inserted between some of them
+
+    :return: the stream, and the x, y and polarity of each event
+    """
+    xs = rng.randint(0, 128, n_events)
+    ys = rng.randint(0, 128, n_events)
+    polarity = rng.randint(0, 2, n_events)
+    events = numpy.zeros((n_events, 2), dtype="uint8")
+    events[:, 0] = 0x80 | xs
+    events[:, 1] = (polarity << 7) | ys
+    chunks = numpy.split(events.reshape(-1), numpy.sort(
+        rng.choice(n_events, n_texts, replace=False)) * 2)
+    texts = [b"?R%d\n" % i for i in range(n_texts)]
+    stream = chunks[0].tobytes() + b"".join(
+        text + chunk.tobytes() for text, chunk in zip(texts, chunks[1:]))
+    return stream, xs, ys, polarity
+
+
+def test_decode_events_with_text():
+    rng = numpy.random.RandomState(4)
+    resolution = PushBotRetinaResolution.DOWNSAMPLE_64_X_64
+    connection = _RecordingRetinaConnection(resolution)
+    try:
+        stream, xs, ys, polarity = _make_stream(rng, 5000, 100)
+
+        # Text before the first event too, and packets split anywhere
+        stream = b"E1\n" + stream
+        splits = numpy.sort(rng.choice(len(stream), 300, replace=False))
+        for start, end in zip(
+                [0] + list(splits), list(splits) + [len(stream)]):
+            connection._receive_retina_data(stream[start:end])
+
+        bits = resolution.value.bits_per_coordinate
+        shift = 7 - bits
+        expected = (
+            ((xs >> shift) << bits) | (ys >> shift) | (polarity << (2 * bits)))
+        assert numpy.array_equal(connection.neuron_ids, expected)
+    finally:
+        connection._pushbot_listener.close()
+        connection.close()
@@ -0,0 +1,84 @@
+import time
+from spinnman.messages.eieio.data_messages import KeyPayloadDataElement
+from spynnaker.pyNN.external_devices_models.push_bot.push_bot_ethernet \
+    import PushBotTranslator
+from spynnaker.pyNN.protocols import (
+    MunichIoSpiNNakerLinkProtocol, MunichIoEthernetProtocol)
+
+
+class _RecordingWiFiConnection(object):
+    def __init__(self):
+        self.sent = list()
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+def _packet(key, payload):
+    return KeyPayloadDataElement(key, payload, True)
+
+
+def _make_translator(coalesce_window=None):
+    protocol = MunichIoSpiNNakerLinkProtocol(
+        MunichIoSpiNNakerLinkProtocol.MODES.PUSH_BOT)
+    connection = _RecordingWiFiConnection()
+    return (
+        protocol, connection,
+        PushBotTranslator(protocol, connection, coalesce_window))
+
+
+def test_translate_commands():
+    protocol, connection, translator = _make_translator()
+    translator.translate_control_packet(
+        _packet(protocol.push_bot_motor_0_permanent_key, 20))
+    translator.translate_control_packet(
+        _packet(protocol.push_bot_motor_1_leaking_towards_zero_key,
+                0xFFFFFFF6))
+    translator.translate_control_packet(
+        _packet(protocol.enable_disable_motor_key, 1))
+    translator.translate_control_packet(
+        _packet(protocol.set_mode_key, 0))
+    translator.translate_control_packet(_packet(0xFFFFFFFF, 0))
+    assert connection.sent == [
+        MunichIoEthernetProtocol.motor_0_permanent_velocity(20),
+        MunichIoEthernetProtocol.motor_1_leaky_velocity(-10),
+        MunichIoEthernetProtocol.enable_motor()]
+
+
+def test_coalesce_commands():
+    protocol, connection, translator = _make_translator(60.0)
+    translator.translate_control_packet(
+        _packet(protocol.enable_disable_motor_key, 1))
+    for velocity in range(10):
+        translator.translate_control_packet(
+            _packet(protocol.push_bot_motor_0_permanent_key, velocity))
+        translator.translate_control_packet(
+            _packet(protocol.push_bot_motor_1_leaking_towards_zero_key,
+                    velocity))
+    translator.translate_control_packet(
+        _packet(protocol.push_bot_motor_0_leaking_towards_zero_key, 50))
+    assert connection.sent == []
+
+    # Only the latest velocity of each motor is sent, in a single write
+    translator.flush()
+    assert connection.sent == ["".join((
+        MunichIoEthernetProtocol.enable_motor(),
+        MunichIoEthernetProtocol.motor_1_leaky_velocity(9),
+        MunichIoEthernetProtocol.motor_0_leaky_velocity(50)))]
+    translator.flush()
+    assert len(connection.sent) == 1
+
+
+def test_coalesce_window_expires():
+    protocol, connection, translator = _make_translator(0.01)
+    translator.translate_control_packet(
+        _packet(protocol.push_bot_led_set_frequency_key, 10))
+    translator.translate_control_packet(
+        _packet(protocol.push_bot_speaker_set_tone_key, 20))
+    for _ in range(100):
+        if connection.sent:
+            break
+        time.sleep(0.01)
+    assert connection.sent == ["".join((
+        MunichIoEthernetProtocol.led_frequency(10),
+        MunichIoEthernetProtocol.speaker_frequency(20)))]
@@ -17,7 +17,7 @@ class MockPopulation(object):
 
     @property
     def label(self):
-        return self.label
+        return self._label
 
     def __repr__(self):
         return "Population {}".format(self._label)
@@ -32,6 +32,9 @@ class MockRNG(object):
         return self._rng.uniform(size=n)
 
     def __getattr__(self, name):
+        # Copying looks up special methods before _rng is set
+        if name.startswith("__") or name == "_rng":
+            raise AttributeError(name)
         return getattr(self._rng, name)
 
 
@@ -43,7 +46,9 @@ class MockSimulator(object):
             {"spikes_per_second": "30",
              "incoming_spike_buffer_size": "256",
              "ring_buffer_sigma": "5",
-             "one_to_one_connection_dtcm_max_bytes": "0"}
+             "one_to_one_connection_dtcm_max_bytes": "0",
+             "n_synapse_generation_workers": "0",
+             "distance_cache_max_bytes": "67108864"}
         self.config["Buffers"] = {"time_between_requests": "10",
                                   "minimum_buffer_sdram": "10",
                                   "use_auto_pause_and_resume": "True",
@@ -74,6 +79,10 @@ class MockSimulator(object):
     def has_reset_last(self):
         return False
 
+    @property
+    def n_resets(self):
+        return 0
+
     @property
     def id_counter(self):
         return 1
@@ -146,3 +146,40 @@ def test_connection_holder_matrix_multiple_items():
         [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30)],
         AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
     connection_holder.add_connections(connections)
+
+
+def test_connection_holder_sparse():
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight", "delay"], as_list=False,
+        n_pre_atoms=3, n_post_atoms=2, as_sparse=True)
+    connection_holder.add_connections(numpy.array(
+        [(0, 0, 1, 10), (2, 1, 3, 30)],
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE))
+    connection_holder.add_connections(numpy.array(
+        [(0, 0, 2, 20)], AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE))
+
+    weights, delays = connection_holder
+    assert weights.shape == (3, 2)
+    assert weights.nnz == 2
+    assert numpy.array_equal(
+        weights.toarray(), [[3, 0], [0, 0], [0, 3]])
+    assert delays.nnz == 2
+    assert numpy.array_equal(
+        delays.toarray(), [[20, 0], [0, 0], [0, 30]])
+
+
+def test_connection_holder_unsorted_list():
+    connections = numpy.array(
+        [(1, 0, 1, 10), (0, 1, 2, 20), (0, 0, 3, 30)],
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight"], as_list=True, n_pre_atoms=2,
+        n_post_atoms=2, sort=False)
+    connection_holder.add_connections(connections)
+    assert numpy.array_equal(connection_holder[:], connections["weight"])
+
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight"], as_list=True, n_pre_atoms=2,
+        n_post_atoms=2)
+    connection_holder.add_connections(connections)
+    assert numpy.array_equal(connection_holder[:], [3, 2, 1])
@@ -0,0 +1,75 @@
+import struct
+import numpy
+from pacman.model.routing_info import BaseKeyAndMask
+from spynnaker.pyNN.models.neuron.master_pop_table_generators import (
+    MasterPopTableAsBinarySearch)
+
+
+class MockSpec(object):
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, data):
+        self.data += struct.pack("<I", data)
+
+    def write_array(self, array_values):
+        self.data += numpy.asarray(array_values, dtype="<u4").tobytes()
+
+
+class MockTransceiver(object):
+
+    def __init__(self, data):
+        self.data = data
+        self.n_reads = 0
+
+    def read_memory(self, x, y, base_address, length):
+        self.n_reads += 1
+        return self.data[base_address:base_address + length]
+
+
+def _make_table(keys):
+    table = MasterPopTableAsBinarySearch()
+    spec = MockSpec()
+    table.initialise_table(spec, 0)
+    for i, key in enumerate(keys):
+        key_and_mask = BaseKeyAndMask(key, 0xFFFFF800)
+        table.update_master_population_table(
+            spec, i * 64, 10 + i, key_and_mask, 0)
+        table.update_master_population_table(
+            spec, i, 1, key_and_mask, 0, is_single=True)
+    table.finish_master_pop_table(spec, 0)
+    return table, MockTransceiver(spec.data)
+
+
+def test_extract_locations():
+    keys = [0x800 * i for i in range(0, 100, 3)]
+    table, transceiver = _make_table(keys)
+    search_keys = [0x800 * i + 5 for i in range(100)]
+    locations = table.extract_synaptic_matrix_data_locations(
+        search_keys, 0, transceiver, 0, 0)
+    for i, location in enumerate(locations):
+        if i % 3:
+            assert location == []
+        else:
+            index = i // 3
+            assert location == [
+                (10 + index, index * 64, False), (1, index, True)]
+        assert location == table.extract_synaptic_matrix_data_location(
+            search_keys[i], 0, transceiver, 0, 0)
+
+
+def test_read_tables_cached():
+    table, transceiver = _make_table([0, 0x800])
+    table.extract_synaptic_matrix_data_location(0, 0, transceiver, 0, 0)
+    n_reads = transceiver.n_reads
+    table.extract_synaptic_matrix_data_location(0x800, 0, transceiver, 0, 0)
+    table.extract_synaptic_matrix_data_locations(
+        [0, 0x800], 0, transceiver, 0, 0)
+    assert transceiver.n_reads == n_reads
+    table.clear_read_tables()
+    table.extract_synaptic_matrix_data_location(0, 0, transceiver, 0, 0)
+    assert transceiver.n_reads == 2 * n_reads
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+import numpy
+from data_specification.enums import DataType
 from pacman.model.graphs.common import Slice
 from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.common import NeuronRecorder
@@ -28,3 +31,184 @@ def test_simple_record():
     assert (gps[1].get_value() == 1)
     # 4 n_neurons second (index "5") is v
     assert (gps[5].get_value() == _slice.n_atoms)
+
+
+class _MockDataPointer(object):
+    def __init__(self, data):
+        self._data = data
+        self._position = 0
+        self.max_read = 0
+
+    def read_all(self):
+        return self._data
+
+    def seek_read(self, offset):
+        self._position = offset
+
+    def read(self, data_size):
+        self.max_read = max(self.max_read, data_size)
+        data = self._data[self._position:self._position + data_size]
+        self._position += len(data)
+        return data
+
+
+class _MockBufferManager(object):
+    def __init__(self, vertex_data):
+        self._vertex_data = vertex_data
+
+        self.pointers = dict()
+
+    def get_data_for_vertex(self, placement, region):
+        data, missing = self._vertex_data[placement]
+        self.pointers[placement] = _MockDataPointer(data)
+        return self.pointers[placement], missing
+
+
+class _MockPlacements(object):
+    def get_placement_of_vertex(self, vertex):
+        return vertex
+
+
+class _MockGraphMapper(object):
+    def __init__(self, slices):
+        self._slices = slices
+
+    def get_machine_vertices(self, application_vertex):
+        return list(self._slices.keys())
+
+    def get_slice(self, vertex):
+        return self._slices[vertex]
+
+
+class _MockPlacement(object):
+    def __init__(self, p):
+        self.x = 0
+        self.y = 0
+        self.p = p
+
+
+def _make_record(times, values):
+    record = numpy.column_stack((times, values)).astype("<i4")
+    return bytearray(record.tobytes())
+
+
+def _make_recorder_and_data():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(_MockBasicSimulator())
+    nr = NeuronRecorder(["spikes", "v"], 10)
+    nr.set_recording("v", True, sampling_interval=2.0)
+
+    n_steps = 20
+    times = numpy.arange(0, n_steps, 2)
+    values = numpy.arange(100).reshape(10, 10) * DataType.S1615.scale
+    complete = _MockPlacement(1)
+    lossy = _MockPlacement(2)
+    graph_mapper = _MockGraphMapper(
+        OrderedDict([(complete, Slice(0, 3)), (lossy, Slice(4, 9))]))
+
+    # The lossy core is missing the rows of times 4 and 10
+    kept = numpy.array([0, 1, 3, 4, 6, 7, 8, 9])
+    buffer_manager = _MockBufferManager({
+        complete: (_make_record(times, values[:, :4]), False),
+        lossy: (_make_record(times[kept], values[kept, 4:]), True)})
+
+    expected = numpy.arange(100, dtype="float").reshape(10, 10)
+    expected[[2, 5], 4:] = numpy.nan
+    return nr, buffer_manager, graph_mapper, n_steps, expected
+
+
+def test_get_matrix_data_with_gaps():
+    nr, buffer_manager, graph_mapper, n_steps, expected = \
+        _make_recorder_and_data()
+    data, indexes, _ = nr.get_matrix_data(
+        "test", buffer_manager, 0, _MockPlacements(), graph_mapper, None,
+        "v", n_steps)
+    assert indexes == list(range(10))
+    numpy.testing.assert_array_equal(data, expected)
+
+
+def test_iter_matrix_data():
+    nr, buffer_manager, graph_mapper, n_steps, expected = \
+        _make_recorder_and_data()
+    blocks = list(nr.iter_matrix_data(
+        "test", buffer_manager, 0, _MockPlacements(), graph_mapper, None,
+        "v", n_steps, 6))
+
+    # 6 time steps with a sampling interval of 2 is 3 rows per block
+    assert [first_step for _, _, _, first_step in blocks] == [0, 6, 12, 18]
+    for data, indexes, interval, _ in blocks:
+        assert len(data) <= 3
+        assert indexes == list(range(10))
+        assert interval == 2
+    data = numpy.concatenate([data for data, _, _, _ in blocks])
+    numpy.testing.assert_array_equal(data, expected)
+
+    # No more than a block of rows is read from the buffers at once
+    for vertex in graph_mapper.get_machine_vertices(None):
+        n_neurons = graph_mapper.get_slice(vertex).n_atoms
+        assert (buffer_manager.pointers[vertex].max_read <=
+                3 * 4 * (n_neurons + 1))
+
+
+def test_get_spikes():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(_MockBasicSimulator())
+    nr = NeuronRecorder(["spikes", "v"], 40)
+    nr.set_recording("spikes", True, indexes=[1, 3, 5, 30, 35, 39])
+
+    # Bit i of the word of each time step is the i-th neuron recording
+    first = _MockPlacement(1)
+    second = _MockPlacement(2)
+    graph_mapper = _MockGraphMapper(
+        OrderedDict([(second, Slice(20, 39)), (first, Slice(0, 19))]))
+    buffer_manager = _MockBufferManager({
+        first: (_make_record([0, 1, 2], [0b101, 0b010, 0b000]), False),
+        second: (_make_record([0, 1, 2], [0b001, 0b110, 0b100]), False)})
+
+    spikes = nr.get_spikes(
+        "test", buffer_manager, 0, _MockPlacements(), graph_mapper, None,
+        1000)
+    assert numpy.array_equal(spikes, [
+        [1, 0], [3, 1], [5, 0], [30, 0], [35, 1], [39, 1], [39, 2]])
+
+    spikes = nr.get_spikes(
+        "test", buffer_manager, 0, _MockPlacements(), graph_mapper, None,
+        1000, sort_by_time=True)
+    assert numpy.array_equal(spikes, [
+        [1, 0], [5, 0], [30, 0], [3, 1], [35, 1], [39, 1], [39, 2]])
+
+
+def test_get_matrix_data_since():
+    nr, buffer_manager, graph_mapper, n_steps, expected = \
+        _make_recorder_and_data()
+
+    # From time step 9, the first row is that of time step 10
+    data, indexes, _ = nr.get_matrix_data(
+        "test", buffer_manager, 0, _MockPlacements(), graph_mapper, None,
+        "v", n_steps, 9)
+    assert indexes == list(range(10))
+    numpy.testing.assert_array_equal(data, expected[5:])
+
+    # The complete core is read from the first row needed
+    complete = graph_mapper.get_machine_vertices(None)[0]
+    assert buffer_manager.pointers[complete].max_read == 5 * 4 * 5
+
+
+def test_get_spikes_since():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(_MockBasicSimulator())
+    nr = NeuronRecorder(["spikes", "v"], 20)
+    nr.set_recording("spikes", True)
+    placement = _MockPlacement(1)
+    graph_mapper = _MockGraphMapper(OrderedDict([(placement, Slice(0, 19))]))
+    buffer_manager = _MockBufferManager({placement: (_make_record(
+        [0, 1, 2, 3], [0b101, 0b010, 0b100, 0b001]), False)})
+
+    all_spikes = nr.get_spikes(
+        "test", buffer_manager, 0, _MockPlacements(), graph_mapper, None,
+        1000)
+    spikes = nr.get_spikes(
+        "test", buffer_manager, 0, _MockPlacements(), graph_mapper, None,
+        1000, first_machine_time_step=2)
+    assert numpy.array_equal(spikes, [[0, 3], [2, 2]])
+    assert numpy.array_equal(spikes, all_spikes[all_spikes[:, 1] >= 2])
@@ -0,0 +1,29 @@
+import numpy
+from data_specification.enums import DataType
+from spinn_utilities.ranged.ranged_list import RangedList
+from spynnaker.pyNN.models.neuron.implementations.struct import Struct
+from spynnaker.pyNN.utilities.utility_calls import convert_to
+from unittests.mocks import MockSimulator
+
+
+def test_get_and_read_data():
+    MockSimulator.setup()
+    struct = Struct([DataType.S1615, DataType.UINT32, DataType.U032])
+    rng = numpy.random.RandomState(5)
+    voltages = rng.uniform(-80.0, -50.0, 20)
+    ranged = RangedList(20, 0.25)
+    ranged[5:12] = 0.75
+    data = struct.get_data([voltages, 7, ranged], offset=3, array_size=10)
+
+    values = numpy.frombuffer(data.tobytes(), dtype=struct.numpy_dtype)
+    assert numpy.array_equal(
+        values["f0"], [convert_to(v, DataType.S1615) for v in voltages[3:13]])
+    assert numpy.array_equal(values["f1"], [7] * 10)
+    assert numpy.array_equal(
+        values["f2"], [convert_to(v, DataType.U032) for v in ranged[3:13]])
+
+    voltages_read, sevens, ranged_read = struct.read_data(
+        data.tobytes(), array_size=10)
+    assert numpy.allclose(voltages_read, voltages[3:13], atol=2 ** -15)
+    assert numpy.array_equal(sevens, [7] * 10)
+    assert numpy.allclose(ranged_read, ranged[3:13])
@@ -0,0 +1,144 @@
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FixedNumberPostConnector, FixedNumberPreConnector,
+    FixedProbabilityConnector)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.models.neuron.synapse_io import SynapseGenerationPool
+from unittests.mocks import MockSimulator, MockPopulation, MockRNG
+
+
+class MockSynapseIO(object):
+    """ Packs the connections as rows of (source, target, weight) words
+    """
+
+    def get_synapses(
+            self, synapse_info, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            n_delay_stages, population_table, n_synapse_types,
+            weight_scales, machine_time_step, app_edge, machine_edge):
+        block = synapse_info.connector.create_synaptic_block(
+            synapse_info.weight, synapse_info.delay, pre_slices,
+            pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_info.synapse_type)
+        row_data = numpy.column_stack((
+            block["source"], block["target"],
+            (block["weight"] * 1000).astype("uint32"))).flatten()
+        return (row_data.astype("uint32"), 3, numpy.zeros(0, dtype="uint32"),
+                0, numpy.zeros(0, dtype="uint32"),
+                numpy.zeros(0, dtype="uint32"))
+
+
+def _generate(n_workers, max_n_words, block_order=range(10),
+              connector=None):
+    MockSimulator.setup()
+    if connector is None:
+        connector = FixedProbabilityConnector(0.3)
+    connector.set_projection_information(
+        MockPopulation(100, "pre"), MockPopulation(100, "post"),
+        MockRNG(), 1000)
+    connector._rng.seed(1)
+    weights = MockRNG()
+    synapse_info = SynapseInformation(
+        connector, SynapseDynamicsStatic(), 0, weights, 1.0)
+    slices = [Slice(lo, lo + 9) for lo in range(0, 100, 10)]
+    pool = SynapseGenerationPool(n_workers)
+    for i in block_order:
+        pool.add_block(
+            i, MockSynapseIO(), synapse_info, max_n_words, slices, i,
+            slices, 0, slices[i], slices[0], 0, None, 1, [1.0], 1000,
+            None, None)
+    return pool.generate()
+
+
+def _assert_same_blocks(blocks, other_blocks):
+    assert sorted(blocks.keys()) == sorted(other_blocks.keys())
+    for key in blocks:
+        for item, other_item in zip(blocks[key], other_blocks[key]):
+            assert numpy.array_equal(item, other_item)
+
+
+def test_workers_match_serial():
+    serial = _generate(1, 1000)
+    for n_workers, max_n_words in ((3, 1000), (3, 10)):
+        _assert_same_blocks(serial, _generate(n_workers, max_n_words))
+
+
+@pytest.mark.parametrize("make_connector", [
+    lambda: FixedProbabilityConnector(0.3),
+    lambda: FixedNumberPreConnector(10),
+    lambda: FixedNumberPostConnector(3)])
+def test_blocks_do_not_depend_on_order(make_connector):
+    serial = _generate(1, 1000, connector=make_connector())
+    for block_order in ([9, 3, 0, 5, 1, 2, 8, 7, 6, 4], [6]):
+        reordered = _generate(
+            1, 1000, block_order, connector=make_connector())
+        for key in reordered:
+            for serial_item, reordered_item in zip(
+                    serial[key], reordered[key]):
+                assert numpy.array_equal(serial_item, reordered_item)
+
+
+def test_projection_wide_choices_shared_by_workers():
+    serial = _generate(1, 1000, connector=FixedNumberPreConnector(10))
+    parallel = _generate(3, 1000, connector=FixedNumberPreConnector(10))
+    _assert_same_blocks(serial, parallel)
+
+    # Every post-neuron gets exactly the number of pre-neurons asked for
+    targets = numpy.concatenate([
+        parallel[key][0].reshape(-1, 3)[:, 1] for key in parallel])
+    assert numpy.array_equal(
+        numpy.bincount(targets, minlength=10), numpy.full(10, 10))
+
+
+def test_seeding_leaves_user_rngs_alone():
+    MockSimulator.setup()
+    connector = FixedProbabilityConnector(0.3)
+    rng = MockRNG()
+    connector.set_projection_information(
+        MockPopulation(100, "pre"), MockPopulation(100, "post"), rng, 1000)
+    weights = MockRNG()
+    rng.seed(1)
+    weights.seed(2)
+    connector.seed_block(3, weights, 1.0)
+    block = connector.create_synaptic_block(
+        weights, 1.0, [], 0, [], 0, Slice(0, 99), Slice(0, 99), 0)
+    assert len(block)
+    assert rng.next(1) == numpy.random.RandomState(1).uniform(size=1)
+    assert weights.next(1) == numpy.random.RandomState(2).uniform(size=1)
+
+    # The same block is made from the same seed whatever the user state
+    connector.seed_block(3, weights, 1.0)
+    again = connector.create_synaptic_block(
+        weights, 1.0, [], 0, [], 0, Slice(0, 99), Slice(0, 99), 0)
+    assert numpy.array_equal(block, again)
+
+
+def test_projections_sharing_a_connector_differ():
+    MockSimulator.setup()
+    connector = FixedProbabilityConnector(0.3)
+    connector.set_projection_information(
+        MockPopulation(100, "pre"), MockPopulation(100, "post"),
+        MockRNG(), 1000)
+    synapse_infos = [
+        SynapseInformation(connector, SynapseDynamicsStatic(), 0, 1.0, 1.0)
+        for _ in range(2)]
+    for synapse_info in synapse_infos:
+        connector.add_projection(synapse_info)
+    slices = [Slice(lo, lo + 9) for lo in range(0, 100, 10)]
+    pool = SynapseGenerationPool(1)
+    for i, synapse_info in enumerate(synapse_infos):
+        pool.add_block(
+            i, MockSynapseIO(), synapse_info, 1000, slices, 0, slices, 0,
+            slices[0], slices[0], 0, None, 1, [1.0], 1000, None, None)
+    blocks = pool.generate()
+    assert not numpy.array_equal(blocks[0][0], blocks[1][0])
+
+    # The seed of a block depends only on its projection and slices
+    seed = connector.get_block_seed(synapse_infos[1], slices[2], slices[3])
+    connector.get_block_seed(synapse_infos[0], slices[3], slices[2])
+    assert connector.get_block_seed(
+        synapse_infos[1], slices[2], slices[3]) == seed
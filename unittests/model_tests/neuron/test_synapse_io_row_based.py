@@ -1,7 +1,11 @@
+import numpy
 import pytest
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, SynapseInformation)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     SynapseDynamicsStatic, SynapseDynamicsSTDP)
 from spynnaker.pyNN.models.neuron.master_pop_table_generators import (
@@ -46,3 +50,94 @@ def test_get_max_row_length(dynamics, size, exception, max_size):
         actual_size = io._get_max_row_length(
             size, dynamics, population_table, in_edge, size)
         assert actual_size == max_size
+
+
+class _MockPopulationTable(object):
+
+    def get_allowed_row_length(self, row_length):
+        return row_length
+
+
+@pytest.mark.parametrize("dynamics", [
+    SynapseDynamicsStatic(),
+    SynapseDynamicsStatic(pad_to_length=8),
+    SynapseDynamicsSTDP(
+        TimingDependenceSpikePair(), WeightDependenceAdditive()),
+    SynapseDynamicsSTDP(
+        TimingDependenceSpikePair(), WeightDependenceAdditive(),
+        pad_to_length=8)])
+def test_pack_rows_round_trip(dynamics):
+    rng = numpy.random.RandomState(1)
+    pre_slice = Slice(0, 99)
+    post_slice = Slice(100, 199)
+    connections = numpy.zeros(
+        1000, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.randint(0, 100, 1000)
+    connections["target"] = rng.randint(100, 200, 1000)
+    connections["weight"] = rng.randint(0, 1000, 1000)
+    connections["delay"] = rng.randint(1, 16, 1000)
+    connections["synapse_type"] = 0
+
+    io = SynapseIORowBased()
+    max_row_length, row_data = io._get_max_row_length_and_row_data(
+        connections, connections["source"], pre_slice.n_atoms, post_slice,
+        2, _MockPopulationTable(), dynamics, None, None)
+    n_words = row_data.size // pre_slice.n_atoms
+    assert n_words == max_row_length + 3
+
+    synapse_info = SynapseInformation(None, dynamics, 0)
+    read = io.read_synapses(
+        synapse_info, pre_slice, post_slice, max_row_length, 0, 2, [1, 1],
+        row_data.tobytes(), None, 0, 1000)
+    expected = numpy.lexsort((connections["target"], connections["source"]))
+    actual = numpy.lexsort((read["target"], read["source"]))
+    assert numpy.array_equal(
+        read["source"][actual], connections["source"][expected])
+    assert numpy.array_equal(
+        read["target"][actual], connections["target"][expected])
+    assert numpy.array_equal(
+        read["weight"][actual], connections["weight"][expected])
+
+
+@pytest.mark.parametrize("dynamics", [
+    SynapseDynamicsStatic(),
+    SynapseDynamicsSTDP(
+        TimingDependenceSpikePair(), WeightDependenceAdditive())])
+def test_read_delayed_rows(dynamics):
+    rng = numpy.random.RandomState(2)
+    pre_slice = Slice(50, 149)
+    post_slice = Slice(100, 199)
+    n_stages = 3
+    n_rows = pre_slice.n_atoms * n_stages
+    connections = numpy.zeros(
+        2000, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.randint(0, n_rows, 2000)
+    connections["target"] = rng.randint(100, 200, 2000)
+    connections["weight"] = rng.randint(0, 1000, 2000)
+    connections["delay"] = rng.randint(1, 16, 2000)
+    connections["synapse_type"] = 0
+
+    io = SynapseIORowBased()
+    max_row_length, row_data = io._get_max_row_length_and_row_data(
+        connections, connections["source"], n_rows, post_slice,
+        2, _MockPopulationTable(), dynamics, None, None)
+    synapse_info = SynapseInformation(None, dynamics, 0)
+    read = io.read_synapses(
+        synapse_info, pre_slice, post_slice, 0, max_row_length, 2, [1, 1],
+        None, row_data.tobytes(), n_stages, 1000)
+
+    # Each delay stage has a row per source, and adds 16 to the delay
+    stage = connections["source"] // pre_slice.n_atoms
+    sources = (
+        connections["source"] - stage * pre_slice.n_atoms +
+        pre_slice.lo_atom)
+    delays = connections["delay"] + (stage + 1) * 16
+    expected = numpy.lexsort(
+        (connections["target"], delays, sources))
+    actual = numpy.lexsort((read["target"], read["delay"], read["source"]))
+    assert numpy.array_equal(read["source"][actual], sources[expected])
+    assert numpy.array_equal(
+        read["target"][actual], connections["target"][expected])
+    assert numpy.array_equal(read["delay"][actual], delays[expected])
+    assert numpy.array_equal(
+        read["weight"][actual], connections["weight"][expected])
@@ -44,16 +44,48 @@ class MockMasterPopulationTable(object):
             self, key, master_pop_table_address, transceiver, x, y):
         return self._key_to_entry_map[key]
 
+    def extract_synaptic_matrix_data_locations(
+            self, keys, master_pop_table_address, transceiver, x, y):
+        return [self._key_to_entry_map[key] for key in keys]
+
+    def clear_read_tables(self):
+        pass
+
 
 class MockTransceiverRawData(object):
 
     def __init__(self, data_to_read):
         self._data_to_read = data_to_read
 
+        self.n_reads = 0
+
     def read_memory(self, x, y, base_address, length):
+        self.n_reads += 1
         return self._data_to_read[base_address:base_address + length]
 
 
+class MockGraphMapper(object):
+
+    def __init__(self, app_edge, pre_vertex_slice):
+        self._app_edge = app_edge
+        self._pre_vertex_slice = pre_vertex_slice
+
+    def get_application_edge(self, machine_edge):
+        return self._app_edge
+
+    def get_slice(self, vertex):
+        return self._pre_vertex_slice
+
+
+class MockRoutingInfos(object):
+
+    def __init__(self, edge_keys):
+        self._edge_keys = edge_keys
+
+    def get_first_key_for_edge(self, edge):
+        return self._edge_keys[edge]
+
+
 class SimpleApplicationVertex(ApplicationVertex):
 
     def __init__(self, n_atoms):
@@ -175,6 +207,59 @@ class TestSynapticManager(unittest.TestCase):
         assert data_1 == direct_matrix_1_expanded
         assert data_2 == direct_matrix_2_expanded
 
+    def test_read_connections_from_machine(self):
+        default_config_paths = os.path.join(
+            os.path.dirname(abstract_spinnaker_common.__file__),
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME)
+
+        config = conf_loader.load_config(
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME, default_config_paths)
+
+        # Three blocks, the first two next to each other and the last apart
+        synaptic_manager = SynapticManager(
+            n_synapse_types=2, ring_buffer_sigma=5.0, spikes_per_second=100.0,
+            config=config,
+            population_table_type=MockMasterPopulationTable({
+                0: [(1, 0, False)], 1: [(1, 4, False)],
+                2: [(1, 1024, False)]}),
+            synapse_io=MockSynapseIO())
+        placement = Placement(None, 0, 0, 1)
+        synaptic_manager._region_addresses[placement] = (0, 0, 0)
+
+        app_vertex = SimpleApplicationVertex(10)
+        synapse_info = SynapseInformation(
+            None, SynapseDynamicsStatic(), 0, 1.0, 1.0)
+        app_edge = ProjectionApplicationEdge(
+            app_vertex, app_vertex, synapse_info)
+        machine_edges = [
+            ProjectionMachineEdge(
+                app_edge.synapse_information,
+                SimpleMachineVertex(resources=None),
+                SimpleMachineVertex(resources=None))
+            for _ in range(3)]
+        graph_mapper = MockGraphMapper(app_edge, Slice(0, 9))
+        routing_infos = MockRoutingInfos(
+            {edge: key for key, edge in enumerate(machine_edges)})
+        data = bytearray(range(256)) * 5
+        transceiver = MockTransceiverRawData(data)
+
+        synaptic_manager.read_connections_from_machine(
+            transceiver, placement,
+            [(edge, synapse_info) for edge in machine_edges],
+            graph_mapper, routing_infos, False)
+        assert transceiver.n_reads == 2
+
+        # The blocks should now be read without reading from the machine
+        for key, address in ((0, 0), (1, 4), (2, 1024)):
+            block, row_len = synaptic_manager._retrieve_synaptic_block(
+                transceiver=transceiver, placement=placement,
+                master_pop_table_address=0, indirect_synapses_address=0,
+                direct_synapses_address=0, key=key, n_rows=1, index=0,
+                using_extra_monitor_cores=False)
+            assert row_len == 1
+            assert block == data[address:address + 4]
+        assert transceiver.n_reads == 2
+
     def test_write_synaptic_matrix_and_master_population_table(self):
         MockSimulator.setup()
 
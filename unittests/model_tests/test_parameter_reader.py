@@ -0,0 +1,109 @@
+import struct
+import pytest
+from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement
+from spynnaker.pyNN.models.common import ParameterReader
+
+_REGION = 2
+_OFFSET = 8
+_REGION_TABLE = 0x60000000
+_PARAMETERS_BASE = 0x70000000
+
+
+class _CPUInfo(object):
+    def __init__(self, p):
+        # Each core has its own region table
+        self.user = [_REGION_TABLE + 0x1000 * p, 0, 0, 0]
+
+
+class _Transceiver(object):
+    """ Serves each core's parameters as its core ID repeated
+    """
+
+    def __init__(self, fail_core=None):
+        self._fail_core = fail_core
+        self.n_cpu_info_reads = 0
+        self.n_reads = 0
+
+    def get_cpu_information_from_core(self, x, y, p):
+        self.n_cpu_info_reads += 1
+        return _CPUInfo(p)
+
+    def read_memory(self, x, y, base_address, length):
+        self.n_reads += 1
+        if base_address < _PARAMETERS_BASE:
+            # The region table entry, giving each core its own region
+            p = (base_address - _REGION_TABLE) // 0x1000
+            return struct.pack("<I", _PARAMETERS_BASE + 0x1000 * p)
+        p = (base_address - _PARAMETERS_BASE - _OFFSET) // 0x1000
+        core = (x, y, p)
+        if core == self._fail_core:
+            raise IOError("Failed to read {}".format(core))
+        return struct.pack("<III", *core)
+
+
+class _Vertex(object):
+    def __init__(self):
+        self.data = dict()
+
+    def get_parameters_location(self, vertex_slice):
+        return _REGION, _OFFSET, 12
+
+    def update_parameters_from_data(self, data, vertex_slice):
+        self.data[vertex_slice.lo_atom] = struct.unpack("<III", bytes(data))
+
+
+def _placements_and_slices(n_cores_per_board):
+    placements_and_slices = list()
+    for board in range(2):
+        for i in range(n_cores_per_board):
+            vertex_slice = Slice(
+                (board * n_cores_per_board + i) * 10,
+                (board * n_cores_per_board + i) * 10 + 9)
+            placements_and_slices.append((
+                Placement(None, board * 8 + i % 8, 0, i // 8 + 1),
+                vertex_slice))
+    return placements_and_slices
+
+
+def _expected(placements_and_slices):
+    return {
+        vertex_slice.lo_atom: (placement.x, placement.y, placement.p)
+        for placement, vertex_slice in placements_and_slices}
+
+
+def test_read_parameters():
+    placements_and_slices = _placements_and_slices(12)
+    transceiver = _Transceiver()
+    vertex = _Vertex()
+    reader = ParameterReader()
+    reader.read_parameters(transceiver, vertex, placements_and_slices)
+    assert vertex.data == _expected(placements_and_slices)
+    assert transceiver.n_cpu_info_reads == len(placements_and_slices)
+
+    # The addresses are kept, so reading again only reads the parameters
+    vertex = _Vertex()
+    n_reads = transceiver.n_reads
+    reader.read_parameters(transceiver, vertex, placements_and_slices)
+    assert vertex.data == _expected(placements_and_slices)
+    assert transceiver.n_cpu_info_reads == len(placements_and_slices)
+    assert transceiver.n_reads - n_reads == len(placements_and_slices)
+
+    # Until the cache is cleared
+    reader.clear_cache()
+    reader.read_parameters(transceiver, _Vertex(), placements_and_slices)
+    assert transceiver.n_cpu_info_reads == 2 * len(placements_and_slices)
+
+
+def test_read_parameters_error():
+    placements_and_slices = _placements_and_slices(6)
+    placement, _ = placements_and_slices[3]
+    transceiver = _Transceiver(
+        fail_core=(placement.x, placement.y, placement.p))
+    vertex = _Vertex()
+    with pytest.raises(IOError):
+        ParameterReader().read_parameters(
+            transceiver, vertex, placements_and_slices)
+
+    # The cores before the failure were read
+    assert vertex.data == _expected(placements_and_slices[:3])
@@ -0,0 +1,229 @@
+import numpy
+from spinn_front_end_common.utilities import globals_variables
+from spynnaker.pyNN.models.common import (
+    AbstractNeuronRecordable, AbstractSpikeRecordable)
+from spynnaker.pyNN.models.recording_common import RecordingCommon
+from spynnaker.pyNN.utilities.spynnaker_failed_state import (
+    SpynnakerFailedState)
+
+
+class _Simulator(object):
+    has_ran = True
+    use_virtual_board = False
+    placements = None
+    graph_mapper = None
+    buffer_manager = None
+    machine_time_step = 1000
+
+    def __init__(self):
+        self.no_machine_time_steps = 0
+        self.n_resets = 0
+
+    def verify_not_running(self):
+        pass
+
+    def add_extraction_timing(self, timing):
+        pass
+
+
+class _Vertex(AbstractNeuronRecordable, AbstractSpikeRecordable):
+    """ Records v as the time step at each time step, and a spike from\
+        neuron 1 on even time steps and from neuron 0 on odd ones
+    """
+
+    def __init__(self, sim):
+        self._sim = sim
+        self.extracted = list()
+        self.cleared = list()
+
+    def _v(self, first_step):
+        steps = numpy.arange(first_step, self._sim.no_machine_time_steps)
+        return numpy.column_stack((steps, steps)).astype("float")
+
+    def _spikes(self, first_step):
+        steps = numpy.arange(first_step, self._sim.no_machine_time_steps)
+        spikes = numpy.column_stack((steps % 2 == 0, steps)).astype("float")
+        return spikes[numpy.lexsort((spikes[:, 1], spikes[:, 0]))]
+
+    def get_data(self, variable, n_machine_time_steps, placements,
+                 graph_mapper, buffer_manager, machine_time_step):
+        self.extracted.append((variable, 0))
+        return self._v(0), [0, 1], 1.0
+
+    def get_data_since(self, variable, first_machine_time_step,
+                       n_machine_time_steps, placements, graph_mapper,
+                       buffer_manager, machine_time_step):
+        self.extracted.append((variable, first_machine_time_step))
+        return self._v(first_machine_time_step), [0, 1], 1.0
+
+    def get_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        self.extracted.append(("spikes", 0))
+        return self._spikes(0)
+
+    def get_spikes_since(
+            self, first_machine_time_step, placements, graph_mapper,
+            buffer_manager, machine_time_step):
+        self.extracted.append(("spikes", first_machine_time_step))
+        return self._spikes(first_machine_time_step)
+
+    def clear_recording(
+            self, variable, buffer_manager, placements, graph_mapper):
+        self.cleared.append(variable)
+
+    def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
+        self.cleared.append("spikes")
+
+    def get_n_recording_clears(self, variable):
+        return self.cleared.count(variable)
+
+    def get_n_spike_recording_clears(self):
+        return self.cleared.count("spikes")
+
+    def is_recording(self, variable):
+        return True
+
+    def is_recording_spikes(self):
+        return True
+
+    def get_recordable_variables(self):
+        return ["v"]
+
+    def set_recording(self, variable, new_state=True, sampling_interval=None,
+                      indexes=None):
+        pass
+
+    def set_recording_spikes(
+            self, new_state=True, sampling_interval=None, indexes=None):
+        pass
+
+    def get_neuron_sampling_interval(self, variable):
+        return 1.0
+
+    def get_spikes_sampling_interval(self):
+        return 1.0
+
+
+class _UncountedVertex(_Vertex):
+    """ A vertex that does not count the clears of its recordings
+    """
+
+    def get_n_recording_clears(self, variable):
+        return None
+
+    def get_n_spike_recording_clears(self):
+        return None
+
+
+class _Population(object):
+    def __init__(self, vertex):
+        self._vertex = vertex
+        self.size = 2
+
+
+def _setup(vertex_type=_Vertex):
+    sim = _Simulator()
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(sim)
+    vertex = vertex_type(sim)
+    return sim, vertex, RecordingCommon(_Population(vertex))
+
+
+def test_extracted_data_is_reused():
+    sim, vertex, recording = _setup()
+    sim.no_machine_time_steps = 10
+    spikes = recording._get_spikes()
+    data, indexes, _ = recording._get_recorded_matrix("v")
+    assert numpy.array_equal(recording._get_spikes(), spikes)
+    assert numpy.array_equal(recording._get_recorded_matrix("v")[0], data)
+    assert vertex.extracted == [("spikes", 0), ("v", 0)]
+    assert indexes == [0, 1]
+
+
+def test_changing_the_data_returned_does_not_change_the_data_kept():
+    sim, vertex, recording = _setup()
+    sim.no_machine_time_steps = 10
+    spikes = recording._get_spikes()
+    data, indexes, _ = recording._get_recorded_matrix("v")
+    spikes[:, 1] *= 0.1
+    data *= 2
+    indexes.append(2)
+    assert numpy.array_equal(recording._get_spikes(), vertex._spikes(0))
+    data, indexes, _ = recording._get_recorded_matrix("v")
+    assert numpy.array_equal(data, vertex._v(0))
+    assert indexes == [0, 1]
+    assert vertex.extracted == [("spikes", 0), ("v", 0)]
+
+    # Including after a continued run appends to the data kept
+    spikes = recording._get_spikes()
+    spikes[:] = -1
+    sim.no_machine_time_steps = 20
+    assert numpy.array_equal(recording._get_spikes(), vertex._spikes(0))
+
+
+def test_continued_run_extracts_only_new_data():
+    sim, vertex, recording = _setup()
+    sim.no_machine_time_steps = 10
+    recording._get_spikes()
+    recording._get_recorded_matrix("v")
+    sim.no_machine_time_steps = 25
+    spikes = recording._get_spikes()
+    data, _, _ = recording._get_recorded_matrix("v")
+    assert vertex.extracted == [
+        ("spikes", 0), ("v", 0), ("spikes", 10), ("v", 10)]
+
+    # The result is the same as extracting everything at once
+    assert numpy.array_equal(spikes, vertex._spikes(0))
+    assert numpy.array_equal(data, vertex._v(0))
+
+
+def test_reset_and_clear_extract_again():
+    sim, vertex, recording = _setup()
+    sim.no_machine_time_steps = 10
+    recording._get_spikes()
+    recording._get_recorded_matrix("v")
+
+    # After a reset, the run is the same length but the data is new
+    sim.n_resets += 1
+    recording._get_spikes()
+    recording._get_recorded_matrix("v")
+    assert vertex.extracted[2:] == [("spikes", 0), ("v", 0)]
+
+    # However the recording is cleared, the cleared data is not reused
+    vertex.clear_spike_recording(None, None, None)
+    recording._get_spikes()
+    recording._get_recorded_matrix("v")
+    assert vertex.extracted[4:] == [("spikes", 0)]
+    vertex.clear_recording("v", None, None, None)
+    recording._get_spikes()
+    recording._get_recorded_matrix("v")
+    assert vertex.extracted[5:] == [("v", 0)]
+
+
+def test_uncounted_clears_extract_again():
+    sim, vertex, recording = _setup(_UncountedVertex)
+    sim.no_machine_time_steps = 10
+    recording._get_spikes()
+    recording._get_recorded_matrix("v")
+    recording._get_spikes()
+    recording._get_recorded_matrix("v")
+    assert vertex.extracted == [
+        ("spikes", 0), ("v", 0), ("spikes", 0), ("v", 0)]
+
+
+def test_pynn7_format():
+    data = numpy.arange(12, dtype="float").reshape(4, 3)
+    ids = numpy.array([3, 5, 8])
+    expected = numpy.array([
+        [ids[column], row * 0.5, data[row, column]]
+        for column in range(3) for row in range(4)])
+    assert numpy.array_equal(
+        RecordingCommon.pynn7_format(data, ids, 0.5), expected)
+
+    pynn7 = RecordingCommon.pynn7_format(
+        data, ids, 0.5, data2=-data, structured=True)
+    assert pynn7.dtype.names == ("id", "time", "data", "data2")
+    assert numpy.array_equal(pynn7["id"], expected[:, 0])
+    assert numpy.array_equal(pynn7["time"], expected[:, 1])
+    assert numpy.array_equal(pynn7["data"], expected[:, 2])
+    assert numpy.array_equal(pynn7["data2"], -expected[:, 2])
@@ -0,0 +1,55 @@
+import numpy
+import scipy.stats
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SpikeSourcePoissonVertex)
+from unittests.mocks import MockSimulator
+
+
+def test_rate_stats_follow_rate_changes():
+    MockSimulator.setup()
+    rates = numpy.arange(1, 101, dtype="float")
+    vertex = SpikeSourcePoissonVertex(
+        100, None, "test", rates, 0, None, 1, 10, None)
+    assert vertex.max_rate == 100
+    assert vertex.get_max_spikes_per_tick(0.99, 1000) == \
+        scipy.stats.poisson.ppf(0.99, 0.1)
+    assert vertex._get_total_max_spikes() == numpy.sum(
+        scipy.stats.poisson.ppf(1.0 - (1.0 / rates), rates))
+    max_spikes = vertex._max_spikes_per_ts(Slice(0, 9), 1000, 1000)
+
+    # Setting the rate must not leave any old statistics behind
+    vertex.set_value("rate", rates * 2)
+    assert vertex.max_rate == 200
+    assert vertex.get_max_spikes_per_tick(0.99, 1000) == \
+        scipy.stats.poisson.ppf(0.99, 0.2)
+    assert vertex._get_total_max_spikes() == numpy.sum(
+        scipy.stats.poisson.ppf(1.0 - (0.5 / rates), rates * 2))
+    assert vertex._max_spikes_per_ts(Slice(0, 9), 1000, 1000) >= max_spikes
+
+
+def test_only_changed_slices_reload():
+    MockSimulator.setup()
+    vertex = SpikeSourcePoissonVertex(
+        100, None, "test", 10.0, 0, None, 1, 10, None)
+    slices = [Slice(lo, lo + 9) for lo in range(0, 100, 10)]
+    for vertex_slice in slices:
+        vertex._written_time_between_spikes[
+            vertex_slice.lo_atom, vertex_slice.hi_atom] = \
+            vertex._get_time_between_spikes(1000, 1)
+    assert not vertex.requires_memory_regions_to_be_reloaded()
+
+    # Setting the same values is not a change
+    vertex.set_value("duration", None)
+    vertex.set_value("rate", 10.0)
+    assert not vertex.requires_memory_regions_to_be_reloaded()
+
+    # Lowering a rate changes only the slice holding it
+    rates = numpy.full(100, 10.0)
+    rates[15] = 5.0
+    vertex.set_value("rate", rates)
+    assert vertex.requires_memory_regions_to_be_reloaded()
+    assert [vertex._is_slice_changed(vertex_slice, 1000, 1)
+            for vertex_slice in slices] == [i == 1 for i in range(10)]
+    vertex.mark_regions_reloaded()
+    assert not vertex.requires_memory_regions_to_be_reloaded()
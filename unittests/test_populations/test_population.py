@@ -1,3 +1,4 @@
+import numpy
 from spynnaker.pyNN.models.neuron.builds import IFCurrExpBase
 from spynnaker.pyNN.models.pynn_population_common import PyNNPopulationCommon
 from unittests.mocks import MockSimulator
@@ -23,3 +24,16 @@ def test_selector():
     values = pop_1.get_by_selector([1, 3, 4], ["cm", "v_thresh"])
     assert [1.0, 1.0, 1.0] == values['cm']
     assert [-50.0, -50.0, -50.0] == values["v_thresh"]
+
+
+def test_get_spike_counts():
+    simulator = MockSimulator.setup()
+    model = IFCurrExpBase()
+    pop_1 = PyNNPopulationCommon(spinnaker_control=simulator, size=5,
+                                 label="Test", constraints=None, model=model,
+                                 structure=None, initial_values=None)
+    spikes = numpy.array([[0, 1.0], [3, 1.0], [0, 2.0], [4, 5.0]])
+    assert pop_1.get_spike_counts(spikes) == {0: 2, 1: 0, 2: 0, 3: 1, 4: 1}
+    counts = pop_1.get_spike_counts(spikes, as_array=True)
+    assert isinstance(counts, numpy.ndarray)
+    assert list(counts) == [2, 0, 0, 1, 1]
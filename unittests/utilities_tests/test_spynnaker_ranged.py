@@ -0,0 +1,68 @@
+import numpy
+from spynnaker.pyNN.utilities.ranged import (
+    SpynnakerRangeDictionary, SpynnakerRangedList)
+from unittests.mocks import MockSimulator
+
+
+def test_ranged_list_dirty_ranges():
+    MockSimulator.setup()
+    ranged_list = SpynnakerRangedList(100, 1.0)
+    assert not ranged_list.is_dirty()
+
+    ranged_list[10:20] = 2.0
+    ranged_list[25] = 3.0
+    ranged_list[[40, 41, 42]] = 4.0
+    assert ranged_list.is_dirty()
+    assert not ranged_list.is_dirty(0, 10)
+    assert ranged_list.is_dirty(19, 20)
+    assert not ranged_list.is_dirty(20, 25)
+    assert ranged_list.is_dirty(25, 26)
+    assert not ranged_list.is_dirty(26, 40)
+    assert ranged_list.is_dirty(42, 50)
+    assert not ranged_list.is_dirty(43, 100)
+
+    # Marking part of a range clean leaves the rest dirty
+    ranged_list.mark_clean(0, 15)
+    assert not ranged_list.is_dirty(10, 15)
+    assert ranged_list.is_dirty(15, 16)
+    ranged_list.mark_clean(15, 50)
+    assert not ranged_list.is_dirty()
+
+    ranged_list.set_value(5.0)
+    assert ranged_list.is_dirty(99, 100)
+    ranged_list.mark_clean()
+    ranged_list[-5:] = 6.0
+    assert not ranged_list.is_dirty(0, 95)
+    assert ranged_list.is_dirty(95, 100)
+
+
+def test_ranged_list_ids_set_out_of_order():
+    MockSimulator.setup()
+    ranged_list = SpynnakerRangedList(1000, 1.0)
+    ids = numpy.random.RandomState(1).permutation(1000)[:300]
+    for neuron_id in ids:
+        ranged_list[int(neuron_id)] = 2.0
+    dirty = numpy.zeros(1000, dtype="bool")
+    dirty[ids] = True
+    for start in range(0, 1000, 10):
+        assert ranged_list.is_dirty(start, start + 10) == \
+            dirty[start:start + 10].any()
+    ranged_list.mark_clean(0, 500)
+    assert not ranged_list.is_dirty(0, 500)
+    assert ranged_list.is_dirty(500) == dirty[500:].any()
+
+
+def test_range_dictionary_dirty_ranges():
+    MockSimulator.setup()
+    range_dict = SpynnakerRangeDictionary(100)
+    range_dict["a"] = 1.0
+    range_dict["b"] = 2.0
+    assert not range_dict.is_dirty()
+
+    range_dict["b"].set_value_by_selector(slice(50, 60), 3.0)
+    assert not range_dict.is_dirty(0, 50)
+    assert range_dict.is_dirty(50, 100)
+    range_dict.set_value("a", 4.0)
+    assert range_dict.is_dirty(0, 50)
+    range_dict.mark_clean()
+    assert not range_dict.is_dirty()
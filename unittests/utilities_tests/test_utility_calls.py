@@ -0,0 +1,133 @@
+import numpy
+import pytest
+from data_specification.enums import DataType
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_to_array, convert_from_array, read_columns_from_file,
+    read_in_data_from_file, read_spikes_from_file, write_columns_to_file)
+
+_FIXED_POINT_TYPES = [
+    DataType.S1615, DataType.S3231, DataType.U88, DataType.U1616,
+    DataType.U3232, DataType.U08, DataType.U016, DataType.U032,
+    DataType.S87, DataType.S015, DataType.S031]
+
+
+@pytest.mark.parametrize("data_type", _FIXED_POINT_TYPES)
+def test_convert_to_array_matches_decimal(data_type):
+    rng = numpy.random.RandomState(3)
+    low = float(data_type.min)
+    high = float(data_type.max)
+    values = numpy.concatenate((
+        rng.uniform(low, high, 5000),
+        numpy.round(rng.uniform(low, high, 1000), 3),
+
+        # Values exactly half way between representable values
+        (numpy.arange(-100, 100) + 0.5) / float(data_type.scale),
+        [low, high, 0.0, 0.1, -0.1, 1.0 / 3.0]))
+    # Only compare values that the Decimal path can represent; it wraps
+    # around where the maximum of the type rounds up beyond the range
+    info = numpy.iinfo(data_type.struct_encoding)
+    scaled = numpy.round(values * float(data_type.scale))
+    values = values[(scaled >= info.min) & (scaled < float(info.max))]
+    expected = numpy.array(
+        [convert_to(value, data_type) for value in values])
+    result = convert_to_array(values, data_type)
+    assert result.dtype == numpy.dtype(data_type.struct_encoding)
+    assert numpy.array_equal(result, expected)
+
+    # Single values give the same as the Decimal path too
+    for value in values[:10]:
+        assert convert_to_array(value, data_type) == \
+            convert_to(value, data_type)
+
+    assert numpy.array_equal(
+        convert_from_array(result, data_type),
+        result / float(data_type.scale))
+
+
+def test_convert_to_array_saturates():
+    assert numpy.array_equal(
+        convert_to_array([-1e6, 1e6], DataType.S1615),
+        [-0x80000000, 0x7FFFFFFF])
+    assert numpy.array_equal(
+        convert_to_array([-1, 2], DataType.U032), [0, 0xFFFFFFFF])
+    assert numpy.array_equal(
+        convert_to_array([-1e30, 1e30], DataType.S3231),
+        [-0x8000000000000000, 0x7FFFFFFFFFFFFC00])
+
+    # The maximum of the type rounds up beyond the range
+    assert convert_to_array(
+        float(DataType.S031.max), DataType.S031) == 0x7FFFFFFF
+
+
+@pytest.mark.parametrize("data_type", [DataType.FLOAT_32, DataType.FLOAT_64])
+def test_convert_to_array_float(data_type):
+    values = [-1e30, -2.75, 0.0, 0.1, 1e30]
+    result = convert_to_array(values, data_type)
+    assert result.dtype == numpy.dtype(data_type.struct_encoding)
+    assert numpy.array_equal(
+        result, numpy.array(values).astype(data_type.struct_encoding))
+    assert numpy.array_equal(convert_from_array(result, data_type), result)
+
+
+def _write_lines(tmpdir, lines):
+    path = tmpdir.join("values.txt")
+    path.write("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_read_spikes_from_file(tmpdir):
+    path = _write_lines(tmpdir, [
+        "# time\tneuron", "5.0\t2", "1.0\t2", "3\t0", "", "7.5\t1", "2\t9"])
+    assert numpy.array_equal(
+        read_spikes_from_file(path),
+        [[0, 3], [1, 7.5], [2, 1], [2, 5], [9, 2]])
+    assert numpy.array_equal(
+        read_spikes_from_file(path, 1, 5, 2, 6), [[2, 5]])
+
+
+def test_read_spikes_from_file_with_expressions(tmpdir):
+    # Chunks that are not all plain numbers are evaluated line by line
+    path = _write_lines(tmpdir, ["5.0,2", "2*2,1", "1e1,0"])
+    assert numpy.array_equal(
+        read_spikes_from_file(path, split_value=","),
+        [[0, 10], [1, 4], [2, 5]])
+    assert numpy.array_equal(
+        read_columns_from_file(path, 2, ",", chunk_lines=1),
+        [[5, 2], [4, 1], [10, 0]])
+
+
+def test_read_spikes_from_npy_file(tmpdir):
+    rng = numpy.random.RandomState(5)
+    values = numpy.column_stack((
+        numpy.round(rng.uniform(0, 1000, 10000), 1),
+        rng.randint(0, 100, 10000)))
+    text_path = _write_lines(
+        tmpdir, ["{}\t{}".format(t, n) for t, n in values])
+    npy_path = str(tmpdir.join("values.npy"))
+    write_columns_to_file(npy_path, read_columns_from_file(text_path, 2))
+    from_text = read_spikes_from_file(text_path, 10, 20, 100, 500)
+    from_npy = read_spikes_from_file(npy_path, 10, 20, 100, 500)
+    assert numpy.array_equal(from_text, from_npy)
+    keep = ((values[:, 1] >= 10) & (values[:, 1] < 20) &
+            (values[:, 0] >= 100) & (values[:, 0] < 500))
+    assert len(from_text) == numpy.count_nonzero(keep)
+
+
+def test_read_in_data_from_file(tmpdir):
+    path = _write_lines(tmpdir, [
+        "1\t1\t0.5\tx", "0\t1\t-1.5\tx", "2\t0\t3\tx", "0\t7\t1\tx"])
+    assert numpy.array_equal(
+        read_in_data_from_file(path, 0, 5, 0, 10, True),
+        [[0, 2, 3], [1, 0, -1.5], [1, 1, 0.5]])
+
+
+def test_read_in_data_from_file_checks_extra(tmpdir):
+    path = _write_lines(tmpdir, ["1\t1\t0.5\t2", "0\t1\t-1.5\t3"])
+    assert numpy.array_equal(
+        read_in_data_from_file(path, 0, 5, 0, 10, True),
+        [[1, 0, -1.5], [1, 1, 0.5]])
+    with pytest.raises(ValueError):
+        read_in_data_from_file(path, 0, 5, 0, 10)
+    path = _write_lines(tmpdir, ["1\t1\t0.5", "0\t1\t-1.5"])
+    with pytest.raises(ValueError):
+        read_in_data_from_file(path, 0, 5, 0, 10, True)